@@ -0,0 +1,89 @@
+"""
+Benchmarks for the estimation, inference and tuning steps of all models (``time_*``: run time, ``peakmem_*``: peak
+memory of the process).
+"""
+from .common import MODELS, SIZES, NO_SENSITIVITY, NO_P_ADJUST, NO_TUNING, make_data, make_model, make_param_grids
+
+
+class _ModelBenchmark:
+    params = [MODELS, list(SIZES)]
+    param_names = ['model', 'size']
+    timeout = 600
+
+    # models without the benchmarked method are skipped
+    _skip = []
+    _fit = True
+    _bootstrap = False
+
+    def setup(self, model, size):
+        if model in self._skip:
+            raise NotImplementedError
+        size = SIZES[size]
+        self.dml_data = make_data(model, size['n_obs'])
+        self.dml_obj = make_model(model, self.dml_data, size['n_folds'], size['n_rep'])
+        if self._fit:
+            self.dml_obj.fit()
+        if self._bootstrap:
+            self.dml_obj.bootstrap(n_rep_boot=500, random_state=42)
+
+
+class Fit(_ModelBenchmark):
+    _fit = False
+
+    def time_fit(self, model, size):
+        self.dml_obj.fit()
+
+    def peakmem_fit(self, model, size):
+        self.dml_obj.fit()
+
+
+class Bootstrap(_ModelBenchmark):
+
+    def time_bootstrap(self, model, size):
+        self.dml_obj.bootstrap(n_rep_boot=500, random_state=42)
+
+    def peakmem_bootstrap(self, model, size):
+        self.dml_obj.bootstrap(n_rep_boot=500, random_state=42)
+
+
+class Confint(_ModelBenchmark):
+    _bootstrap = True
+
+    def time_confint_joint(self, model, size):
+        self.dml_obj.confint(joint=True)
+
+
+class SensitivityAnalysis(_ModelBenchmark):
+    _skip = NO_SENSITIVITY
+
+    def time_sensitivity_analysis(self, model, size):
+        self.dml_obj.sensitivity_analysis(cf_y=0.03, cf_d=0.03, rho=1.0)
+
+    def peakmem_sensitivity_analysis(self, model, size):
+        self.dml_obj.sensitivity_analysis(cf_y=0.03, cf_d=0.03, rho=1.0)
+
+
+class PAdjust(_ModelBenchmark):
+    _skip = NO_P_ADJUST
+    _bootstrap = True
+
+    def time_p_adjust_romano_wolf(self, model, size):
+        self.dml_obj.p_adjust(method='romano-wolf')
+
+    def time_p_adjust_bonferroni(self, model, size):
+        self.dml_obj.p_adjust(method='bonferroni')
+
+
+class Tune(_ModelBenchmark):
+    _skip = NO_TUNING
+    _fit = False
+
+    def setup(self, model, size):
+        super().setup(model, size)
+        self.param_grids = make_param_grids(self.dml_obj)
+
+    def time_tune(self, model, size):
+        self.dml_obj.tune(self.param_grids, n_folds_tune=2)
+
+    def peakmem_tune(self, model, size):
+        self.dml_obj.tune(self.param_grids, n_folds_tune=2)
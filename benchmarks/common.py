@@ -0,0 +1,109 @@
+import numpy as np
+
+from sklearn.base import is_classifier
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_CHS2015, make_irm_data, make_iivm_data, \
+    make_did_SZ2020, make_ssm_data, make_irm_data_discrete_treatments
+
+MODELS = ['PLR', 'PLIV', 'IRM', 'APO', 'APOS', 'IIVM', 'DID', 'DIDCS', 'PQ', 'QTE', 'LPQ', 'CVAR', 'SSM']
+
+# sizes of the benchmarked problems: number of observations, folds and repetitions
+SIZES = {'small': {'n_obs': 500, 'n_folds': 2, 'n_rep': 1},
+         'medium': {'n_obs': 2000, 'n_folds': 5, 'n_rep': 1},
+         'large': {'n_obs': 10000, 'n_folds': 5, 'n_rep': 1},
+         'many_reps': {'n_obs': 2000, 'n_folds': 5, 'n_rep': 10}}
+
+DIM_X = 10
+SEED = 3141
+
+# models without sensitivity analysis, multiple testing adjustment or tuning
+NO_SENSITIVITY = ['PLIV', 'IIVM', 'PQ', 'QTE', 'LPQ', 'CVAR', 'SSM']
+NO_P_ADJUST = ['APOS']
+NO_TUNING = ['APOS', 'QTE']
+
+
+def _reg():
+    # cheap and deterministic learners, such that the timings are dominated by the DoubleML code
+    return LinearRegression()
+
+
+def _clf():
+    return LogisticRegression(solver='lbfgs', max_iter=250)
+
+
+def make_data(model, n_obs):
+    """
+    Generates the data for a model with the generators from ``doubleml.datasets`` (seeded).
+    """
+    np.random.seed(SEED)
+    if model == 'PLR':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=n_obs, dim_x=DIM_X)
+    elif model == 'PLIV':
+        obj_dml_data = make_pliv_CHS2015(n_obs=n_obs, dim_x=DIM_X, dim_z=1)
+    elif model in ['IRM', 'PQ', 'QTE', 'CVAR']:
+        obj_dml_data = make_irm_data(n_obs=n_obs, dim_x=DIM_X)
+    elif model in ['IIVM', 'LPQ']:
+        obj_dml_data = make_iivm_data(n_obs=n_obs, dim_x=DIM_X)
+    elif model in ['APO', 'APOS']:
+        data = make_irm_data_discrete_treatments(n_obs=n_obs, n_levels=3, random_state=SEED)
+        obj_dml_data = dml.DoubleMLData.from_arrays(data['x'], data['y'], data['d'])
+    elif model == 'DID':
+        obj_dml_data = make_did_SZ2020(n_obs=n_obs)
+    elif model == 'DIDCS':
+        obj_dml_data = make_did_SZ2020(n_obs=n_obs, cross_sectional_data=True)
+    else:
+        assert model == 'SSM'
+        obj_dml_data = make_ssm_data(n_obs=n_obs, dim_x=DIM_X, mar=True)
+    return obj_dml_data
+
+
+def make_model(model, obj_dml_data, n_folds, n_rep):
+    """
+    Initializes a model with cheap learners and a seeded sample splitting.
+    """
+    np.random.seed(SEED)
+    kwargs = {'n_folds': n_folds, 'n_rep': n_rep}
+    if model == 'PLR':
+        dml_obj = dml.DoubleMLPLR(obj_dml_data, _reg(), _reg(), **kwargs)
+    elif model == 'PLIV':
+        dml_obj = dml.DoubleMLPLIV(obj_dml_data, _reg(), _reg(), _reg(), **kwargs)
+    elif model == 'IRM':
+        # trimming keeps the riesz representer (and nu2 in the sensitivity analysis) stable for the small sizes
+        dml_obj = dml.DoubleMLIRM(obj_dml_data, _reg(), _clf(), trimming_threshold=0.05, **kwargs)
+    elif model == 'APO':
+        dml_obj = dml.DoubleMLAPO(obj_dml_data, _reg(), _clf(), treatment_level=1, **kwargs)
+    elif model == 'APOS':
+        dml_obj = dml.DoubleMLAPOS(obj_dml_data, _reg(), _clf(), treatment_levels=[0, 1, 2], **kwargs)
+    elif model == 'IIVM':
+        dml_obj = dml.DoubleMLIIVM(obj_dml_data, _reg(), _clf(), _clf(), **kwargs)
+    elif model == 'DID':
+        dml_obj = dml.DoubleMLDID(obj_dml_data, _reg(), _clf(), **kwargs)
+    elif model == 'DIDCS':
+        dml_obj = dml.DoubleMLDIDCS(obj_dml_data, _reg(), _clf(), **kwargs)
+    elif model == 'PQ':
+        dml_obj = dml.DoubleMLPQ(obj_dml_data, _clf(), _clf(), quantile=0.5, **kwargs)
+    elif model == 'QTE':
+        dml_obj = dml.DoubleMLQTE(obj_dml_data, _clf(), _clf(), quantiles=[0.25, 0.5, 0.75], **kwargs)
+    elif model == 'LPQ':
+        dml_obj = dml.DoubleMLLPQ(obj_dml_data, _clf(), _clf(), quantile=0.5, **kwargs)
+    elif model == 'CVAR':
+        dml_obj = dml.DoubleMLCVAR(obj_dml_data, _reg(), _clf(), quantile=0.5, **kwargs)
+    else:
+        assert model == 'SSM'
+        dml_obj = dml.DoubleMLSSM(obj_dml_data, _reg(), _clf(), _clf(), **kwargs)
+    return dml_obj
+
+
+def make_param_grids(dml_obj):
+    """
+    Small parameter grids for every nuisance learner of a model (two candidates each).
+    """
+    param_grids = dict()
+    for learner_name, learner in dml_obj.learner.items():
+        if is_classifier(learner):
+            param_grids[learner_name] = {'C': [0.1, 1.]}
+        else:
+            param_grids[learner_name] = {'fit_intercept': [True, False]}
+    return param_grids
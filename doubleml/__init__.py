@@ -1,24 +1,38 @@
 import importlib.metadata
 
-from .double_ml_framework import concat
-from .double_ml_framework import DoubleMLFramework
-from .plm.plr import DoubleMLPLR
-from .plm.pliv import DoubleMLPLIV
-from .irm.irm import DoubleMLIRM
-from .irm.apo import DoubleMLAPO
-from .irm.apos import DoubleMLAPOS
-from .irm.iivm import DoubleMLIIVM
-from .double_ml_data import DoubleMLData, DoubleMLClusterData
-from .did.did import DoubleMLDID
-from .did.did_cs import DoubleMLDIDCS
-from .irm.qte import DoubleMLQTE
-from .irm.pq import DoubleMLPQ
-from .irm.lpq import DoubleMLLPQ
-from .irm.cvar import DoubleMLCVAR
-from .irm.ssm import DoubleMLSSM
+from .utils._lazy import _lazy_attributes
 
-from .utils.blp import DoubleMLBLP
-from .utils.policytree import DoubleMLPolicyTree
+# the models and utilities are only imported on first access, such that `import doubleml` does not import the
+# dependencies of all models (statsmodels, plotly, rdrobust, ...)
+_lazy_imports = {
+    'concat': '.double_ml_framework',
+    'DoubleMLFramework': '.double_ml_framework',
+    'DoubleMLPLR': '.plm.plr',
+    'DoubleMLPLIV': '.plm.pliv',
+    'DoubleMLIRM': '.irm.irm',
+    'DoubleMLAPO': '.irm.apo',
+    'DoubleMLAPOS': '.irm.apos',
+    'DoubleMLIIVM': '.irm.iivm',
+    'DoubleMLData': '.double_ml_data',
+    'DoubleMLClusterData': '.double_ml_data',
+    'DoubleMLDID': '.did.did',
+    'DoubleMLDIDCS': '.did.did_cs',
+    'DoubleMLQTE': '.irm.qte',
+    'DoubleMLPQ': '.irm.pq',
+    'DoubleMLLPQ': '.irm.lpq',
+    'DoubleMLCVAR': '.irm.cvar',
+    'DoubleMLSSM': '.irm.ssm',
+    'DoubleMLBLP': '.utils.blp',
+    'DoubleMLPolicyTree': '.utils.policytree',
+    'datasets': '.datasets',
+    'did': '.did',
+    'irm': '.irm',
+    'plm': '.plm',
+    'rdd': '.rdd',
+    'utils': '.utils',
+}
+
+__getattr__, __dir__ = _lazy_attributes(globals(), _lazy_imports)
 
 __all__ = [
     'concat',
@@ -2,8 +2,12 @@
 The :mod:`doubleml.did` module implements double machine learning estimates based on difference in differences models.
 """
 
-from .did import DoubleMLDID
-from .did_cs import DoubleMLDIDCS
+from ..utils._lazy import _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(globals(), {
+    'DoubleMLDID': '.did',
+    'DoubleMLDIDCS': '.did_cs',
+})
 
 __all__ = [
     "DoubleMLDID",
@@ -7,7 +7,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm
+from ..utils._estimation import _dml_cv_predict_many, _get_cond_smpls, _dml_tune, _trimm
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity
 
 
@@ -198,15 +198,26 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
         # get train indices for d == 0
         smpls_d0, smpls_d1 = _get_cond_smpls(smpls, d)
 
+        # fit all folds of all nuisance models which are not provided externally in one parallel pool
+        nuisance_jobs = {}
+        if external_predictions['ml_g0'] is None:
+            nuisance_jobs['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0,
+                                      'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g']}
+        if external_predictions['ml_g1'] is None:
+            nuisance_jobs['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1,
+                                      'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g']}
+        if (self.score == 'observational') and (external_predictions['ml_m'] is None):
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance g for d==0
         if external_predictions['ml_g0'] is not None:
             g_hat0 = {'preds': external_predictions['ml_g0'],
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = nuisance_res['ml_g0']
 
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -219,9 +230,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = nuisance_res['ml_g1']
 
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
@@ -237,9 +246,7 @@ class DoubleMLDID(LinearScoreMixin, DoubleML):
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -7,7 +7,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _trimm, _get_cond_smpls_2d, _dml_tune
+from ..utils._estimation import _dml_cv_predict_many, _trimm, _get_cond_smpls_2d, _dml_tune
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity
 
 
@@ -224,14 +224,26 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
         # nuisance g
         smpls_d0_t0, smpls_d0_t1, smpls_d1_t0, smpls_d1_t1 = _get_cond_smpls_2d(smpls, d, t)
+
+        # fit all folds of all nuisance models which are not provided externally in one parallel pool
+        cond_smpls = {'ml_g_d0_t0': smpls_d0_t0, 'ml_g_d0_t1': smpls_d0_t1,
+                      'ml_g_d1_t0': smpls_d1_t0, 'ml_g_d1_t1': smpls_d1_t1}
+        nuisance_jobs = {}
+        for learner, learner_smpls in cond_smpls.items():
+            if external_predictions[learner] is None:
+                nuisance_jobs[learner] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': learner_smpls,
+                                          'est_params': self._get_params(learner), 'method': self._predict_method['ml_g']}
+        if (self.score == 'observational') and (external_predictions['ml_m'] is None):
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         if external_predictions['ml_g_d0_t0'] is not None:
             g_hat_d0_t0 = {'preds': external_predictions['ml_g_d0_t0'],
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d0_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t0, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d0_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d0_t0 = nuisance_res['ml_g_d0_t0']
 
             g_hat_d0_t0['targets'] = g_hat_d0_t0['targets'].astype(float)
             g_hat_d0_t0['targets'][np.invert((d == 0) & (t == 0))] = np.nan
@@ -240,9 +252,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d0_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d0_t1, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d0_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d0_t1 = nuisance_res['ml_g_d0_t1']
             g_hat_d0_t1['targets'] = g_hat_d0_t1['targets'].astype(float)
             g_hat_d0_t1['targets'][np.invert((d == 0) & (t == 1))] = np.nan
         if external_predictions['ml_g_d1_t0'] is not None:
@@ -250,9 +260,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d1_t0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t0, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d1_t0'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d1_t0 = nuisance_res['ml_g_d1_t0']
             g_hat_d1_t0['targets'] = g_hat_d1_t0['targets'].astype(float)
             g_hat_d1_t0['targets'][np.invert((d == 1) & (t == 0))] = np.nan
         if external_predictions['ml_g_d1_t1'] is not None:
@@ -260,9 +268,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                            'targets': None,
                            'models': None}
         else:
-            g_hat_d1_t1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls_d1_t1, n_jobs=n_jobs_cv,
-                                          est_params=self._get_params('ml_g_d1_t1'), method=self._predict_method['ml_g'],
-                                          return_models=return_models)
+            g_hat_d1_t1 = nuisance_res['ml_g_d1_t1']
             g_hat_d1_t1['targets'] = g_hat_d1_t1['targets'].astype(float)
             g_hat_d1_t1['targets'][np.invert((d == 1) & (t == 1))] = np.nan
 
@@ -275,9 +281,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = nuisance_res['ml_m']
                 _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
                 _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
             m_hat['preds'] = _trimm(m_hat['preds'], self.trimming_rule, self.trimming_threshold)
@@ -496,6 +500,7 @@ class DoubleMLDIDCS(LinearScoreMixin, DoubleML):
 
         # nuisance training sets conditional on d and t
         smpls_d0_t0, smpls_d0_t1, smpls_d1_t0, smpls_d1_t1 = _get_cond_smpls_2d(smpls, d, t)
+
         train_inds = [train_index for (train_index, _) in smpls]
         train_inds_d0_t0 = [train_index for (train_index, _) in smpls_d0_t0]
         train_inds_d0_t1 = [train_index for (train_index, _) in smpls_d0_t1]
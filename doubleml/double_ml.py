@@ -2,8 +2,13 @@ import numpy as np
 import pandas as pd
 import warnings
 import copy
+import os
+import pickle
 
-from sklearn.base import is_regressor, is_classifier
+from functools import partial
+
+from sklearn.base import is_regressor, is_classifier, clone
+from joblib import Parallel, delayed, hash as joblib_hash
 
 from scipy.stats import norm
 
@@ -14,8 +19,13 @@ from .double_ml_framework import DoubleMLFramework
 
 from .utils.resampling import DoubleMLResampling, DoubleMLClusterResampling
 from .utils._estimation import _rmse, _aggregate_coefs_and_ses, _var_est, _set_external_predictions
-from .utils._checks import _check_external_predictions, _check_sample_splitting
+from .utils._checks import _check_external_predictions, _check_sample_splitting, _check_benchmarking_sets, \
+    _check_random_state
 from .utils.gain_statistics import gain_statistics
+from .utils._tuning import _TuningScheduler
+from .utils._cache import _prediction_cache
+from .utils._checkpoint import _save_checkpoint_cell, _load_checkpoint_cell
+from .utils._profiling import _Profiler, _profiling, _profile_step
 
 _implemented_data_backends = ['DoubleMLData', 'DoubleMLClusterData']
 
@@ -24,6 +34,24 @@ class DoubleML(ABC):
     """Double Machine Learning.
     """
 
+    # nuisance models which do not depend on the outcome variable; for several outcome variables they are only fitted
+    # once per repetition and shared across the outcome variables (None if several outcome variables are not supported)
+    _outcome_shared_learners = None
+
+    # instance attributes which are (re)set in _nuisance_est and used for the estimation of the same cell; they are
+    # returned from cells which are evaluated in a separate process (n_jobs_rep)
+    _nuisance_est_state = []
+
+    # instance attributes which are set or filled in the fit; all other attributes (apart from the data, learners and
+    # parameters, which are hashed separately) are model settings and enter the checkpoint fingerprint
+    _fit_state = ['_i_rep', '_i_treat', '_i_coef', '_is_classifier', '_psi', '_psi_deriv', '_psi_elements', '_coef',
+                  '_se', '_all_coef', '_all_se', '_var_scaling_factors', '_predictions', '_nuisance_targets',
+                  '_nuisance_loss', '_models', '_framework', '_profiler', '_sensitivity_elements', '_sensitivity_params']
+
+    # instance attributes of the fit state which are set before the fit (e.g. by a wrapping model) and kept in the copies
+    # of the model for the cells (n_jobs_rep)
+    _fit_input = []
+
     def __init__(self,
                  obj_dml_data,
                  n_folds,
@@ -39,6 +67,13 @@ class DoubleML(ABC):
             if obj_dml_data.n_cluster_vars > 2:
                 raise NotImplementedError('Multi-way (n_ways > 2) clustering not yet implemented.')
             self._is_cluster_data = True
+        if obj_dml_data.n_outcomes > 1:
+            if self._outcome_shared_learners is None:
+                raise NotImplementedError('Multiple outcome variables are not implemented for '
+                                          f'{self.__class__.__name__}.')
+            if obj_dml_data.n_treat > 1:
+                raise NotImplementedError('Multiple outcome variables are only implemented for a single treatment '
+                                          'variable.')
         self._dml_data = obj_dml_data
 
         # initialize framework which is constructed after the fit method is called
@@ -65,6 +100,9 @@ class DoubleML(ABC):
         # initialize external predictions
         self._external_predictions_implemented = False
 
+        # initialize profiler which is only set if method fit is called with profile=True
+        self._profiler = None
+
         # check resampling specifications
         if not isinstance(n_folds, int):
             raise TypeError('The number of folds must be of int type. '
@@ -108,6 +146,7 @@ class DoubleML(ABC):
         # initialize instance attributes which are later used for iterating
         self._i_rep = None
         self._i_treat = None
+        self._i_coef = None
 
     def __str__(self):
         class_name = self.__class__.__name__
@@ -249,7 +288,8 @@ class DoubleML(ABC):
     @property
     def models(self):
         """
-        The fitted nuisance models.
+        The fitted nuisance models in form of a nested dictionary. The keys refer to the nuisance elements and the
+        treatment variables (the outcome variables in the multiple-outcome case).
         """
         return self._models
 
@@ -337,6 +377,20 @@ class DoubleML(ABC):
         """
         return self._sensitivity_elements
 
+    @property
+    def fit_profile(self):
+        """
+        Wall time, cpu time and peak resident set size (in MB) of the steps of :meth:`fit` (and of subsequent calls of
+        :meth:`bootstrap` and :meth:`sensitivity_analysis`), if :meth:`fit` was called with ``profile=True``. A
+        :class:`pandas.DataFrame` with one row per step keyed by ``step``, ``learner``, ``rep``, ``treatment`` and
+        ``fold``.
+        """
+        if self._profiler is None:
+            fit_profile = None
+        else:
+            fit_profile = self._profiler.to_frame()
+        return fit_profile
+
     @property
     def sensitivity_params(self):
         """
@@ -427,13 +481,25 @@ class DoubleML(ABC):
                  self.t_stat, self.pval]))
             df_summary = pd.DataFrame(summary_stats,
                                       columns=col_names,
-                                      index=self._dml_data.d_cols)
+                                      index=self._coef_names)
             ci = self.confint()
             df_summary = df_summary.join(ci)
         return df_summary
 
-    # The private properties with __ always deliver the single treatment, single (cross-fitting) sample subselection.
-    # The slicing is based on the two properties self._i_treat, the index of the treatment variable, and
+    @property
+    def _coef_names(self):
+        # the coefficients refer to the outcome variables in the multiple-outcome case (with a single treatment variable)
+        if self._dml_data.n_outcomes > 1:
+            return self._dml_data.y_cols
+        return self._dml_data.d_cols
+
+    def _cell_coefs(self, i_treat):
+        # indices of the coefficients estimated for the treatment variable i_treat (one per outcome variable)
+        n_outcomes = self._dml_data.n_outcomes
+        return range(i_treat * n_outcomes, (i_treat + 1) * n_outcomes)
+
+    # The private properties with __ always deliver the single coefficient, single (cross-fitting) sample subselection.
+    # The slicing is based on the two properties self._i_coef, the index of the coefficient, and
     # self._i_rep, the index of the cross-fitting sample.
 
     @property
@@ -446,17 +512,18 @@ class DoubleML(ABC):
 
     @property
     def __psi(self):
-        return self._psi[:, self._i_rep, self._i_treat]
+        return self._psi[:, self._i_rep, self._i_coef]
 
     @property
     def __psi_deriv(self):
-        return self._psi_deriv[:, self._i_rep, self._i_treat]
+        return self._psi_deriv[:, self._i_rep, self._i_coef]
 
     @property
     def __all_se(self):
-        return self._all_se[self._i_treat, self._i_rep]
+        return self._all_se[self._i_coef, self._i_rep]
 
-    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False):
+    def fit(self, n_jobs_cv=None, store_predictions=True, external_predictions=None, store_models=False, n_jobs_rep=None,
+            cache_dir=None, checkpoint_path=None, profile=False, profile_callbacks=None):
         """
         Estimate DoubleML models.
 
@@ -482,42 +549,162 @@ class DoubleML(ABC):
             corresponding learners.
             Default is `None`.
 
+        n_jobs_rep : None or int
+            The number of CPUs to use to fit the nuisance models for the different repetitions and treatment variables
+            in parallel. If not ``None``, the nuisance estimation for each combination of repetition and treatment
+            variable is dispatched as a separate job and the results are combined afterwards in the original order.
+            The parallelism is per combination, i.e. every job fits all folds of its learners in a nested pool with
+            ``n_jobs_cv`` workers; the folds of different combinations are not scheduled in one flat pool. A job only
+            receives a lean copy of the model with the data arrays and the sample splitting of its combination, such that
+            state which a sequential fit carries over from one repetition to the next (the start value of the Brent search
+            of :class:`DoubleMLPQ` and :class:`DoubleMLLPQ`, see ``ipw_solver``) is not shared between the jobs.
+            ``None`` means that repetitions and treatment variables are fitted sequentially.
+            Default is ``None``.
+
+        cache_dir : None, str or path-like
+            Directory of a persistent cache for the out-of-fold predictions of the nuisance models. If not ``None``,
+            the predictions are stored as ``.npy`` files, keyed by a hash of the learner and its parameters, the
+            covariates, the target and the sample splitting. A later fit with identical inputs (e.g. with a different
+            score, trimming or sensitivity setting) loads the predictions instead of refitting the learners. The learners
+            should be deterministic (e.g. set a ``random_state``). Predictions are not cached if ``store_models=True``.
+            Default is ``None``.
+
+        checkpoint_path : None, str or path-like
+            Directory for checkpoints of the fit. If not ``None``, the score elements, predictions, models (if
+            ``store_models=True``), sensitivity elements and the estimates are saved after every combination of
+            repetition and treatment variable. A restarted fit of the same model (same data, learners, model settings,
+            sample splitting and fit settings) with the same ``checkpoint_path`` resumes at the first missing combination
+            and yields the same estimates; a checkpoint of a different model raises an error. Callable settings (e.g.
+            ``score`` or ``kde``) have to be defined at the top level of a module. With ``n_jobs_rep``, every combination
+            is saved as soon as its parallel nuisance estimation is finished.
+            Default is ``None``.
+
+        profile : bool
+            Indicates whether the wall time, cpu time and peak resident set size of the fold-wise fits and predictions
+            of the learners, the score solves, the standard errors and the sensitivity elements should be recorded in
+            ``fit_profile``. The fits of the learners are measured in the processes fitting them. The peak resident set
+            size is the high-water mark of the process measuring the step at the end of the step (via
+            :func:`resource.getrusage` or, on Windows, ``psutil`` if it is installed), which also covers the memory of
+            compiled learners. It is not reset between the steps, i.e. a step which raises the peak of its process is
+            indicated by a larger value than the previous steps of the same process. The nested cross-fitting of the
+            preliminary propensity scores (:class:`DoubleMLPQ`, :class:`DoubleMLLPQ` and :class:`DoubleMLCVAR`) is
+            recorded with the learners ``'ml_m_prelim'`` and ``'ml_m_z_prelim'`` and the fold of the outer sample
+            splitting, i.e. with one row per inner fold.
+            Default is ``False``.
+
+        profile_callbacks : None or list
+            A list of callables which are called with every record (a dict with keys ``step``, ``learner``, ``rep``,
+            ``treatment``, ``fold``, ``wall_time``, ``cpu_time`` and ``peak_rss_mb``), e.g. to forward the records to
+            a monitoring system. Only used if ``profile=True``.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
 
-        self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models)
+        self._check_fit(n_jobs_cv, store_predictions, external_predictions, store_models, n_jobs_rep, cache_dir,
+                        checkpoint_path, profile, profile_callbacks)
         self._initalize_fit(store_predictions, store_models)
+        self._profiler = _Profiler(profile_callbacks) if profile else None
 
-        for i_rep in range(self.n_rep):
-            self._i_rep = i_rep
-            for i_d in range(self._dml_data.n_treat):
+        if checkpoint_path is None:
+            checkpoint = None
+        else:
+            checkpoint = (os.fspath(checkpoint_path),
+                          self._checkpoint_fingerprint(store_predictions, external_predictions, store_models))
+
+        with _prediction_cache(cache_dir), _profiling(self._profiler):
+            self._fit_cells(n_jobs_cv, store_predictions, external_predictions, store_models, n_jobs_rep, cache_dir,
+                            checkpoint)
+
+        if self._profiler is not None:
+            self._profiler.set_cell(None, None)
+        with _profile_step(self._profiler, 'aggregate'):
+            # aggregated parameter estimates and standard errors from repeated cross-fitting
+            self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factors)
+
+            # construct framework for inference
+            self._framework = self.construct_framework()
+
+        return self
+
+    def _fit_cells(self, n_jobs_cv, store_predictions, external_predictions, store_models, n_jobs_rep, cache_dir,
+                   checkpoint=None):
+        fit_cells = [(i_rep, i_d) for i_rep in range(self.n_rep) for i_d in range(self._dml_data.n_treat)]
+
+        # restore the combinations of repetition and treatment variable which are already saved in the checkpoint
+        if checkpoint is not None:
+            missing_cells = list()
+            for (i_rep, i_d) in fit_cells:
+                cell_state = _load_checkpoint_cell(checkpoint[0], i_rep, i_d, checkpoint[1])
+                if cell_state is None:
+                    missing_cells.append((i_rep, i_d))
+                else:
+                    self._i_rep = i_rep
+                    self._i_treat = i_d
+                    self._set_checkpoint_cell(cell_state, store_predictions, store_models)
+            fit_cells = missing_cells
+
+        if n_jobs_rep is None:
+            for (i_rep, i_d) in fit_cells:
+                self._i_rep = i_rep
                 self._i_treat = i_d
+                if self._profiler is not None:
+                    self._profiler.set_cell(i_rep, self._dml_data.d_cols[i_d])
 
                 # this step could be skipped for the single treatment variable case
                 if self._dml_data.n_treat > 1:
                     self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
 
-                # predictions have to be stored in loop for sensitivity analysis
-                nuisance_predictions = self._fit_nuisance_and_score_elements(
-                    n_jobs_cv,
-                    store_predictions,
-                    external_predictions,
+                cell_results = self._nuisance_est_outcomes(
+                    self.__smpls, n_jobs_cv, self._cell_external_predictions(external_predictions, i_rep, i_d),
                     store_models)
+                self._set_cell_results(cell_results, store_predictions, store_models)
 
-                self._solve_score_and_estimate_se()
+                if checkpoint is not None:
+                    _save_checkpoint_cell(checkpoint[0], i_rep, i_d, checkpoint[1],
+                                          self._get_checkpoint_cell(store_predictions, store_models))
+        else:
+            # parallel estimation of the nuisance models over all repetitions and treatment variables; the cells are
+            # combined (and saved to the checkpoint) as soon as they are finished; every cell is evaluated on a lean copy
+            # of the model, which only holds the data arrays, the sample splitting and the external predictions of the
+            # cell, such that the size of a task neither depends on the data frame nor on the results of finished cells
+            parallel = Parallel(n_jobs=n_jobs_rep, verbose=0, pre_dispatch='2*n_jobs', return_as='generator_unordered')
+            nuisance_results = parallel(
+                delayed(self._cell_clone(i_rep, i_d)._nuisance_est_cell)(
+                    self._smpls[i_rep],
+                    self._cell_external_predictions(external_predictions, i_rep, i_d),
+                    n_jobs_cv,
+                    store_models,
+                    cache_dir,
+                    self._profiler is not None)
+                for (i_rep, i_d) in fit_cells
+            )
 
-                # sensitivity elements can depend on the estimated parameter
-                self._fit_sensitivity_elements(nuisance_predictions)
+            nuisance_states = {}
+            for (i_rep, i_d, cell_results, nuisance_state, profile_records) in nuisance_results:
+                nuisance_states[(i_rep, i_d)] = nuisance_state
+                self._i_rep = i_rep
+                self._i_treat = i_d
+                for key, value in nuisance_state.items():
+                    setattr(self, key, value)
+                if self._profiler is not None:
+                    self._profiler.set_cell(i_rep, self._dml_data.d_cols[i_d])
+                    self._profiler.extend(profile_records)
+                if self._dml_data.n_treat > 1:
+                    self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
 
-        # aggregated parameter estimates and standard errors from repeated cross-fitting
-        self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factors)
+                self._set_cell_results(cell_results, store_predictions, store_models)
 
-        # construct framework for inference
-        self._framework = self.construct_framework()
+                if checkpoint is not None:
+                    _save_checkpoint_cell(checkpoint[0], i_rep, i_d, checkpoint[1],
+                                          self._get_checkpoint_cell(store_predictions, store_models))
 
-        return self
+            # keep the state of the last cell (as in the sequential estimation) independent of the order of completion
+            if len(fit_cells) > 0:
+                for key, value in nuisance_states[fit_cells[-1]].items():
+                    setattr(self, key, value)
 
     def construct_framework(self):
         """
@@ -570,7 +757,7 @@ class DoubleML(ABC):
         doubleml_framework = DoubleMLFramework(doubleml_dict)
         return doubleml_framework
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def bootstrap(self, method='normal', n_rep_boot=500, chunk_size=None, random_state=None, n_jobs_boot=None):
         """
         Multiplier bootstrap for DoubleML models.
 
@@ -583,13 +770,29 @@ class DoubleML(ABC):
         n_rep_boot : int
             The number of bootstrap replications.
 
+        chunk_size : None or int
+            The number of observations for which the multiplier weights are drawn at once (see
+            :meth:`doubleml.DoubleMLFramework.bootstrap`). Bounds the memory of the bootstrap for large samples.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            Seed for the multiplier weights (see :meth:`doubleml.DoubleMLFramework.bootstrap`). If ``None``, the global
+            numpy random state is used.
+            Default is ``None``.
+
+        n_jobs_boot : None or int
+            The number of CPUs used to draw the bootstrap weights in parallel. ``None`` means ``1``.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
         if self._framework is None:
             raise ValueError('Apply fit() before bootstrap().')
-        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot)
+        with _profile_step(self._profiler, 'bootstrap'):
+            self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot, chunk_size=chunk_size,
+                                      random_state=random_state, n_jobs_boot=n_jobs_boot)
 
         return self
 
@@ -617,7 +820,7 @@ class DoubleML(ABC):
             raise ValueError('Apply fit() before confint().')
 
         df_ci = self.framework.confint(joint=joint, level=level)
-        df_ci.set_index(pd.Index(self._dml_data.d_cols), inplace=True)
+        df_ci.set_index(pd.Index(self._coef_names), inplace=True)
 
         return df_ci
 
@@ -643,7 +846,7 @@ class DoubleML(ABC):
             raise ValueError('Apply fit() before p_adjust().')
 
         p_val, _ = self.framework.p_adjust(method=method)
-        p_val.set_index(pd.Index(self._dml_data.d_cols), inplace=True)
+        p_val.set_index(pd.Index(self._coef_names), inplace=True)
 
         return p_val
 
@@ -656,13 +859,16 @@ class DoubleML(ABC):
              n_iter_randomized_search=100,
              n_jobs_cv=None,
              set_as_params=True,
-             return_tune_res=False):
+             return_tune_res=False,
+             n_jobs_tune=None,
+             random_state=None):
         """
         Hyperparameter-tuning for DoubleML models.
 
         The hyperparameter-tuning is performed using either an exhaustive search over specified parameter values
-        implemented in :class:`sklearn.model_selection.GridSearchCV` or via a randomized search implemented in
-        :class:`sklearn.model_selection.RandomizedSearchCV`.
+        implemented in :class:`sklearn.model_selection.GridSearchCV`, via a randomized search implemented in
+        :class:`sklearn.model_selection.RandomizedSearchCV` or via the corresponding successive halving searches
+        :class:`sklearn.model_selection.HalvingGridSearchCV` and :class:`sklearn.model_selection.HalvingRandomSearchCV`.
 
         Parameters
         ----------
@@ -684,12 +890,16 @@ class DoubleML(ABC):
             Default is ``5``.
 
         search_mode : str
-            A str (``'grid_search'`` or ``'randomized_search'``) specifying whether hyperparameters are optimized via
-            :class:`sklearn.model_selection.GridSearchCV` or :class:`sklearn.model_selection.RandomizedSearchCV`.
+            A str (``'grid_search'``, ``'randomized_search'``, ``'halving_grid_search'`` or ``'halving_random_search'``)
+            specifying whether hyperparameters are optimized via :class:`sklearn.model_selection.GridSearchCV`,
+            :class:`sklearn.model_selection.RandomizedSearchCV`, :class:`sklearn.model_selection.HalvingGridSearchCV` or
+            :class:`sklearn.model_selection.HalvingRandomSearchCV`.
             Default is ``'grid_search'``.
 
         n_iter_randomized_search : int
-            If ``search_mode == 'randomized_search'``. The number of parameter settings that are sampled.
+            If ``search_mode == 'randomized_search'`` or ``search_mode == 'halving_random_search'``. The number of
+            parameter settings that are sampled (for the halving search, the number of candidates in the first
+            iteration).
             Default is ``100``.
 
         n_jobs_cv : None or int
@@ -704,6 +914,26 @@ class DoubleML(ABC):
             Indicates whether detailed tuning results should be returned.
             Default is ``False``.
 
+        n_jobs_tune : None or int
+            The number of CPUs used to run the searches. If not ``None``, the searches for all treatment variables,
+            repetitions (if ``tune_on_folds=True``) and folds are scheduled as one pool of jobs, where the inner splits
+            and the sampled parameter settings are seeded from the global numpy random state. The learners of a
+            treatment variable and repetition are tuned one after another and every search is submitted as one job.
+            If fewer searches than ``n_jobs_tune`` run at the same time (e.g. with ``tune_on_folds=False`` and a
+            single treatment variable), the candidates and inner folds of every search are fitted in parallel on the
+            remaining CPUs, unless ``n_jobs_cv`` is set. The learners should set a ``random_state`` to obtain
+            reproducible results. ``None`` means that the searches are run one after another.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            Seed for the inner splits and the sampled parameter settings of the searches. If not ``None``, the searches
+            are seeded via :meth:`numpy.random.SeedSequence.spawn` with one child seed per treatment variable (and
+            repetition if ``tune_on_folds=True``), such that the results do not depend on ``n_jobs_tune`` and the searches
+            do not advance the global numpy random state, i.e. a subsequent :meth:`fit` is the same for serial and
+            parallel tuning (provided that the learners set a ``random_state``). If ``None``, the global numpy random
+            state is used (a single seed is drawn from it if ``n_jobs_tune`` is not ``None``).
+            Default is ``None``.
+
         Returns
         -------
         self : object
@@ -714,6 +944,9 @@ class DoubleML(ABC):
             Returned if ``return_tune_res`` is ``True``.
         """
 
+        if self._dml_data.n_outcomes > 1:
+            raise NotImplementedError('Tuning is not implemented for multiple outcome variables.')
+
         if (not isinstance(param_grids, dict)) | (not all(k in param_grids for k in self.learner_names)):
             raise ValueError('Invalid param_grids ' + str(param_grids) + '. '
                              'param_grids must be a dictionary with keys ' + ' and '.join(self.learner_names) + '.')
@@ -740,9 +973,10 @@ class DoubleML(ABC):
             raise ValueError('The number of folds used for tuning must be at least two. '
                              f'{str(n_folds_tune)} was passed.')
 
-        if (not isinstance(search_mode, str)) | (search_mode not in ['grid_search', 'randomized_search']):
-            raise ValueError('search_mode must be "grid_search" or "randomized_search". '
-                             f'Got {str(search_mode)}.')
+        valid_search_modes = ['grid_search', 'randomized_search', 'halving_grid_search', 'halving_random_search']
+        if (not isinstance(search_mode, str)) | (search_mode not in valid_search_modes):
+            raise ValueError('search_mode must be "grid_search", "randomized_search", "halving_grid_search" or '
+                             f'"halving_random_search". Got {str(search_mode)}.')
 
         if not isinstance(n_iter_randomized_search, int):
             raise TypeError('The number of parameter settings sampled for the randomized search must be of int type. '
@@ -765,29 +999,46 @@ class DoubleML(ABC):
             raise TypeError('return_tune_res must be True or False. '
                             f'Got {str(return_tune_res)}.')
 
+        if n_jobs_tune is not None:
+            if not isinstance(n_jobs_tune, int):
+                raise TypeError('The number of CPUs used to run the searches must be of int type. '
+                                f'{str(n_jobs_tune)} of type {str(type(n_jobs_tune))} was passed.')
+
+        _check_random_state(random_state)
+
         if tune_on_folds:
             tuning_res = [[None] * self.n_rep] * self._dml_data.n_treat
         else:
             tuning_res = [None] * self._dml_data.n_treat
 
-        for i_d in range(self._dml_data.n_treat):
-            self._i_treat = i_d
-            # this step could be skipped for the single treatment variable case
-            if self._dml_data.n_treat > 1:
-                self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+        if tune_on_folds:
+            cells = [(i_d, i_rep) for i_d in range(self._dml_data.n_treat) for i_rep in range(self.n_rep)]
+        else:
+            cells = [(i_d, None) for i_d in range(self._dml_data.n_treat)]
+        tuning_args = (param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)
+
+        if (n_jobs_tune is None) & (random_state is None):
+            cells_res = [self._nuisance_tuning_cell(i_d, i_rep, *tuning_args) for i_d, i_rep in cells]
+        else:
+            # every cell is tuned on its own clone of the model, such that the cells can be run concurrently; all searches
+            # are submitted to one shared pool of workers
+            scheduler = _TuningScheduler(1 if n_jobs_tune is None else n_jobs_tune)
+            if random_state is None:
+                random_state = np.random.randint(np.iinfo(np.int32).max)
+            if isinstance(random_state, np.random.SeedSequence):
+                seed_seq = random_state
+            else:
+                seed_seq = np.random.SeedSequence(random_state)
+            cell_fcts = [partial(self._lean_clone(self._dml_data._copy_with_x_cols(self._dml_data.x_cols)).
+                                 _nuisance_tuning_cell, i_d, i_rep, *tuning_args)
+                         for i_d, i_rep in cells]
+            cells_res = scheduler.run_cells(cell_fcts, seed_seq.spawn(len(cells)))
 
+        for i_d in range(self._dml_data.n_treat):
             if tune_on_folds:
                 nuisance_params = list()
                 for i_rep in range(self.n_rep):
-                    self._i_rep = i_rep
-
-                    # tune hyperparameters
-                    res = self._nuisance_tuning(self.__smpls,
-                                                param_grids, scoring_methods,
-                                                n_folds_tune,
-                                                n_jobs_cv,
-                                                search_mode, n_iter_randomized_search)
-
+                    res = cells_res[i_d * self.n_rep + i_rep]
                     tuning_res[i_rep][i_d] = res
                     nuisance_params.append(res['params'])
 
@@ -797,13 +1048,7 @@ class DoubleML(ABC):
                         self.set_ml_nuisance_params(nuisance_model, self._dml_data.d_cols[i_d], params)
 
             else:
-                smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
-                # tune hyperparameters
-                res = self._nuisance_tuning(smpls,
-                                            param_grids, scoring_methods,
-                                            n_folds_tune,
-                                            n_jobs_cv,
-                                            search_mode, n_iter_randomized_search)
+                res = cells_res[i_d]
                 tuning_res[i_d] = res
 
                 if set_as_params:
@@ -917,12 +1162,18 @@ class DoubleML(ABC):
 
         return learner_is_classifier
 
-    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models):
+    def _check_fit(self, n_jobs_cv, store_predictions, external_predictions, store_models, n_jobs_rep=None,
+                   cache_dir=None, checkpoint_path=None, profile=False, profile_callbacks=None):
         if n_jobs_cv is not None:
             if not isinstance(n_jobs_cv, int):
                 raise TypeError('The number of CPUs used to fit the learners must be of int type. '
                                 f'{str(n_jobs_cv)} of type {str(type(n_jobs_cv))} was passed.')
 
+        if n_jobs_rep is not None:
+            if not isinstance(n_jobs_rep, int):
+                raise TypeError('The number of CPUs used to fit the repetitions must be of int type. '
+                                f'{str(n_jobs_rep)} of type {str(type(n_jobs_rep))} was passed.')
+
         if not isinstance(store_predictions, bool):
             raise TypeError('store_predictions must be True or False. '
                             f'Got {str(store_predictions)}.')
@@ -931,6 +1182,26 @@ class DoubleML(ABC):
             raise TypeError('store_models must be True or False. '
                             f'Got {str(store_models)}.')
 
+        if (cache_dir is not None) and (not isinstance(cache_dir, (str, os.PathLike))):
+            raise TypeError('cache_dir must be None, a str or a path-like object. '
+                            f'{str(cache_dir)} of type {str(type(cache_dir))} was passed.')
+
+        if (checkpoint_path is not None) and (not isinstance(checkpoint_path, (str, os.PathLike))):
+            raise TypeError('checkpoint_path must be None, a str or a path-like object. '
+                            f'{str(checkpoint_path)} of type {str(type(checkpoint_path))} was passed.')
+
+        if not isinstance(profile, bool):
+            raise TypeError('profile must be True or False. '
+                            f'Got {str(profile)}.')
+
+        if profile_callbacks is not None:
+            if (not isinstance(profile_callbacks, list)) or (not all(callable(callback) for callback in profile_callbacks)):
+                raise TypeError('profile_callbacks must be None or a list of callables. '
+                                f'{str(profile_callbacks)} of type {str(type(profile_callbacks))} was passed.')
+
+        if (self._dml_data.n_outcomes > 1) and (external_predictions is not None):
+            raise NotImplementedError('External predictions are not implemented for multiple outcome variables.')
+
         # check if external predictions are implemented
         if self._external_predictions_implemented:
             _check_external_predictions(external_predictions=external_predictions,
@@ -956,18 +1227,88 @@ class DoubleML(ABC):
                                                                                 self.n_rep,
                                                                                 self._dml_data.n_coefs))
 
-    def _fit_nuisance_and_score_elements(self, n_jobs_cv, store_predictions, external_predictions, store_models):
-        ext_prediction_dict = _set_external_predictions(external_predictions,
-                                                        learners=self.params_names,
-                                                        treatment=self._dml_data.d_cols[self._i_treat],
-                                                        i_rep=self._i_rep)
-
-        # ml estimation of nuisance models and computation of score elements
-        score_elements, preds = self._nuisance_est(self.__smpls, n_jobs_cv,
-                                                   external_predictions=ext_prediction_dict,
-                                                   return_models=store_models)
+    def _cell_external_predictions(self, external_predictions, i_rep, i_treat):
+        # external predictions of all learners for the repetition i_rep and the treatment variable i_treat
+        return _set_external_predictions(external_predictions,
+                                         learners=self.params_names,
+                                         treatment=self._dml_data.d_cols[i_treat],
+                                         i_rep=i_rep)
+
+    def _nuisance_est_outcomes(self, smpls, n_jobs_cv, ext_prediction_dict, store_models):
+        # ml estimation of nuisance models and computation of score elements for the current repetition (with the sample
+        # splitting smpls) and treatment variable; returns a list with the score elements and predictions for each outcome
+        # variable
+        if self._dml_data.n_outcomes == 1:
+            return [self._nuisance_est(smpls, n_jobs_cv,
+                                       external_predictions=ext_prediction_dict,
+                                       return_models=store_models)]
+
+        # the nuisance models which do not depend on the outcome are only fitted for the first outcome variable, their
+        # predictions are used as external predictions for all other outcome variables
+        cell_results = []
+        for outcome_var in self._dml_data.y_cols:
+            self._dml_data.set_y(outcome_var)
+            score_elements, preds = self._nuisance_est(smpls, n_jobs_cv,
+                                                       external_predictions=ext_prediction_dict,
+                                                       return_models=store_models)
+            if len(cell_results) == 0:
+                shared_preds = preds
+                for learner in self._outcome_shared_learners:
+                    ext_prediction_dict[learner] = shared_preds['predictions'][learner]
+            else:
+                for learner in self._outcome_shared_learners:
+                    preds['targets'][learner] = shared_preds['targets'][learner]
+                    preds['models'][learner] = shared_preds['models'][learner]
+            cell_results.append((score_elements, preds))
+        return cell_results
+
+    def _set_cell_results(self, cell_results, store_predictions, store_models):
+        # store the nuisance estimates and estimate the coefficients of the current repetition and treatment variable
+        for i_coef, (score_elements, preds) in zip(self._cell_coefs(self._i_treat), cell_results):
+            self._i_coef = i_coef
+            if self._dml_data.n_outcomes > 1:
+                self._dml_data.set_y(self._coef_names[i_coef])
+
+            self._set_nuisance_and_score_elements(score_elements, preds, store_predictions, store_models)
+            self._solve_score_and_estimate_se()
+
+            # sensitivity elements can depend on the estimated parameter
+            self._fit_sensitivity_elements(preds)
+
+    def _cell_clone(self, i_rep, i_treat):
+        # lean copy of the model for the nuisance estimation of the repetition i_rep and the treatment variable i_treat in
+        # a separate process (n_jobs_rep); besides the settings, learners and parameters of the model, it only holds the
+        # data arrays (without the data frame), the fit state is not copied; the sample splitting of the cell is passed to
+        # _nuisance_est_cell, such that the clone does not hold any sample splitting
+        dml_clone = copy.copy(self)
+        for key in self._fit_state:
+            if key not in self._fit_input:
+                setattr(dml_clone, key, None)
+        dml_clone._is_classifier = self._is_classifier
+        dml_clone._i_rep = i_rep
+        dml_clone._i_treat = i_treat
+        dml_clone._dml_data = self._dml_data._copy_without_frame(self._dml_data.d_cols[i_treat])
+        dml_clone._smpls = None
+        dml_clone._smpls_cluster = None
+        return dml_clone
+
+    def _nuisance_est_cell(self, smpls, ext_prediction_dict, n_jobs_cv, store_models, cache_dir=None, profile=False):
+        # nuisance estimation for a single repetition (with the sample splitting smpls) and treatment variable on a copy
+        # from _cell_clone (evaluated in a separate process)
+        # the prediction cache and the profiler have to be set in the process evaluating the cell
+        if profile:
+            profiler = _Profiler()
+            profiler.set_cell(self._i_rep, self._dml_data.d_cols[self._i_treat])
+        else:
+            profiler = None
+        with _prediction_cache(cache_dir), _profiling(profiler):
+            cell_results = self._nuisance_est_outcomes(smpls, n_jobs_cv, ext_prediction_dict, store_models)
+        nuisance_state = {key: getattr(self, key) for key in self._nuisance_est_state}
+        profile_records = None if profiler is None else profiler.records
+        return self._i_rep, self._i_treat, cell_results, nuisance_state, profile_records
 
-        self._set_score_elements(score_elements, self._i_rep, self._i_treat)
+    def _set_nuisance_and_score_elements(self, score_elements, preds, store_predictions, store_models):
+        self._set_score_elements(score_elements, self._i_rep, self._i_coef)
 
         # calculate nuisance losses and store predictions and targets of the nuisance models
         self._calc_nuisance_loss(preds['predictions'], preds['targets'])
@@ -976,25 +1317,25 @@ class DoubleML(ABC):
         if store_models:
             self._store_models(preds['models'])
 
-        return preds
-
     def _solve_score_and_estimate_se(self):
         # estimate the causal parameter
-        self._all_coef[self._i_treat, self._i_rep] = \
-            self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
+        with _profile_step(self._profiler, 'solve_score'):
+            self._all_coef[self._i_coef, self._i_rep] = \
+                self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_coef))
 
         # compute score (depends on the estimated causal parameter)
-        self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+        self._psi[:, self._i_rep, self._i_coef] = self._compute_score(
+            self._get_score_elements(self._i_rep, self._i_coef),
+            self._all_coef[self._i_coef, self._i_rep])
 
         # compute score derivative (can depend on the estimated causal parameter)
-        self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
-            self._get_score_elements(self._i_rep, self._i_treat),
-            self._all_coef[self._i_treat, self._i_rep])
+        self._psi_deriv[:, self._i_rep, self._i_coef] = self._compute_score_deriv(
+            self._get_score_elements(self._i_rep, self._i_coef),
+            self._all_coef[self._i_coef, self._i_rep])
 
         # compute standard errors for causal parameter
-        self._all_se[self._i_treat, self._i_rep], self._var_scaling_factors[self._i_treat] = self._se_causal_pars()
+        with _profile_step(self._profiler, 'se'):
+            self._all_se[self._i_coef, self._i_rep], self._var_scaling_factors[self._i_coef] = self._se_causal_pars()
 
     def _fit_sensitivity_elements(self, nuisance_predictions):
         if self._sensitivity_implemented:
@@ -1002,8 +1343,89 @@ class DoubleML(ABC):
                 warnings.warn('Sensitivity analysis not implemented for callable scores.')
             else:
                 # compute sensitivity analysis elements
-                element_dict = self._sensitivity_element_est(nuisance_predictions)
-                self._set_sensitivity_elements(element_dict, self._i_rep, self._i_treat)
+                with _profile_step(self._profiler, 'sensitivity_elements'):
+                    element_dict = self._sensitivity_element_est(nuisance_predictions)
+                self._set_sensitivity_elements(element_dict, self._i_rep, self._i_coef)
+
+    def _checkpoint_fingerprint(self, store_predictions, external_predictions, store_models):
+        # hash of everything the results of a combination of repetition and treatment variable depend on; all attributes
+        # except the fit state are model settings (e.g. score, weights, trimming or kde), the state which is set during
+        # the nuisance estimation is excluded as well
+        excluded_keys = ['_dml_data', '_learner', '_params'] + self._fit_state + self._nuisance_est_state
+        settings = {key: value for key, value in vars(self).items() if key not in excluded_keys}
+        data_roles = {key: value for key, value in vars(self._dml_data).items()
+                      if key.endswith(('_col', '_cols')) or key == '_use_other_treat_as_covariate'}
+        learners = {key: clone(learner) for key, learner in self._learner.items()}
+        try:
+            fingerprint = joblib_hash((self.__class__.__name__, settings, self._dml_data.data, data_roles, learners,
+                                       self.params, external_predictions, store_predictions, store_models))
+        except pickle.PicklingError as e:
+            raise ValueError('The model cannot be fitted with a checkpoint_path, as some of its settings cannot be '
+                             'hashed deterministically (e.g. a callable score or kde which is a lambda or a locally '
+                             'defined function). Use a function which is defined at the top level of a module.') from e
+        return fingerprint
+
+    def _get_checkpoint_cell(self, store_predictions, store_models):
+        # list with the state of all coefficients of the current repetition and treatment variable
+        cell_state = []
+        for i_coef in self._cell_coefs(self._i_treat):
+            self._i_coef = i_coef
+            cell_state.append(self._get_checkpoint_coef(store_predictions, store_models))
+        return cell_state
+
+    def _set_checkpoint_cell(self, cell_state, store_predictions, store_models):
+        for i_coef, coef_state in zip(self._cell_coefs(self._i_treat), cell_state):
+            self._i_coef = i_coef
+            self._set_checkpoint_coef(coef_state, store_predictions, store_models)
+
+    def _get_checkpoint_coef(self, store_predictions, store_models):
+        i_rep, i_treat = self._i_rep, self._i_coef
+        cell_state = {'score_elements': self._get_score_elements(i_rep, i_treat),
+                      'coef': self._all_coef[i_treat, i_rep],
+                      'se': self._all_se[i_treat, i_rep],
+                      'psi': self._psi[:, i_rep, i_treat],
+                      'psi_deriv': self._psi_deriv[:, i_rep, i_treat],
+                      'var_scaling_factor': self._var_scaling_factors[i_treat],
+                      'nuisance_loss': {learner: self._nuisance_loss[learner][i_rep, i_treat]
+                                        for learner in self.params_names},
+                      'is_classifier': self._is_classifier,
+                      'nuisance_state': {key: getattr(self, key) for key in self._nuisance_est_state},
+                      'sensitivity_elements': None,
+                      'predictions': None,
+                      'targets': None,
+                      'models': None}
+        if self._sensitivity_implemented:
+            cell_state['sensitivity_elements'] = self._get_sensitivity_elements(i_rep, i_treat)
+        if store_predictions:
+            cell_state['predictions'] = {learner: self._predictions[learner][:, i_rep, i_treat]
+                                         for learner in self.params_names}
+            cell_state['targets'] = {learner: self._nuisance_targets[learner][:, i_rep, i_treat]
+                                     for learner in self.params_names}
+        if store_models:
+            cell_state['models'] = {learner: self._models[learner][self._coef_names[i_treat]][i_rep]
+                                    for learner in self.params_names}
+        return cell_state
+
+    def _set_checkpoint_coef(self, cell_state, store_predictions, store_models):
+        i_rep, i_treat = self._i_rep, self._i_coef
+        self._set_score_elements(cell_state['score_elements'], i_rep, i_treat)
+        self._all_coef[i_treat, i_rep] = cell_state['coef']
+        self._all_se[i_treat, i_rep] = cell_state['se']
+        self._psi[:, i_rep, i_treat] = cell_state['psi']
+        self._psi_deriv[:, i_rep, i_treat] = cell_state['psi_deriv']
+        self._var_scaling_factors[i_treat] = cell_state['var_scaling_factor']
+        for learner in self.params_names:
+            self._nuisance_loss[learner][i_rep, i_treat] = cell_state['nuisance_loss'][learner]
+        self._is_classifier = cell_state['is_classifier']
+        # state of the nuisance estimation which is carried over to the next repetition (e.g. a start value)
+        for key, value in cell_state['nuisance_state'].items():
+            setattr(self, key, value)
+        if self._sensitivity_implemented:
+            self._set_sensitivity_elements(cell_state['sensitivity_elements'], i_rep, i_treat)
+        if store_predictions:
+            self._store_predictions_and_targets(cell_state['predictions'], cell_state['targets'])
+        if store_models:
+            self._store_models(cell_state['models'])
 
     def _initialize_arrays(self):
         # scores
@@ -1011,7 +1433,7 @@ class DoubleML(ABC):
         psi_deriv = np.full((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs), np.nan)
         psi_elements = self._initialize_score_elements((self._dml_data.n_obs, self.n_rep, self._dml_data.n_coefs))
 
-        var_scaling_factors = np.full(self._dml_data.n_treat, np.nan)
+        var_scaling_factors = np.full(self._dml_data.n_coefs, np.nan)
 
         # coefficients and ses
         coef = np.full(self._dml_data.n_coefs, np.nan)
@@ -1035,13 +1457,13 @@ class DoubleML(ABC):
         }
 
     def _initialize_models(self):
-        self._models = {learner: {treat_var: [None] * self.n_rep for treat_var in self._dml_data.d_cols}
+        self._models = {learner: {coef_name: [None] * self.n_rep for coef_name in self._coef_names}
                         for learner in self.params_names}
 
     def _store_predictions_and_targets(self, preds, targets):
         for learner in self.params_names:
-            self._predictions[learner][:, self._i_rep, self._i_treat] = preds[learner]
-            self._nuisance_targets[learner][:, self._i_rep, self._i_treat] = targets[learner]
+            self._predictions[learner][:, self._i_rep, self._i_coef] = preds[learner]
+            self._nuisance_targets[learner][:, self._i_rep, self._i_coef] = targets[learner]
 
     def _calc_nuisance_loss(self, preds, targets):
         self._is_classifier = {key: False for key in self.params_names}
@@ -1056,7 +1478,7 @@ class DoubleML(ABC):
             )
 
             if targets[learner] is None:
-                self._nuisance_loss[learner][self._i_rep, self._i_treat] = np.nan
+                self._nuisance_loss[learner][self._i_rep, self._i_coef] = np.nan
             else:
                 learner_keys = [key for key in self._learner.keys() if key in learner]
                 assert len(learner_keys) == 1
@@ -1069,11 +1491,11 @@ class DoubleML(ABC):
                     sq_error = np.power(targets[learner] - preds[learner], 2)
                     loss = np.sqrt(np.nanmean(sq_error, axis=0))
 
-                self._nuisance_loss[learner][self._i_rep, self._i_treat] = loss
+                self._nuisance_loss[learner][self._i_rep, self._i_coef] = loss
 
     def _store_models(self, models):
         for learner in self.params_names:
-            self._models[learner][self._dml_data.d_cols[self._i_treat]][self._i_rep] = models[learner]
+            self._models[learner][self._coef_names[self._i_coef]][self._i_rep] = models[learner]
 
     def evaluate_learners(self, learners=None, metric=_rmse):
         """
@@ -1181,7 +1603,7 @@ class DoubleML(ABC):
 
         Parameters
         ----------
-        all_smpls : list or tuple
+        all_smpls : list, tuple or :class:`numpy.ndarray`
             If nested list of lists of tuples:
                 The outer list needs to provide an entry per repeated sample splitting (length of list is set as
                 ``n_rep``).
@@ -1194,6 +1616,11 @@ class DoubleML(ABC):
                 Must be a tuple with two elements train_ind and test_ind. Only viable option is to set
                 train_ind and test_ind to np.arange(n_obs), which corresponds to no sample splitting.
                 ``n_folds=1`` and ``n_rep=1`` is always set.
+            If :class:`numpy.ndarray`:
+                Integer array of shape ``(n_obs, n_rep)`` (or ``(n_obs,)`` for ``n_rep=1``) with the test fold
+                ``0, ..., n_folds - 1`` of every observation, e.g. from ``DoubleMLResampling.split_fold_ids()``. The
+                splits are then stored as compact int8 / int16 fold assignment and the (train_ind, test_ind) pairs are
+                derived on access. Not available for clustered data.
 
         all_smpls_cluster : list or None
             Nested list or ``None``. The first level of nesting corresponds to the number of repetitions. The second level
@@ -1282,25 +1709,25 @@ class DoubleML(ABC):
     def _est_causal_pars_and_se(self):
         for i_rep in range(self.n_rep):
             self._i_rep = i_rep
-            for i_d in range(self._dml_data.n_treat):
-                self._i_treat = i_d
+            for i_coef in range(self._dml_data.n_coefs):
+                self._i_coef = i_coef
 
                 # estimate the causal parameter
-                self._all_coef[self._i_treat, self._i_rep] = \
-                    self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_treat))
+                self._all_coef[self._i_coef, self._i_rep] = \
+                    self._est_causal_pars(self._get_score_elements(self._i_rep, self._i_coef))
 
                 # compute score (depends on the estimated causal parameter)
-                self._psi[:, self._i_rep, self._i_treat] = self._compute_score(
-                    self._get_score_elements(self._i_rep, self._i_treat),
-                    self._all_coef[self._i_treat, self._i_rep])
+                self._psi[:, self._i_rep, self._i_coef] = self._compute_score(
+                    self._get_score_elements(self._i_rep, self._i_coef),
+                    self._all_coef[self._i_coef, self._i_rep])
 
                 # compute score (can depend on the estimated causal parameter)
-                self._psi_deriv[:, self._i_rep, self._i_treat] = self._compute_score_deriv(
-                    self._get_score_elements(self._i_rep, self._i_treat),
-                    self._all_coef[self._i_treat, self._i_rep])
+                self._psi_deriv[:, self._i_rep, self._i_coef] = self._compute_score_deriv(
+                    self._get_score_elements(self._i_rep, self._i_coef),
+                    self._all_coef[self._i_coef, self._i_rep])
 
                 # compute standard errors for causal parameter
-                self._all_se[self._i_treat, self._i_rep], self._var_scaling_factors[self._i_treat] = self._se_causal_pars()
+                self._all_se[self._i_coef, self._i_rep], self._var_scaling_factors[self._i_coef] = self._se_causal_pars()
 
         # aggregated parameter estimates and standard errors from repeated cross-fitting
         self.coef, self.se = _aggregate_coefs_and_ses(self._all_coef, self._all_se, self._var_scaling_factors)
@@ -1416,13 +1843,14 @@ class DoubleML(ABC):
 
         if self._framework is None:
             raise ValueError('Apply fit() before sensitivity_analysis().')
-        self._framework.sensitivity_analysis(
-            cf_y=cf_y,
-            cf_d=cf_d,
-            rho=rho,
-            level=level,
-            null_hypothesis=null_hypothesis
-        )
+        with _profile_step(self._profiler, 'sensitivity_analysis'):
+            self._framework.sensitivity_analysis(
+                cf_y=cf_y,
+                cf_d=cf_d,
+                rho=rho,
+                level=level,
+                null_hypothesis=null_hypothesis
+            )
 
         return self
 
@@ -1513,41 +1941,95 @@ class DoubleML(ABC):
 
         return fig
 
-    def sensitivity_benchmark(self, benchmarking_set, fit_args=None):
+    def sensitivity_benchmark(self, benchmarking_set, fit_args=None, n_jobs_benchmark=None):
         """
         Computes a benchmark for a given set of features.
         Returns a DataFrame containing the corresponding values for cf_y, cf_d, rho and the change in estimates.
+
+        Parameters
+        ----------
+        benchmarking_set : list
+            The features which are omitted in the short model (list of str) or a list of several such benchmarking sets.
+            For each benchmarking set, an unfitted copy of the model without the corresponding features is fitted. The
+            copies share the data with the original model.
+
+        fit_args : dict or None
+            Additional arguments for the ``fit()`` method of the short models.
+            Default is ``None``.
+
+        n_jobs_benchmark : None or int
+            The number of CPUs used to fit the short models of several benchmarking sets in parallel.
+            ``None`` means ``1``.
+            Default is ``None``.
+
         Returns
         -------
         benchmark_results : pandas.DataFrame
-            Benchmark results.
+            Benchmark results. For several benchmarking sets, the results are combined with the benchmarking sets
+            (joined feature names) as first index level.
         """
         x_list_long = self._dml_data.x_cols
 
         # input checks
         if self._sensitivity_elements is None:
             raise NotImplementedError(f'Sensitivity analysis not yet implemented for {self.__class__.__name__}.')
-        if not isinstance(benchmarking_set, list):
-            raise TypeError('benchmarking_set must be a list. '
-                            f'{str(benchmarking_set)} of type {type(benchmarking_set)} was passed.')
-        if len(benchmarking_set) == 0:
-            raise ValueError('benchmarking_set must not be empty.')
-        if not set(benchmarking_set) <= set(x_list_long):
-            raise ValueError(f"benchmarking_set must be a subset of features {str(self._dml_data.x_cols)}. "
-                             f'{str(benchmarking_set)} was passed.')
+        benchmarking_sets = _check_benchmarking_sets(benchmarking_set, x_list_long)
         if fit_args is not None and not isinstance(fit_args, dict):
             raise TypeError('fit_args must be a dict. '
                             f'{str(fit_args)} of type {type(fit_args)} was passed.')
+        if n_jobs_benchmark is not None and not isinstance(n_jobs_benchmark, int):
+            raise TypeError('The number of CPUs used to fit the benchmarking sets must be of int type. '
+                            f'{str(n_jobs_benchmark)} of type {str(type(n_jobs_benchmark))} was passed.')
+        if fit_args is None:
+            fit_args = {}
+
+        # refit short forms of the model
+        short_models = []
+        for single_set in benchmarking_sets:
+            x_list_short = [x for x in x_list_long if x not in single_set]
+            short_models.append(self._lean_clone(self._dml_data._copy_with_x_cols(x_list_short)))
+        parallel = Parallel(n_jobs=n_jobs_benchmark, verbose=0, pre_dispatch='2*n_jobs')
+        short_models = parallel(delayed(dml_short.fit)(**fit_args) for dml_short in short_models)
+
+        df_benchmarks = [pd.DataFrame(gain_statistics(dml_long=self, dml_short=dml_short), index=self._coef_names)
+                         for dml_short in short_models]
+        if not all(isinstance(element, list) for element in benchmarking_set):
+            return df_benchmarks[0]
+        df_benchmark = pd.concat(df_benchmarks, keys=[', '.join(map(str, single_set)) for single_set in benchmarking_sets])
+        return df_benchmark
 
-        # refit short form of the model
-        x_list_short = [x for x in x_list_long if x not in benchmarking_set]
-        dml_short = copy.deepcopy(self)
-        dml_short._dml_data.x_cols = x_list_short
-        if fit_args is not None:
-            dml_short.fit(**fit_args)
+    def _nuisance_tuning_cell(self, i_d, i_rep, param_grids, scoring_methods, n_folds_tune, n_jobs_cv,
+                              search_mode, n_iter_randomized_search):
+        # tune the nuisance models for the treatment variable i_d and the repetition i_rep (i_rep is None if the tuning
+        # is not fold-specific)
+        self._i_treat = i_d
+        # this step could be skipped for the single treatment variable case
+        if self._dml_data.n_treat > 1:
+            self._dml_data.set_x_d(self._dml_data.d_cols[i_d])
+
+        if i_rep is None:
+            smpls = [(np.arange(self._dml_data.n_obs), np.arange(self._dml_data.n_obs))]
         else:
-            dml_short.fit()
+            self._i_rep = i_rep
+            smpls = self.__smpls
+        res = self._nuisance_tuning(smpls,
+                                    param_grids, scoring_methods,
+                                    n_folds_tune,
+                                    n_jobs_cv,
+                                    search_mode, n_iter_randomized_search)
+        return res
 
-        benchmark_dict = gain_statistics(dml_long=self, dml_short=dml_short)
-        df_benchmark = pd.DataFrame(benchmark_dict, index=self._dml_data.d_cols)
-        return df_benchmark
+    def _lean_clone(self, dml_data):
+        # unfitted shallow copy of the model for the data object dml_data (e.g. with a reduced set of covariates); the
+        # learners and sample splits are shared with the original model and the nuisance parameters are copied (such that
+        # setting the parameters of the clone does not change the original model), whereas the results of the fit
+        # (scores, predictions, models, sensitivity elements and the framework) are neither copied nor shared
+        dml_clone = copy.copy(self)
+        dml_clone._dml_data = dml_data
+        dml_clone._params = {learner: dict(params) for learner, params in self._params.items()}
+        for key in self._fit_state:
+            setattr(dml_clone, key, None)
+        dml_clone._is_classifier = {}
+        dml_clone._psi, dml_clone._psi_deriv, dml_clone._psi_elements, dml_clone._var_scaling_factors, \
+            dml_clone._coef, dml_clone._se, dml_clone._all_coef, dml_clone._all_se = dml_clone._initialize_arrays()
+        return dml_clone
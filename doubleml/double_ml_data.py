@@ -1,6 +1,10 @@
 import numpy as np
 import pandas as pd
 import io
+import copy
+import os
+import tempfile
+import weakref
 
 from abc import ABC, abstractmethod
 
@@ -11,6 +15,38 @@ from .utils._estimation import _assure_2d_array
 from .utils._checks import _check_set
 
 
+def _remove_file(filename, remove_folder=False):
+    try:
+        os.remove(filename)
+        if remove_folder:
+            # only succeeds for the last file of the folder
+            os.rmdir(os.path.dirname(filename))
+    except OSError:
+        pass
+
+
+def _memmap_array(values, folder, remove_folder=False):
+    fd, filename = tempfile.mkstemp(suffix='.npy', dir=folder)
+    os.close(fd)
+    fortran_order = values.flags.f_contiguous and not values.flags.c_contiguous
+    arr = np.lib.format.open_memmap(filename, mode='w+', dtype=values.dtype, shape=values.shape,
+                                    fortran_order=fortran_order)
+    arr[...] = values
+    arr.flush()
+    del arr
+    arr = np.load(filename, mmap_mode='r')
+    # the file (and the folder with its last file if remove_folder is True) is removed as soon as the memory-mapped array
+    # (incl. all views of it, e.g. in shallow copies of the data object) is garbage collected or the interpreter exits
+    weakref.finalize(arr, _remove_file, filename, remove_folder)
+    return arr
+
+
+def _read_only(values):
+    arr = values.view()
+    arr.setflags(write=False)
+    return arr
+
+
 class DoubleMLBaseData(ABC):
     """Base Class Double machine learning data-backends
     """
@@ -72,6 +108,13 @@ class DoubleMLBaseData(ABC):
         """
         return 1
 
+    @property
+    def n_outcomes(self):
+        """
+        The number of outcome variables.
+        """
+        return 1
+
     @property
     @abstractmethod
     def n_coefs(self):
@@ -89,8 +132,10 @@ class DoubleMLData(DoubleMLBaseData):
     data : :class:`pandas.DataFrame`
         The data.
 
-    y_col : str
-        The outcome variable.
+    y_col : str or list
+        The outcome variable(s). For a list of several outcome variables, :class:`doubleml.DoubleMLPLR` and
+        :class:`doubleml.DoubleMLIRM` estimate the effect of the treatment variable on each outcome variable, where the
+        nuisance models which do not depend on the outcome (e.g. ``ml_m``) are only fitted once.
 
     d_cols : str or list
         The treatment variable(s).
@@ -126,6 +171,17 @@ class DoubleMLData(DoubleMLBaseData):
         in the covariates ``x``.
         Default is ``True``.
 
+    Notes
+    -----
+    .. versionchanged:: 0.10
+        The arrays ``x``, ``y``, ``d``, ``z``, ``t`` and ``s`` are read-only views of a single float64 array, which holds
+        all numeric columns of ``data`` and is set up once, i.e., numeric (incl. integer and boolean) columns are returned
+        as float64 and the arrays cannot be modified in place. Use ``obj.data`` or a copy (e.g. ``obj.x.copy()``) to
+        change the data. In the multiple-treatment case with ``use_other_treat_as_covariate=True``, ``x`` is only a view
+        for the last treatment variable; for the other treatment variables, the covariates are copied with every call of
+        :meth:`set_x_d`. The same holds if ``x_cols`` is set to columns which are not stored next to each other (in
+        the order of ``x_cols``).
+
     Examples
     --------
     >>> from doubleml import DoubleMLData
@@ -148,6 +204,8 @@ class DoubleMLData(DoubleMLBaseData):
                  use_other_treat_as_covariate=True,
                  force_all_x_finite=True):
         DoubleMLBaseData.__init__(self, data)
+        self._memmap_folder = None
+        self._memmap_remove_folder = False
 
         self.y_col = y_col
         self.d_cols = d_cols
@@ -160,6 +218,7 @@ class DoubleMLData(DoubleMLBaseData):
         self.force_all_x_finite = force_all_x_finite
         self._binary_treats = self._check_binary_treats()
         self._binary_outcome = self._check_binary_outcome()
+        self._set_data_array()
         self._set_y_z_t_s()
         # by default, we initialize to the first treatment variable
         self.set_x_d(self.d_cols[0])
@@ -309,14 +368,16 @@ class DoubleMLData(DoubleMLBaseData):
         To get an array of all covariates (independent of the currently set treatment variable)
         call ``obj.data[obj.x_cols].values``.
         """
-        return self._X.values
+        return self._X
 
     @property
     def y(self):
         """
-        Array of outcome variable.
+        Array of outcome variable;
+        Dynamic! Depends on the currently set outcome variable (in the multiple-outcome case);
+        To get an array of all outcome variables call ``obj.data[obj.y_cols].values``.
         """
-        return self._y.values
+        return self._y
 
     @property
     def d(self):
@@ -326,7 +387,7 @@ class DoubleMLData(DoubleMLBaseData):
         To get an array of all treatment variables (independent of the currently set treatment variable)
         call ``obj.data[obj.d_cols].values``.
         """
-        return self._d.values
+        return self._d
 
     @property
     def z(self):
@@ -334,7 +395,7 @@ class DoubleMLData(DoubleMLBaseData):
         Array of instrumental variables.
         """
         if self.z_cols is not None:
-            return self._z.values
+            return self._z
         else:
             return None
 
@@ -344,7 +405,7 @@ class DoubleMLData(DoubleMLBaseData):
         Array of time variable.
         """
         if self.t_col is not None:
-            return self._t.values
+            return self._t
         else:
             return None
 
@@ -354,7 +415,7 @@ class DoubleMLData(DoubleMLBaseData):
         Array of score or selection variable.
         """
         if self.s_col is not None:
-            return self._s.values
+            return self._s
         else:
             return None
 
@@ -365,12 +426,19 @@ class DoubleMLData(DoubleMLBaseData):
         """
         return len(self.d_cols)
 
+    @property
+    def n_outcomes(self):
+        """
+        The number of outcome variables.
+        """
+        return len(self.y_cols)
+
     @property
     def n_coefs(self):
         """
         The number of coefficients to be estimated.
         """
-        return self.n_treat
+        return self.n_treat * self.n_outcomes
 
     @property
     def n_instr(self):
@@ -393,7 +461,7 @@ class DoubleMLData(DoubleMLBaseData):
     @property
     def binary_outcome(self):
         """
-        Logical indicating whether the outcome variable is binary with values 0 and 1.
+        Logical indicating whether the outcome variable(s) are binary with values 0 and 1.
         """
         return self._binary_outcome
 
@@ -422,7 +490,7 @@ class DoubleMLData(DoubleMLBaseData):
             assert set(value).issubset(set(self.all_variables))
             self._x_cols = value
         else:
-            excluded_cols = set.union({self.y_col}, set(self.d_cols))
+            excluded_cols = set.union(set(self.y_cols), set(self.d_cols))
             if (self.z_cols is not None):
                 excluded_cols = set.union(excluded_cols, set(self.z_cols))
             for col in [self.t_col, self.s_col]:
@@ -431,6 +499,8 @@ class DoubleMLData(DoubleMLBaseData):
             self._x_cols = [col for col in self.data.columns if col not in excluded_cols]
         if reset_value:
             self._check_disjoint_sets()
+            # the data array contains all numeric columns, such that only the selection of the covariates changes
+            self._memmap_selections = {}
             # by default, we initialize to the first treatment variable
             self.set_x_d(self.d_cols[0])
 
@@ -458,30 +528,48 @@ class DoubleMLData(DoubleMLBaseData):
         self._d_cols = value
         if reset_value:
             self._check_disjoint_sets()
+            self._set_y_z_t_s()
             # by default, we initialize to the first treatment variable
             self.set_x_d(self.d_cols[0])
 
     @property
     def y_col(self):
         """
-        The outcome variable.
+        The outcome variable(s).
         """
         return self._y_col
 
     @y_col.setter
     def y_col(self, value):
         reset_value = hasattr(self, '_y_col')
-        if not isinstance(value, str):
-            raise TypeError('The outcome variable y_col must be of str type. '
+        if isinstance(value, str):
+            y_cols = [value]
+        elif isinstance(value, list) and (len(value) > 0):
+            y_cols = value
+        else:
+            raise TypeError('The outcome variable(s) y_col must be of str or list type. '
                             f'{str(value)} of type {str(type(value))} was passed.')
-        if value not in self.all_variables:
-            raise ValueError('Invalid outcome variable y_col. '
-                             f'{value} is no data column.')
+        if not len(set(y_cols)) == len(y_cols):
+            raise ValueError('Invalid outcome variable(s) y_col: '
+                             'Contains duplicate values.')
+        for col in y_cols:
+            if col not in self.all_variables:
+                raise ValueError('Invalid outcome variable y_col. '
+                                 f'{col} is no data column.')
         self._y_col = value
+        self._y_cols = y_cols
         if reset_value:
             self._check_disjoint_sets()
+            self._binary_outcome = self._check_binary_outcome()
             self._set_y_z_t_s()
 
+    @property
+    def y_cols(self):
+        """
+        The list of outcome variable(s).
+        """
+        return self._y_cols
+
     @property
     def z_cols(self):
         """
@@ -599,26 +687,116 @@ class DoubleMLData(DoubleMLBaseData):
             # by default, we initialize to the first treatment variable
             self.set_x_d(self.d_cols[0])
 
-    def _set_y_z_t_s(self):
-        assert_all_finite(self.data.loc[:, self.y_col])
-        self._y = self.data.loc[:, self.y_col]
-        if self.z_cols is None:
-            self._z = None
-        else:
-            assert_all_finite(self.data.loc[:, self.z_cols])
-            self._z = self.data.loc[:, self.z_cols]
+    @property
+    def memmap_folder(self):
+        """
+        The folder holding the memory-mapped arrays (``None`` if :meth:`share_memory` has not been called).
+        """
+        return self._memmap_folder
 
-        if self.t_col is None:
-            self._t = None
-        else:
-            assert_all_finite(self.data.loc[:, self.t_col])
-            self._t = self.data.loc[:, self.t_col]
+    def share_memory(self, temp_folder=None):
+        """
+        Back the numeric arrays (e.g. ``x``, ``y`` and ``d``) by read-only memory-mapped files.
+
+        Parallel cross-fitting (``n_jobs_cv``, ``n_jobs_rep``, ``n_jobs_models``) then passes a reference to the
+        files to the workers, which index into the same buffer, instead of sending a copy of the data with each task.
+
+        Parameters
+        ----------
+        temp_folder : None or str
+            Folder where the memory-mapped files are stored. Each file is removed as soon as it is no longer referenced
+            (e.g. if the data object is garbage collected) or the interpreter exits.
+            If ``None``, a temporary folder is created which is removed together with its last file.
+            Default is ``None``.
 
-        if self.s_col is None:
-            self._s = None
+        Returns
+        -------
+        self : object
+        """
+        if temp_folder is None:
+            temp_folder = tempfile.mkdtemp(prefix='doubleml_memmap_')
+            self._memmap_remove_folder = True
+        elif not isinstance(temp_folder, str):
+            raise TypeError('temp_folder must be of str type (or None). '
+                            f'{str(temp_folder)} of type {str(type(temp_folder))} was passed.')
         else:
+            os.makedirs(temp_folder, exist_ok=True)
+            self._memmap_remove_folder = False
+        self._memmap_folder = temp_folder
+        # the data array is written to one file, which replaces the in-memory array (or the file of a previous call)
+        self._data_array = _memmap_array(self._data_array, temp_folder, self._memmap_remove_folder)
+        self._memmap_selections = {}
+        self._set_y_z_t_s()
+        return self
+
+    def _data_array_cols(self):
+        # the numeric (incl. boolean) columns of the data array; the covariates come first and are followed by the
+        # treatment variables, the outcome, instrument, time and selection variables and all other numeric columns
+        cols = self.x_cols + self.d_cols + self.y_cols
+        if self.z_cols is not None:
+            cols += self.z_cols
+        for col in [self.t_col, self.s_col]:
+            if col is not None:
+                cols.append(col)
+        cols += [col for col in self.data.columns if col not in cols]
+        return [col for col in cols if pd.api.types.is_numeric_dtype(self.data.dtypes[col])]
+
+    def _set_data_array(self):
+        # all numeric columns are cast to float64 and stored once in a single column-major array, such that the arrays of
+        # the variables are views and a change of the roles (e.g. of x_cols) only changes the selected columns; x is a
+        # view if the covariates are adjacent columns of the data array, e.g. for the initial covariates, unless another
+        # treatment variable is used as covariate and not the last one (the covariates of the other treatment variables
+        # are then copied with every call of set_x_d)
+        cols = self._data_array_cols()
+        self._data_col_idx = {col: i_col for i_col, col in enumerate(cols)}
+        data_array = np.asfortranarray(self.data.loc[:, cols].to_numpy(dtype=np.float64, na_value=np.nan))
+        if self._memmap_folder is not None:
+            data_array = _memmap_array(data_array, self._memmap_folder, self._memmap_remove_folder)
+        self._data_array = data_array
+        self._memmap_selections = {}
+
+    def _get_array(self, cols):
+        # returns the columns cols (str for a 1d array, list for a 2d array) as a read-only array; numeric columns are
+        # views of the data array, other columns (e.g. strings or the cluster variables) keep their dtype (as the values
+        # of the data frame selection)
+        col_list = [cols] if isinstance(cols, str) else cols
+        in_data_array = all(col in self._data_col_idx for col in col_list)
+        if in_data_array:
+            col_idx = [self._data_col_idx[col] for col in col_list]
+            if isinstance(cols, str):
+                return _read_only(self._data_array[:, col_idx[0]])
+            if col_idx == list(range(col_idx[0], col_idx[0] + len(col_idx))):
+                return _read_only(self._data_array[:, col_idx[0]:col_idx[-1] + 1])
+        key = tuple(col_list)
+        if key in self._memmap_selections:
+            return self._memmap_selections[key]
+        values = self._data_array[:, col_idx] if in_data_array else self.data.loc[:, cols].values
+        if (self._memmap_folder is None) or (values.dtype == object):
+            return _read_only(values)
+        # non-contiguous selections and columns of other dtypes are memory-mapped once as well; the selections are reset
+        # if the covariates change, such that only the files of the current selections are kept
+        self._memmap_selections[key] = _memmap_array(values, self._memmap_folder, self._memmap_remove_folder)
+        return self._memmap_selections[key]
+
+    def _set_y_z_t_s(self):
+        assert_all_finite(self.data.loc[:, self.y_cols])
+        if self.z_cols is not None:
+            assert_all_finite(self.data.loc[:, self.z_cols])
+        if self.t_col is not None:
+            assert_all_finite(self.data.loc[:, self.t_col])
+        if self.s_col is not None:
             assert_all_finite(self.data.loc[:, self.s_col])
-            self._s = self.data.loc[:, self.s_col]
+
+        if getattr(self, '_outcome_var', None) not in self.y_cols:
+            # by default, we initialize to the first outcome variable
+            self._outcome_var = self.y_cols[0]
+        self._y = self._get_array(self._outcome_var)
+        self._z = self._get_array(self.z_cols) if self.z_cols is not None else None
+        self._t = self._get_array(self.t_col) if self.t_col is not None else None
+        self._s = self._get_array(self.s_col) if self.s_col is not None else None
+        if getattr(self, '_treatment_var', None) in self.d_cols:
+            # x and d are selected anew (e.g. for new treatment variables)
+            self.set_x_d(self._treatment_var)
 
     def set_x_d(self, treatment_var):
         """
@@ -642,12 +820,56 @@ class DoubleMLData(DoubleMLBaseData):
             xd_list.remove(treatment_var)
         else:
             xd_list = self.x_cols
-        assert_all_finite(self.data.loc[:, treatment_var])
+        d = self._get_array(treatment_var)
+        x = self._get_array(xd_list)
+        assert_all_finite(d)
         if self.force_all_x_finite:
-            assert_all_finite(self.data.loc[:, xd_list],
-                              allow_nan=self.force_all_x_finite == 'allow-nan')
-        self._d = self.data.loc[:, treatment_var]
-        self._X = self.data.loc[:, xd_list]
+            assert_all_finite(x, allow_nan=self.force_all_x_finite == 'allow-nan')
+        self._treatment_var = treatment_var
+        self._d = d
+        self._X = x
+
+    def set_y(self, outcome_var):
+        """
+        Function that assigns the role for the outcome variable in the multiple-outcome case.
+
+        Parameters
+        ----------
+        outcome_var : str
+            Active outcome variable that will be set to y.
+        """
+        if not isinstance(outcome_var, str):
+            raise TypeError('outcome_var must be of str type. '
+                            f'{str(outcome_var)} of type {str(type(outcome_var))} was passed.')
+        if outcome_var not in self.y_cols:
+            raise ValueError('Invalid outcome_var. '
+                             f'{outcome_var} is not in y_cols.')
+        self._outcome_var = outcome_var
+        self._y = self._get_array(outcome_var)
+
+    def _copy_with_x_cols(self, x_cols):
+        # shallow copy with a reduced set of covariates (e.g. for the short models of a sensitivity benchmark); the data
+        # frame and the data array are shared with the original object, such that only the covariates are selected anew
+        assert set(x_cols) <= set(self.x_cols)
+        dml_data_short = copy.copy(self)
+        dml_data_short._x_cols = list(x_cols)
+        dml_data_short._memmap_selections = dict(self._memmap_selections)
+        dml_data_short.set_x_d(self._treatment_var)
+        return dml_data_short
+
+    def _copy_without_frame(self, treatment_var):
+        # shallow copy with the active treatment variable treatment_var for the nuisance estimation in a separate process
+        # (n_jobs_rep); the arrays of all variables of the nuisance estimation are selected beforehand, such that the data
+        # frame is replaced by an empty frame (with the same index) and is not sent to the worker
+        dml_data = copy.copy(self)
+        dml_data._memmap_selections = dict(self._memmap_selections)
+        dml_data.set_x_d(treatment_var)
+        for outcome_var in self.y_cols:
+            if outcome_var not in self._data_col_idx:
+                # outcome variables which are not in the data array are selected from the data frame in set_y
+                dml_data._memmap_selections[(outcome_var,)] = self._get_array(outcome_var)
+        dml_data._data = self.data.iloc[:, :0]
+        return dml_data
 
     def _check_binary_treats(self):
         is_binary = pd.Series(dtype=bool, index=self.d_cols)
@@ -659,10 +881,12 @@ class DoubleMLData(DoubleMLBaseData):
         return is_binary
 
     def _check_binary_outcome(self):
-        y = self.data.loc[:, self.y_col]
-        binary_outcome = (type_of_target(y) == 'binary')
-        zero_one_outcome = np.all((np.power(y, 2) - y) == 0)
-        is_binary = (binary_outcome & zero_one_outcome)
+        is_binary = True
+        for outcome_var in self.y_cols:
+            y = self.data.loc[:, outcome_var]
+            binary_outcome = (type_of_target(y) == 'binary')
+            zero_one_outcome = np.all((np.power(y, 2) - y) == 0)
+            is_binary = is_binary & binary_outcome & zero_one_outcome
         return is_binary
 
     def _check_disjoint_sets(self):
@@ -670,7 +894,7 @@ class DoubleMLData(DoubleMLBaseData):
         self._check_disjoint_sets_y_d_x_z_t_s()
 
     def _check_disjoint_sets_y_d_x_z_t_s(self):
-        y_col_set = {self.y_col}
+        y_col_set = set(self.y_cols)
         x_cols_set = set(self.x_cols)
         d_cols_set = set(self.d_cols)
 
@@ -701,7 +925,7 @@ class DoubleMLData(DoubleMLBaseData):
         self._check_disjoint_sets_t_s()
 
     def _check_disjoint_sets_t_s(self):
-        y_col_set = {self.y_col}
+        y_col_set = set(self.y_cols)
         x_cols_set = set(self.x_cols)
         d_cols_set = set(self.d_cols)
 
@@ -756,8 +980,10 @@ class DoubleMLClusterData(DoubleMLData):
     data : :class:`pandas.DataFrame`
         The data.
 
-    y_col : str
-        The outcome variable.
+    y_col : str or list
+        The outcome variable(s). For a list of several outcome variables, :class:`doubleml.DoubleMLPLR` and
+        :class:`doubleml.DoubleMLIRM` estimate the effect of the treatment variable on each outcome variable, where the
+        nuisance models which do not depend on the outcome (e.g. ``ml_m``) are only fitted once.
 
     d_cols : str or list
         The treatment variable(s).
@@ -822,7 +1048,6 @@ class DoubleMLClusterData(DoubleMLData):
 
         # we need to set cluster_cols (needs _data) before call to the super __init__ because of the x_cols setter
         self.cluster_cols = cluster_cols
-        self._set_cluster_vars()
         DoubleMLData.__init__(self,
                               data,
                               y_col,
@@ -949,7 +1174,9 @@ class DoubleMLClusterData(DoubleMLData):
         self._cluster_cols = value
         if reset_value:
             self._check_disjoint_sets()
-            self._set_cluster_vars()
+            # the cluster variables are not stored in the data array, such that it is set up anew
+            self._set_data_array()
+            self._set_y_z_t_s()
 
     @property
     def n_cluster_vars(self):
@@ -963,7 +1190,7 @@ class DoubleMLClusterData(DoubleMLData):
         """
         Array of cluster variable(s).
         """
-        return self._cluster_vars.values
+        return self._cluster_vars
 
     @DoubleMLData.x_cols.setter
     def x_cols(self, value):
@@ -973,30 +1200,32 @@ class DoubleMLClusterData(DoubleMLData):
         else:
             if self.s_col is None:
                 if (self.z_cols is not None) & (self.t_col is not None):
-                    y_d_z_t = set.union({self.y_col}, set(self.d_cols), set(self.z_cols), {self.t_col}, set(self.cluster_cols))
+                    y_d_z_t = set.union(set(self.y_cols), set(self.d_cols), set(self.z_cols), {self.t_col},
+                                        set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_z_t]
                 elif self.z_cols is not None:
-                    y_d_z = set.union({self.y_col}, set(self.d_cols), set(self.z_cols), set(self.cluster_cols))
+                    y_d_z = set.union(set(self.y_cols), set(self.d_cols), set(self.z_cols), set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_z]
                 elif self.t_col is not None:
-                    y_d_t = set.union({self.y_col}, set(self.d_cols), {self.t_col}, set(self.cluster_cols))
+                    y_d_t = set.union(set(self.y_cols), set(self.d_cols), {self.t_col}, set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_t]
                 else:
-                    y_d = set.union({self.y_col}, set(self.d_cols), set(self.cluster_cols))
+                    y_d = set.union(set(self.y_cols), set(self.d_cols), set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d]
             else:
                 if (self.z_cols is not None) & (self.t_col is not None):
-                    y_d_z_t_s = set.union({self.y_col}, set(self.d_cols), set(self.z_cols), {self.t_col}, {self.s_col},
+                    y_d_z_t_s = set.union(set(self.y_cols), set(self.d_cols), set(self.z_cols), {self.t_col}, {self.s_col},
                                           set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_z_t_s]
                 elif self.z_cols is not None:
-                    y_d_z_s = set.union({self.y_col}, set(self.d_cols), set(self.z_cols), {self.s_col}, set(self.cluster_cols))
+                    y_d_z_s = set.union(set(self.y_cols), set(self.d_cols), set(self.z_cols), {self.s_col},
+                                        set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_z_s]
                 elif self.t_col is not None:
-                    y_d_t_s = set.union({self.y_col}, set(self.d_cols), {self.t_col}, {self.s_col}, set(self.cluster_cols))
+                    y_d_t_s = set.union(set(self.y_cols), set(self.d_cols), {self.t_col}, {self.s_col}, set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_t_s]
                 else:
-                    y_d_s = set.union({self.y_col}, set(self.d_cols), {self.s_col}, set(self.cluster_cols))
+                    y_d_s = set.union(set(self.y_cols), set(self.d_cols), {self.s_col}, set(self.cluster_cols))
                     x_cols = [col for col in self.data.columns if col not in y_d_s]
             # this call might become much easier with https://github.com/python/cpython/pull/26194
             super(self.__class__, self.__class__).x_cols.__set__(self, x_cols)
@@ -1012,7 +1241,7 @@ class DoubleMLClusterData(DoubleMLData):
 
         # special checks for the additional cluster variables
         cluster_cols_set = set(self.cluster_cols)
-        y_col_set = {self.y_col}
+        y_col_set = set(self.y_cols)
         x_cols_set = set(self.x_cols)
         d_cols_set = set(self.d_cols)
         t_col_set = {self.t_col}
@@ -1042,6 +1271,15 @@ class DoubleMLClusterData(DoubleMLData):
                 raise ValueError(f'{str(self.s_col)} cannot be set as score or selection variable ``s_col`` and '
                                  'cluster variable in ``cluster_cols``.')
 
+    def _data_array_cols(self):
+        # the cluster variables keep their dtype and are not stored in the data array
+        cols = super(DoubleMLClusterData, self)._data_array_cols()
+        return [col for col in cols if col not in self.cluster_cols]
+
+    def _set_y_z_t_s(self):
+        super(DoubleMLClusterData, self)._set_y_z_t_s()
+        self._set_cluster_vars()
+
     def _set_cluster_vars(self):
         assert_all_finite(self.data.loc[:, self.cluster_cols])
-        self._cluster_vars = self.data.loc[:, self.cluster_cols]
+        self._cluster_vars = self._get_array(self.cluster_cols)
@@ -4,13 +4,11 @@ import copy
 
 from scipy.stats import norm
 from scipy.optimize import minimize_scalar
-from statsmodels.stats.multitest import multipletests
 
-from .utils._estimation import _draw_weights, _aggregate_coefs_and_ses, _var_est
+from .utils._estimation import _multiplier_bootstrap, _cluster_psi_sums, _aggregate_coefs_and_ses, _var_est
 from .utils._checks import _check_bootstrap, _check_framework_compatibility, _check_in_zero_one, \
     _check_float, _check_integer, _check_bool, _check_benchmarks
 from .utils._descriptive import generate_summary
-from .utils._plots import _sensitivity_contour_plot
 
 
 class DoubleMLFramework():
@@ -438,7 +436,7 @@ class DoubleMLFramework():
     def __rmul__(self, other):
         return self.__mul__(other)
 
-    def _calc_sensitivity_analysis(self, cf_y, cf_d, rho, level):
+    def _check_sensitivity_input(self, cf_y, cf_d, rho, level):
         if not self._sensitivity_implemented:
             raise NotImplementedError('Sensitivity analysis is not implemented for this model.')
 
@@ -451,18 +449,23 @@ class DoubleMLFramework():
         _check_in_zero_one(abs(rho), 'The absolute value of rho')
         _check_in_zero_one(level, 'The confidence level', include_zero=False, include_one=False)
 
-        # set elements for readability
         sigma2 = self.sensitivity_elements['sigma2']
         nu2 = self.sensitivity_elements['nu2']
-        psi_sigma = self.sensitivity_elements['psi_sigma2']
-        psi_nu = self.sensitivity_elements['psi_nu2']
-        psi_scaled = self._scaled_psi
-
         if (np.any(sigma2 < 0)) | (np.any(nu2 < 0)):
             raise ValueError('sensitivity_elements sigma2 and nu2 have to be positive. '
                              f"Got sigma2 {str(sigma2)} and nu2 {str(nu2)}. "
                              'Most likely this is due to low quality learners (especially propensity scores).')
 
+    def _calc_sensitivity_analysis(self, cf_y, cf_d, rho, level):
+        self._check_sensitivity_input(cf_y, cf_d, rho, level)
+
+        # set elements for readability
+        sigma2 = self.sensitivity_elements['sigma2']
+        nu2 = self.sensitivity_elements['nu2']
+        psi_sigma = self.sensitivity_elements['psi_sigma2']
+        psi_nu = self.sensitivity_elements['psi_nu2']
+        psi_scaled = self._scaled_psi
+
         # elementwise operations
         confounding_strength = np.multiply(np.abs(rho), np.sqrt(np.multiply(cf_y, np.divide(cf_d, 1.0-cf_d))))
         sensitivity_scaling = np.sqrt(np.multiply(sigma2, nu2))
@@ -477,40 +480,30 @@ class DoubleMLFramework():
         psi_upper = psi_scaled + psi_bias
 
         # shape (n_thetas, n_reps); includes scaling with n^{-1/2}
-        all_sigma_lower = np.full_like(all_theta_lower, fill_value=np.nan)
-        all_sigma_upper = np.full_like(all_theta_upper, fill_value=np.nan)
-
-        for i_rep in range(self.n_rep):
-            for i_theta in range(self.n_thetas):
-
-                if not self._is_cluster_data:
-                    smpls = None
-                    cluster_vars = None
-                    smpls_cluster = None
-                    n_folds_per_cluster = None
-                else:
-                    smpls = self._cluster_dict['smpls'][i_rep]
-                    cluster_vars = self._cluster_dict['cluster_vars']
-                    smpls_cluster = self._cluster_dict['smpls_cluster'][i_rep]
-                    n_folds_per_cluster = self._cluster_dict['n_folds_per_cluster']
-
-                sigma2_lower_hat, _ = _var_est(psi=psi_lower[:, i_theta, i_rep],
-                                               psi_deriv=np.ones_like(psi_lower[:, i_theta, i_rep]),
-                                               smpls=smpls,
-                                               is_cluster_data=self._is_cluster_data,
-                                               cluster_vars=cluster_vars,
-                                               smpls_cluster=smpls_cluster,
-                                               n_folds_per_cluster=n_folds_per_cluster)
-                sigma2_upper_hat, _ = _var_est(psi=psi_upper[:, i_theta, i_rep],
-                                               psi_deriv=np.ones_like(psi_upper[:, i_theta, i_rep]),
-                                               smpls=smpls,
-                                               is_cluster_data=self._is_cluster_data,
-                                               cluster_vars=cluster_vars,
-                                               smpls_cluster=smpls_cluster,
-                                               n_folds_per_cluster=n_folds_per_cluster)
-
-                all_sigma_lower[i_theta, i_rep] = np.sqrt(sigma2_lower_hat)
-                all_sigma_upper[i_theta, i_rep] = np.sqrt(sigma2_upper_hat)
+        if not self._is_cluster_data:
+            # without clustering the variances of all thetas and repetitions are estimated at once
+            sigma2_lower_hat, _ = _var_est(psi=psi_lower, psi_deriv=np.ones_like(psi_lower),
+                                           smpls=None, is_cluster_data=False)
+            sigma2_upper_hat, _ = _var_est(psi=psi_upper, psi_deriv=np.ones_like(psi_upper),
+                                           smpls=None, is_cluster_data=False)
+        else:
+            # the sample splits differ over repetitions; the cluster sums are computed for all thetas at once
+            sigma2_lower_hat = np.full_like(all_theta_lower, fill_value=np.nan)
+            sigma2_upper_hat = np.full_like(all_theta_upper, fill_value=np.nan)
+            for i_rep in range(self.n_rep):
+                var_est_args = {'smpls': self._cluster_dict['smpls'][i_rep],
+                                'is_cluster_data': True,
+                                'cluster_vars': self._cluster_dict['cluster_vars'],
+                                'smpls_cluster': self._cluster_dict['smpls_cluster'][i_rep],
+                                'n_folds_per_cluster': self._cluster_dict['n_folds_per_cluster']}
+                sigma2_lower_hat[:, i_rep], _ = _var_est(psi=psi_lower[:, :, i_rep],
+                                                         psi_deriv=np.ones_like(psi_lower[:, :, i_rep]),
+                                                         **var_est_args)
+                sigma2_upper_hat[:, i_rep], _ = _var_est(psi=psi_upper[:, :, i_rep],
+                                                         psi_deriv=np.ones_like(psi_upper[:, :, i_rep]),
+                                                         **var_est_args)
+        all_sigma_lower = np.sqrt(sigma2_lower_hat)
+        all_sigma_upper = np.sqrt(sigma2_upper_hat)
 
         # aggregate coefs and ses over n_rep
         theta_lower, sigma_lower = _aggregate_coefs_and_ses(all_theta_lower, all_sigma_lower, self._var_scaling_factors)
@@ -539,6 +532,100 @@ class DoubleMLFramework():
 
         return res_dict
 
+    def _calc_sensitivity_grid(self, cf_y, cf_d, rho, level):
+        # batched version of _calc_sensitivity_analysis for arrays of (cf_y, cf_d) values
+        # the bounds are psi_scaled -/+ c * psi_direction with confounding strength c, such that their variances are
+        # quadratic polynomials in c: var(psi_scaled) -/+ 2c * cov(psi_scaled, psi_direction) + c^2 * var(psi_direction)
+        # the three moments are estimated once and each grid point only requires O(1) operations per theta and rep
+        cf_y = np.asarray(cf_y, dtype=float).reshape(-1)
+        cf_d = np.asarray(cf_d, dtype=float).reshape(-1)
+        if cf_y.shape != cf_d.shape:
+            raise ValueError('cf_y and cf_d must contain the same number of grid points. '
+                             f'Got {cf_y.shape[0]} and {cf_d.shape[0]}.')
+        self._check_sensitivity_input(float(np.min(cf_y)), float(np.min(cf_d)), rho, level)
+        self._check_sensitivity_input(float(np.max(cf_y)), float(np.max(cf_d)), rho, level)
+        n_points = cf_y.shape[0]
+
+        # set elements for readability
+        sigma2 = self.sensitivity_elements['sigma2']
+        nu2 = self.sensitivity_elements['nu2']
+        psi_sigma = self.sensitivity_elements['psi_sigma2']
+        psi_nu = self.sensitivity_elements['psi_nu2']
+        psi_scaled = self._scaled_psi
+
+        sensitivity_scaling = np.sqrt(np.multiply(sigma2, nu2))
+        psi_variances = np.multiply(sigma2, psi_nu) + np.multiply(nu2, psi_sigma)
+        psi_direction = np.divide(psi_variances, np.multiply(2.0, sensitivity_scaling))
+
+        # moments of shape (n_thetas, n_rep); include scaling with n^{-1}
+        if not self._is_cluster_data:
+            var_scaling = psi_scaled.shape[0]
+            var_psi = np.divide(np.mean(np.square(psi_scaled), axis=0), var_scaling)
+            cov_psi = np.divide(np.mean(np.multiply(psi_scaled, psi_direction), axis=0), var_scaling)
+            var_direction = np.divide(np.mean(np.square(psi_direction), axis=0), var_scaling)
+        else:
+            # the cluster robust variance is a quadratic form in the score, the covariance follows by polarization
+            var_psi = np.full_like(self.all_thetas, fill_value=np.nan)
+            cov_psi = np.full_like(self.all_thetas, fill_value=np.nan)
+            var_direction = np.full_like(self.all_thetas, fill_value=np.nan)
+            for i_rep in range(self.n_rep):
+                var_est_args = {'smpls': self._cluster_dict['smpls'][i_rep],
+                                'is_cluster_data': True,
+                                'cluster_vars': self._cluster_dict['cluster_vars'],
+                                'smpls_cluster': self._cluster_dict['smpls_cluster'][i_rep],
+                                'n_folds_per_cluster': self._cluster_dict['n_folds_per_cluster']}
+                psi_a = psi_scaled[:, :, i_rep]
+                psi_b = psi_direction[:, :, i_rep]
+                psi_deriv = np.ones_like(psi_a)
+                var_a, _ = _var_est(psi=psi_a, psi_deriv=psi_deriv, **var_est_args)
+                var_b, _ = _var_est(psi=psi_b, psi_deriv=psi_deriv, **var_est_args)
+                var_ab, _ = _var_est(psi=psi_a + psi_b, psi_deriv=psi_deriv, **var_est_args)
+                var_psi[:, i_rep] = var_a
+                cov_psi[:, i_rep] = np.divide(var_ab - var_a - var_b, 2.0)
+                var_direction[:, i_rep] = var_b
+
+        # shape (n_points, n_thetas, n_rep)
+        confounding_strength = np.multiply(np.abs(rho), np.sqrt(np.multiply(cf_y, np.divide(cf_d, 1.0-cf_d))))
+        confounding_strength = confounding_strength.reshape(-1, 1, 1)
+        all_theta_lower = self.all_thetas - np.multiply(np.squeeze(sensitivity_scaling, axis=0), confounding_strength)
+        all_theta_upper = self.all_thetas + np.multiply(np.squeeze(sensitivity_scaling, axis=0), confounding_strength)
+
+        quadratic_term = var_psi + np.multiply(np.square(confounding_strength), var_direction)
+        linear_term = np.multiply(2.0 * confounding_strength, cov_psi)
+        # clip negative values due to rounding errors
+        all_sigma_lower = np.sqrt(np.maximum(quadratic_term - linear_term, 0.0))
+        all_sigma_upper = np.sqrt(np.maximum(quadratic_term + linear_term, 0.0))
+
+        # aggregate coefs and ses over n_rep for all grid points at once
+        var_scaling_factors = np.tile(self._var_scaling_factors, (n_points, ) + (1, ) * (self._var_scaling_factors.ndim - 1))
+        theta_lower, sigma_lower = _aggregate_coefs_and_ses(all_theta_lower.reshape(-1, self.n_rep),
+                                                            all_sigma_lower.reshape(-1, self.n_rep),
+                                                            var_scaling_factors)
+        theta_upper, sigma_upper = _aggregate_coefs_and_ses(all_theta_upper.reshape(-1, self.n_rep),
+                                                            all_sigma_upper.reshape(-1, self.n_rep),
+                                                            var_scaling_factors)
+
+        # per repetition confidence intervals
+        quant = norm.ppf(level)
+        all_ci_lower = all_theta_lower - np.multiply(quant, all_sigma_lower)
+        all_ci_upper = all_theta_upper + np.multiply(quant, all_sigma_upper)
+
+        # all entries of shape (n_points, n_thetas)
+        theta_dict = {'lower': theta_lower.reshape(n_points, self.n_thetas),
+                      'upper': theta_upper.reshape(n_points, self.n_thetas)}
+
+        se_dict = {'lower': sigma_lower.reshape(n_points, self.n_thetas),
+                   'upper': sigma_upper.reshape(n_points, self.n_thetas)}
+
+        ci_dict = {'lower': np.median(all_ci_lower, axis=2),
+                   'upper': np.median(all_ci_upper, axis=2)}
+
+        res_dict = {'theta': theta_dict,
+                    'se': se_dict,
+                    'ci': ci_dict}
+
+        return res_dict
+
     def _calc_robustness_value(self, null_hypothesis, level, rho, idx_treatment):
         _check_float(null_hypothesis, "null_hypothesis")
         _check_integer(idx_treatment, "idx_treatment", lower_bound=0, upper_bound=self._n_thetas-1)
@@ -697,10 +784,16 @@ class DoubleMLFramework():
 
         return df_ci
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def bootstrap(self, method='normal', n_rep_boot=500, chunk_size=None, random_state=None, n_jobs_boot=None):
         """
         Multiplier bootstrap for DoubleMLFrameworks.
 
+        For clustered data, the scores are aggregated on the cluster level and one multiplier weight is drawn per
+        cluster (for two-way clustering, per cluster of each cluster variable). As for the cluster-robust standard
+        errors of Chiang et al. (2021), the bootstrap variance is the sum of the cluster variances of both cluster
+        variables and does not subtract the variance of the intersection clusters (Cameron et al., 2011), which is of
+        lower order for the two-way clustering of Chiang et al. (2021).
+
         Parameters
         ----------
         method : str
@@ -710,24 +803,50 @@ class DoubleMLFramework():
         n_rep_boot : int
             The number of bootstrap replications.
 
+        chunk_size : None or int
+            The number of observations for which the multiplier weights are drawn at once. If not ``None``, the weights
+            are drawn for all repetitions simultaneously in chunks of observations, such that the memory requirement is
+            of order ``n_rep * n_rep_boot * chunk_size`` instead of ``n_rep_boot * n_obs``. Note that the bootstrap
+            distribution for a fixed seed then differs from the one with ``chunk_size=None``.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            Seed for the multiplier weights. If not ``None``, the weights are drawn with :class:`numpy.random.Generator`
+            objects, which are seeded via :meth:`numpy.random.SeedSequence.spawn` with one child seed per repetition
+            (and per chunk of observations). The bootstrap distribution is then reproducible and does not depend on
+            ``n_jobs_boot``. If ``None``, the global numpy random state is used.
+            Default is ``None``.
+
+        n_jobs_boot : None or int
+            The number of CPUs used to draw the bootstrap weights in parallel over repetitions (or chunks of
+            observations). ``None`` means ``1``. If ``random_state`` is ``None``, a seed is drawn from the global numpy
+            random state.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
 
-        _check_bootstrap(method, n_rep_boot)
-        if self._is_cluster_data:
-            raise NotImplementedError('bootstrap not yet implemented with clustering.')
+        _check_bootstrap(method, n_rep_boot, chunk_size, random_state, n_jobs_boot)
 
         self._n_rep_boot = n_rep_boot
         self._boot_method = method
-        # initialize bootstrap distribution array
-        self._boot_t_stat = np.full((n_rep_boot, self.n_thetas, self._n_rep), np.nan)
-        var_scaling = self._var_scaling_factors.reshape(-1, 1) * self._all_ses
-        for i_rep in range(self.n_rep):
-            weights = _draw_weights(method, n_rep_boot, self._n_obs)
-            bootstraped_scaled_psi = np.matmul(weights, np.divide(self._scaled_psi[:, :, i_rep], var_scaling[:, i_rep]))
-            self._boot_t_stat[:, :, i_rep] = bootstraped_scaled_psi
+        if self._is_cluster_data:
+            # cluster multiplier bootstrap: the scores are summed up within clusters and one weight is drawn per cluster
+            # (per cluster variable for two-way clustering); each bootstrap statistic is studentized with the
+            # corresponding cluster-robust standard deviation of the summed scores; for two-way clustering, the weights
+            # u_g(i) + v_h(i) give the variance V_G + V_H without the intersection term -V_GH (as in _var_est)
+            boot_psi = _cluster_psi_sums(self._scaled_psi, self._cluster_dict['cluster_vars'])
+            var_scaling = np.sqrt(np.sum(np.square(boot_psi), axis=0))
+        else:
+            boot_psi = self._scaled_psi
+            var_scaling = self._var_scaling_factors.reshape(-1, 1) * self._all_ses
+        self._boot_t_stat = _multiplier_bootstrap(method, n_rep_boot,
+                                                  np.divide(boot_psi, var_scaling),
+                                                  chunk_size=chunk_size,
+                                                  random_state=random_state,
+                                                  n_jobs=n_jobs_boot)
 
         return self
 
@@ -754,46 +873,36 @@ class DoubleMLFramework():
             raise TypeError('The p_adjust method must be of str type. '
                             f'{str(method)} of type {str(type(method))} was passed.')
 
-        all_p_vals_corrected = np.full_like(self.all_pvals, np.nan)
-
-        for i_rep in range(self.n_rep):
-            p_vals_tmp = self.all_pvals[:, i_rep]
-
-            if method.lower() in ['rw', 'romano-wolf']:
-                if self._boot_t_stat is None:
-                    raise ValueError(f'Apply bootstrap() before p_adjust("{method}").')
-
-                bootstrap_t_stats = self._boot_t_stat[:, :, i_rep]
-
-                p_init = np.full_like(p_vals_tmp, np.nan)
-                p_vals_corrected_tmp_sorted = np.full_like(p_vals_tmp, np.nan)
-
-                abs_t_stats_tmp = abs(self.all_t_stats[:, i_rep])
-                # sort in reverse order
-                stepdown_ind = np.argsort(abs_t_stats_tmp)[::-1]
-                # reversing the order of the sorted indices
-                ro = np.argsort(stepdown_ind)
-
-                for i_theta in range(self.n_thetas):
-                    bootstrap_citical_value = np.max(
-                        abs(np.delete(bootstrap_t_stats, stepdown_ind[:i_theta], axis=1)),
-                        axis=1)
-                    p_init[i_theta] = np.minimum(1, np.mean(bootstrap_citical_value >= abs_t_stats_tmp[stepdown_ind][i_theta]))
-
-                for i_theta in range(self.n_thetas):
-                    if i_theta == 0:
-                        p_vals_corrected_tmp_sorted[i_theta] = p_init[i_theta]
-                    else:
-                        p_vals_corrected_tmp_sorted[i_theta] = np.maximum(
-                            p_init[i_theta],
-                            p_vals_corrected_tmp_sorted[i_theta - 1])
-
-                # reorder p-values
-                p_vals_corrected_tmp = p_vals_corrected_tmp_sorted[ro]
-            else:
-                _, p_vals_corrected_tmp, _, _ = multipletests(p_vals_tmp, method=method)
-
-            all_p_vals_corrected[:, i_rep] = p_vals_corrected_tmp
+        if method.lower() in ['rw', 'romano-wolf']:
+            if self._boot_t_stat is None:
+                raise ValueError(f'Apply bootstrap() before p_adjust("{method}").')
+
+            # all arrays are handled for all repetitions at once (repetitions in the last dimension)
+            abs_t_stats = np.abs(self.all_t_stats)
+            # sort in reverse order
+            stepdown_ind = np.argsort(abs_t_stats, axis=0)[::-1, :]
+            # reversing the order of the sorted indices
+            ro = np.argsort(stepdown_ind, axis=0)
+
+            abs_t_stats_sorted = np.take_along_axis(abs_t_stats, stepdown_ind, axis=0)
+            abs_bootstrap_t_stats_sorted = np.take_along_axis(np.abs(self._boot_t_stat),
+                                                              stepdown_ind[np.newaxis, :, :], axis=1)
+            # the critical value in step i_theta is the maximum over the hypotheses i_theta, ..., n_thetas - 1
+            # (in stepdown order), i.e. the reverse cumulative maximum over the sorted columns
+            bootstrap_critical_values = np.flip(
+                np.maximum.accumulate(np.flip(abs_bootstrap_t_stats_sorted, axis=1), axis=1),
+                axis=1)
+            p_init = np.minimum(1, np.mean(bootstrap_critical_values >= abs_t_stats_sorted[np.newaxis, :, :], axis=0))
+            p_vals_corrected_sorted = np.maximum.accumulate(p_init, axis=0)
+
+            # reorder p-values
+            all_p_vals_corrected = np.take_along_axis(p_vals_corrected_sorted, ro, axis=0)
+        else:
+            # statsmodels is only imported if needed, as importing it considerably slows down `import doubleml`
+            from statsmodels.stats.multitest import multipletests
+            all_p_vals_corrected = np.full_like(self.all_pvals, np.nan)
+            for i_rep in range(self.n_rep):
+                _, all_p_vals_corrected[:, i_rep], _, _ = multipletests(self.all_pvals[:, i_rep], method=method)
 
         p_vals_corrected = np.median(all_p_vals_corrected, axis=1)
         df_p_vals = pd.DataFrame(
@@ -883,18 +992,15 @@ class DoubleMLFramework():
         cf_d_vec = np.linspace(0, grid_bounds[0], grid_size)
         cf_y_vec = np.linspace(0, grid_bounds[1], grid_size)
 
-        # compute contour values
-        contour_values = np.full(shape=(grid_size, grid_size), fill_value=np.nan)
-        for i_cf_d_grid, cf_d_grid in enumerate(cf_d_vec):
-            for i_cf_y_grid, cf_y_grid in enumerate(cf_y_vec):
-
-                sens_dict = self._calc_sensitivity_analysis(
-                    cf_y=cf_y_grid,
-                    cf_d=cf_d_grid,
-                    rho=rho,
-                    level=level,
-                )
-                contour_values[i_cf_d_grid, i_cf_y_grid] = sens_dict[value][bound][idx_treatment]
+        # compute contour values (rows correspond to cf_d and columns to cf_y)
+        cf_d_grid, cf_y_grid = np.meshgrid(cf_d_vec, cf_y_vec, indexing='ij')
+        sens_dict = self._calc_sensitivity_grid(
+            cf_y=cf_y_grid,
+            cf_d=cf_d_grid,
+            rho=rho,
+            level=level,
+        )
+        contour_values = sens_dict[value][bound][:, idx_treatment].reshape(grid_size, grid_size)
 
         # get the correct unadjusted value for confidence bands
         if value == 'theta':
@@ -910,17 +1016,14 @@ class DoubleMLFramework():
         # compute the values for the benchmarks
         benchmark_dict = copy.deepcopy(benchmarks)
         if benchmarks is not None:
-            n_benchmarks = len(benchmarks['name'])
-            benchmark_values = np.full(shape=(n_benchmarks,), fill_value=np.nan)
-            for benchmark_idx in range(len(benchmarks['name'])):
-                sens_dict_bench = self._calc_sensitivity_analysis(
-                    cf_y=benchmarks['cf_y'][benchmark_idx],
-                    cf_d=benchmarks['cf_d'][benchmark_idx],
-                    rho=self.sensitivity_params['input']['rho'],
-                    level=self.sensitivity_params['input']['level']
-                )
-                benchmark_values[benchmark_idx] = sens_dict_bench[value][bound][idx_treatment]
-            benchmark_dict['value'] = benchmark_values
+            sens_dict_bench = self._calc_sensitivity_grid(
+                cf_y=benchmarks['cf_y'],
+                cf_d=benchmarks['cf_d'],
+                rho=self.sensitivity_params['input']['rho'],
+                level=self.sensitivity_params['input']['level']
+            )
+            benchmark_dict['value'] = sens_dict_bench[value][bound][:, idx_treatment]
+        from .utils._plots import _sensitivity_contour_plot
         fig = _sensitivity_contour_plot(x=cf_d_vec,
                                         y=cf_y_vec,
                                         contour_values=contour_values,
@@ -5,7 +5,7 @@ import numpy as np
 import warnings
 
 from scipy.optimize import fmin_l_bfgs_b, root_scalar
-from .utils._estimation import _get_bracket_guess
+from .utils._estimation import _get_bracket_guess, _cluster_score_weights
 
 from abc import abstractmethod
 
@@ -55,12 +55,8 @@ class LinearScoreMixin:
             assert scaling_factor is not None
             assert inds is None
             # if we have clustered data and dml2 the solution is the root of a weighted sum
-            psi_a_subsample_mean = 0.
-            psi_b_subsample_mean = 0.
-            for i_fold, (_, test_index) in enumerate(smpls):
-                psi_a_subsample_mean += scaling_factor[i_fold] * np.sum(psi_a[test_index])
-                psi_b_subsample_mean += scaling_factor[i_fold] * np.sum(psi_b[test_index])
-            coef = -psi_b_subsample_mean / psi_a_subsample_mean
+            cluster_weights = _cluster_score_weights(smpls, scaling_factor, psi_a.shape[0])
+            coef = -np.dot(cluster_weights, psi_b) / np.dot(cluster_weights, psi_a)
 
         return coef
 
@@ -86,6 +82,8 @@ class NonLinearScoreMixin:
     _score_type = 'nonlinear'
     _coef_start_val = np.nan
     _coef_bounds = None
+    # the start value can be readjusted in _nuisance_est (e.g. DoubleMLPQ)
+    _nuisance_est_state = ['_coef_start_val']
 
     @property
     @abstractmethod
@@ -112,6 +110,8 @@ class NonLinearScoreMixin:
             assert smpls is not None
             assert scaling_factor is not None
             assert inds is None
+            n_obs = next(iter(psi_elements.values())).shape[0]
+            cluster_weights = _cluster_score_weights(smpls, scaling_factor, n_obs)
 
         # how to agregate the score and score derivative
         def _aggregate_obs(psi):
@@ -121,9 +121,7 @@ class NonLinearScoreMixin:
 
             # if we have clustered data the solution is the root of a weighted sum
             else:
-                psi_mean = 0.
-                for i_fold, (_, test_index) in enumerate(smpls):
-                    psi_mean += scaling_factor[i_fold] * np.sum(psi[test_index])
+                psi_mean = np.dot(cluster_weights, psi)
 
             return psi_mean
 
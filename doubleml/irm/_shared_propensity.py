@@ -0,0 +1,37 @@
+import numpy as np
+from sklearn.utils import check_X_y
+
+from ..utils._estimation import _dml_propensity_nested, _solve_ipw_quantiles
+
+
+class SharedPropensityMixin:
+    """Mixin class for the propensity models which :class:`doubleml.DoubleMLQTE` shares between the quantile models
+    (``share_ml_m=True``)
+
+    Notes
+    -----
+    The mixin class implements the shared propensity estimation for the propensity learner ``ml_m`` and the preliminary
+    inverse probability weighted quantiles for all quantiles based on the shared propensity. Models with further
+    propensity learners (e.g. :class:`doubleml.DoubleMLLPQ`) override :meth:`_shared_propensity_est` and
+    :meth:`_shared_ipw_weights`.
+    """
+
+    def _shared_propensity_est(self, smpls, i_rep, n_jobs_cv=None):
+        x, d = check_X_y(self._dml_data.x, self._dml_data.d, force_all_finite=False)
+        est_params = self._params['ml_m'][self._dml_data.d_cols[0]][i_rep]
+        return _dml_propensity_nested(self._learner['ml_m'], x, d, smpls, n_folds_prelim=self.n_folds, n_jobs=n_jobs_cv,
+                                      est_params=est_params)
+
+    def _shared_ipw_weights(self, shared_propensity, i_fold, train_inds_1):
+        d = self._dml_data.d
+        return self._compute_ipw_weights(d[train_inds_1], shared_propensity['preds_prelim'][i_fold].copy())
+
+    def _shared_ipw_est_quantiles(self, shared_propensity, quantiles):
+        # preliminary ipw estimates for all quantiles (shape (n_folds, n_quantiles)) based on the shared propensity
+        y = self._dml_data.y
+        n_folds = len(shared_propensity['train_inds_prelim'])
+        ipw_est = np.full(shape=(n_folds, len(quantiles)), fill_value=np.nan)
+        for i_fold, train_inds_1 in enumerate(shared_propensity['train_inds_prelim']):
+            ipw_weights = self._shared_ipw_weights(shared_propensity, i_fold, train_inds_1)
+            ipw_est[i_fold, :] = _solve_ipw_quantiles(y[train_inds_1], ipw_weights, quantiles)
+        return ipw_est
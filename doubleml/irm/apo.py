@@ -5,11 +5,9 @@ import warnings
 from sklearn.utils import check_X_y
 
 from ..double_ml import DoubleML
-
-from ..utils.blp import DoubleMLBLP
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune, _get_cond_smpls, _cond_targets, _trimm, \
+from ..utils._estimation import _dml_cv_predict_many, _dml_tune, _get_cond_smpls, _cond_targets, _trimm, \
     _normalize_ipw
 from ..utils._checks import _check_score, _check_trimming, _check_weights, _check_finite_predictions, \
     _check_is_propensity, _check_binary_predictions
@@ -214,6 +212,19 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         g1_external = external_predictions['ml_g1'] is not None
         m_external = external_predictions['ml_m'] is not None
 
+        # fit all folds of all nuisance models which are not provided externally in one parallel pool
+        nuisance_jobs = {}
+        if not g0_external:
+            nuisance_jobs['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0,
+                                      'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g']}
+        if not g1_external:
+            nuisance_jobs['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1,
+                                      'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g']}
+        if not m_external:
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': treated, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance g (g0 only relevant for sensitivity analysis)
         if g0_external:
             # use external predictions
@@ -221,9 +232,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
                       'targets': _cond_targets(y, cond_sample=(treated == 0)),
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = nuisance_res['ml_g0']
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             g_hat0['targets'] = _cond_targets(g_hat0['targets'], cond_sample=(treated == 0))
 
@@ -236,9 +245,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
                       'targets': _cond_targets(y, cond_sample=(treated == 1)),
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = nuisance_res['ml_g1']
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = _cond_targets(g_hat1['targets'], cond_sample=(treated == 1))
@@ -253,9 +260,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
                      'targets': treated,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, treated, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
 
@@ -423,6 +428,7 @@ class DoubleMLAPO(LinearScoreMixin, DoubleML):
         # define the orthogonal signal
         orth_signal = self.psi_elements['psi_b'].reshape(-1)
         # fit the best linear predictor
+        from ..utils.blp import DoubleMLBLP
         model = DoubleMLBLP(orth_signal, basis=basis, is_gate=is_gate)
         model.fit(**kwargs)
         return model
@@ -4,6 +4,7 @@ import copy
 from collections.abc import Iterable
 
 from sklearn.base import clone
+from sklearn.utils import check_X_y
 
 from joblib import Parallel, delayed
 
@@ -14,7 +15,9 @@ from ..double_ml_framework import concat
 
 from ..utils.resampling import DoubleMLResampling
 from ..utils._descriptive import generate_summary
-from ..utils._checks import _check_score, _check_trimming, _check_weights, _check_sample_splitting
+from ..utils._estimation import _fit
+from ..utils._checks import _check_score, _check_trimming, _check_weights, _check_sample_splitting, \
+    _check_benchmarking_sets
 from ..utils.gain_statistics import gain_statistics
 
 
@@ -85,6 +88,7 @@ class DoubleMLAPOS:
 
         # perform sample splitting
         self._smpls = None
+        self._shared_ml_m_models = None
         if draw_sample_splitting:
             self.draw_sample_splitting()
 
@@ -289,6 +293,14 @@ class DoubleMLAPOS:
         """
         return self._modellist
 
+    @property
+    def shared_ml_m_models(self):
+        """
+        The fitted multiclass propensity models for each repetition and fold after calling :meth:`fit` with
+        ``share_ml_m=True`` and ``store_models=True``.
+        """
+        return self._shared_ml_m_models
+
     @property
     def sensitivity_elements(self):
         """
@@ -345,7 +357,8 @@ class DoubleMLAPOS:
             sensitivity_summary = self._framework.sensitivity_summary
         return sensitivity_summary
 
-    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None):
+    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None,
+            share_ml_m=False):
         """
         Estimate DoubleMLAPOS models.
 
@@ -375,13 +388,43 @@ class DoubleMLAPOS:
             and ``'ml_m'``.
             Default is `None`.
 
+        share_ml_m : bool
+            Indicates whether a single multiclass propensity model ``ml_m`` is fitted per fold and repetition and shared
+            across all treatment levels. The predicted class probabilities of each level are passed to the corresponding
+            :class:`doubleml.DoubleMLAPO` model, such that the cost of the propensity estimation does not grow with the
+            number of treatment levels. External predictions for ``'ml_m'`` take precedence. The hyperparameters of
+            ``ml_m`` set for the models in ``modellist`` are used and have to coincide for all treatment levels. The
+            fitted propensity models are stored in ``shared_ml_m_models`` if ``store_models=True``.
+            Default is ``False``.
+
         Returns
         -------
         self : object
         """
 
+        if not isinstance(share_ml_m, bool):
+            raise TypeError('share_ml_m must be True or False. '
+                            f'Got {str(share_ml_m)}.')
+
         if external_predictions is not None:
             self._check_external_predictions(external_predictions)
+        else:
+            external_predictions = {}
+
+        self._shared_ml_m_models = None
+        if share_ml_m:
+            levels_m = [treatment_level for treatment_level in self.treatment_levels
+                        if 'ml_m' not in external_predictions.get(treatment_level, {})]
+            if len(levels_m) > 0:
+                m_hat, m_models = self._fit_shared_ml_m(levels_m, n_jobs_cv=n_jobs_cv)
+                external_predictions = {treatment_level: dict(external_predictions.get(treatment_level, {}))
+                                        for treatment_level in self.treatment_levels}
+                for i_level, treatment_level in enumerate(levels_m):
+                    external_predictions[treatment_level]['ml_m'] = m_hat[:, i_level, :]
+                if store_models:
+                    self._shared_ml_m_models = m_models
+
+        if len(external_predictions) > 0:
             ext_pred_dict = self._rename_external_predictions(external_predictions)
         else:
             ext_pred_dict = None
@@ -438,7 +481,7 @@ class DoubleMLAPOS:
 
         return df_ci
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def bootstrap(self, method='normal', n_rep_boot=500, chunk_size=None, random_state=None, n_jobs_boot=None):
         """
         Multiplier bootstrap for DoubleML models.
 
@@ -451,13 +494,28 @@ class DoubleMLAPOS:
         n_rep_boot : int
             The number of bootstrap replications.
 
+        chunk_size : None or int
+            The number of observations for which the multiplier weights are drawn at once (see
+            :meth:`doubleml.DoubleMLFramework.bootstrap`). Bounds the memory of the bootstrap for large samples.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            Seed for the multiplier weights (see :meth:`doubleml.DoubleMLFramework.bootstrap`). If ``None``, the global
+            numpy random state is used.
+            Default is ``None``.
+
+        n_jobs_boot : None or int
+            The number of CPUs used to draw the bootstrap weights in parallel. ``None`` means ``1``.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
         if self._framework is None:
             raise ValueError('Apply fit() before bootstrap().')
-        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot)
+        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot, chunk_size=chunk_size,
+                                  random_state=random_state, n_jobs_boot=n_jobs_boot)
 
         return self
 
@@ -581,45 +639,74 @@ class DoubleMLAPOS:
 
         return fig
 
-    def sensitivity_benchmark(self, benchmarking_set, fit_args=None):
+    def sensitivity_benchmark(self, benchmarking_set, fit_args=None, n_jobs_benchmark=None):
         """
         Computes a benchmark for a given set of features.
         Returns a DataFrame containing the corresponding values for cf_y, cf_d, rho and the change in estimates.
+
+        Parameters
+        ----------
+        benchmarking_set : list
+            The features which are omitted in the short model (list of str) or a list of several such benchmarking sets.
+            For each benchmarking set, an unfitted copy of the model without the corresponding features is fitted. The
+            copies share the data with the original model.
+
+        fit_args : dict or None
+            Additional arguments for the ``fit()`` method of the short models.
+            Default is ``None``.
+
+        n_jobs_benchmark : None or int
+            The number of CPUs used to fit the short models of several benchmarking sets in parallel.
+            ``None`` means ``1``.
+            Default is ``None``.
+
         Returns
         -------
         benchmark_results : pandas.DataFrame
-            Benchmark results.
+            Benchmark results. For several benchmarking sets, the results are combined with the benchmarking sets
+            (joined feature names) as first index level.
         """
         x_list_long = self._dml_data.x_cols
 
         # input checks
         if self.sensitivity_elements is None:
             raise NotImplementedError(f'Sensitivity analysis not yet implemented for {self.__class__.__name__}.')
-        if not isinstance(benchmarking_set, list):
-            raise TypeError('benchmarking_set must be a list. '
-                            f'{str(benchmarking_set)} of type {type(benchmarking_set)} was passed.')
-        if len(benchmarking_set) == 0:
-            raise ValueError('benchmarking_set must not be empty.')
-        if not set(benchmarking_set) <= set(x_list_long):
-            raise ValueError(f"benchmarking_set must be a subset of features {str(self._dml_data.x_cols)}. "
-                             f'{str(benchmarking_set)} was passed.')
+        benchmarking_sets = _check_benchmarking_sets(benchmarking_set, x_list_long)
         if fit_args is not None and not isinstance(fit_args, dict):
             raise TypeError('fit_args must be a dict. '
                             f'{str(fit_args)} of type {type(fit_args)} was passed.')
-
-        # refit short form of the model
-        x_list_short = [x for x in x_list_long if x not in benchmarking_set]
-        dml_short = copy.deepcopy(self)
-        dml_short._dml_data.x_cols = x_list_short
-        if fit_args is not None:
-            dml_short.fit(**fit_args)
-        else:
-            dml_short.fit()
-
-        benchmark_dict = gain_statistics(dml_long=self, dml_short=dml_short)
-        df_benchmark = pd.DataFrame(benchmark_dict, index=self.treatment_levels)
+        if n_jobs_benchmark is not None and not isinstance(n_jobs_benchmark, int):
+            raise TypeError('The number of CPUs used to fit the benchmarking sets must be of int type. '
+                            f'{str(n_jobs_benchmark)} of type {str(type(n_jobs_benchmark))} was passed.')
+        if fit_args is None:
+            fit_args = {}
+
+        # refit short forms of the model
+        short_models = []
+        for single_set in benchmarking_sets:
+            x_list_short = [x for x in x_list_long if x not in single_set]
+            short_models.append(self._lean_clone(self._dml_data._copy_with_x_cols(x_list_short)))
+        parallel = Parallel(n_jobs=n_jobs_benchmark, verbose=0, pre_dispatch='2*n_jobs')
+        short_models = parallel(delayed(dml_short.fit)(**fit_args) for dml_short in short_models)
+
+        df_benchmarks = [pd.DataFrame(gain_statistics(dml_long=self, dml_short=dml_short), index=self.treatment_levels)
+                         for dml_short in short_models]
+        if not all(isinstance(element, list) for element in benchmarking_set):
+            return df_benchmarks[0]
+        df_benchmark = pd.concat(df_benchmarks, keys=[', '.join(map(str, single_set)) for single_set in benchmarking_sets])
         return df_benchmark
 
+    def _lean_clone(self, dml_data):
+        # unfitted shallow copy of the model for the data object dml_data (e.g. with a reduced set of covariates); the
+        # models for the treatment levels are replaced by unfitted copies which share the learners and sample splits with
+        # the original models (the nuisance parameters are copied)
+        dml_clone = copy.copy(self)
+        dml_clone._dml_data = dml_data
+        dml_clone._framework = None
+        dml_clone._shared_ml_m_models = None
+        dml_clone._modellist = [model._lean_clone(dml_data) for model in self._modellist]
+        return dml_clone
+
     def draw_sample_splitting(self):
         """
         Draw sample splitting for DoubleML models.
@@ -647,7 +734,7 @@ class DoubleMLAPOS:
 
         Parameters
         ----------
-        all_smpls : list or tuple
+        all_smpls : list, tuple or :class:`numpy.ndarray`
             If nested list of lists of tuples:
                 The outer list needs to provide an entry per repeated sample splitting (length of list is set as
                 ``n_rep``).
@@ -660,6 +747,11 @@ class DoubleMLAPOS:
                 Must be a tuple with two elements train_ind and test_ind. Only viable option is to set
                 train_ind and test_ind to np.arange(n_obs), which corresponds to no sample splitting.
                 ``n_folds=1`` and ``n_rep=1`` is always set.
+            If :class:`numpy.ndarray`:
+                Integer array of shape ``(n_obs, n_rep)`` (or ``(n_obs,)`` for ``n_rep=1``) with the test fold
+                ``0, ..., n_folds - 1`` of every observation, e.g. from ``DoubleMLResampling.split_fold_ids()``. The
+                splits are then stored as compact int8 / int16 fold assignment and the (train_ind, test_ind) pairs are
+                derived on access. Not available for clustered data.
 
         Returns
         -------
@@ -755,6 +847,51 @@ class DoubleMLAPOS:
                   external_predictions=external_predictions)
         return model
 
+    def _fit_shared_ml_m(self, treatment_levels, n_jobs_cv=None):
+        x, d = check_X_y(self._dml_data.x, self._dml_data.d, force_all_finite=False)
+        est_params = self._shared_ml_m_params(treatment_levels)
+        fit_tasks = [(i_rep, i_fold, train_index) for i_rep in range(self.n_rep)
+                     for i_fold, (train_index, _) in enumerate(self.smpls[i_rep])]
+
+        # one multiclass model per fold and repetition, fitted in a single parallel pool
+        parallel = Parallel(n_jobs=n_jobs_cv, verbose=0, pre_dispatch='2*n_jobs')
+        fitted_models = parallel(delayed(_fit)(self._shared_ml_m_learner(est_params, i_rep, i_fold),
+                                               x, d, train_index, (i_rep, i_fold))
+                                 for (i_rep, i_fold, train_index) in fit_tasks)
+
+        m_hat = np.full((self._dml_data.n_obs, len(treatment_levels), self.n_rep), np.nan)
+        models = [[None] * len(smpls) for smpls in self.smpls]
+        for fitted_model, (i_rep, i_fold) in fitted_models:
+            classes = fitted_model.classes_
+            idx_levels = np.searchsorted(classes, treatment_levels)
+            idx_levels = np.minimum(idx_levels, len(classes) - 1)
+            if not np.all(classes[idx_levels] == treatment_levels):
+                raise ValueError('Not all treatment levels are present in the training data of fold '
+                                 f'{i_fold} in repetition {i_rep}. A shared propensity model requires '
+                                 'each treatment level to be observed in every training sample.')
+            test_index = self.smpls[i_rep][i_fold][1]
+            m_hat[test_index, :, i_rep] = fitted_model.predict_proba(x[test_index, :])[:, idx_levels]
+            models[i_rep][i_fold] = fitted_model
+
+        return m_hat, models
+
+    def _shared_ml_m_params(self, treatment_levels):
+        # the hyperparameters of ml_m (see set_ml_nuisance_params() of the models in modellist) have to coincide for all
+        # treatment levels which share the propensity model
+        d_col = self._dml_data.d_cols[0]
+        all_params = [self.modellist[self.treatment_levels.index(treatment_level)].params['ml_m'][d_col]
+                      for treatment_level in treatment_levels]
+        if not all(params == all_params[0] for params in all_params):
+            raise ValueError('A shared propensity model requires the same ml_m parameters for all treatment levels. '
+                             'Set the parameters of ml_m equally for all models in modellist or use share_ml_m=False.')
+        return all_params[0]
+
+    def _shared_ml_m_learner(self, est_params, i_rep, i_fold):
+        learner = clone(self._learner['ml_m'])
+        if est_params[i_rep] is not None:
+            learner.set_params(**est_params[i_rep][i_fold])
+        return learner
+
     def _check_treatment_levels(self, treatment_levels):
         is_iterable = isinstance(treatment_levels, Iterable)
         if not is_iterable:
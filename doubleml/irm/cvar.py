@@ -6,13 +6,15 @@ from sklearn.model_selection import StratifiedKFold, train_test_split
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import LinearScoreMixin
 from ..utils._estimation import _dml_cv_predict, _trimm, _predict_zero_one_propensity, \
-    _normalize_ipw, _dml_tune, _get_bracket_guess, _solve_ipw_score, _cond_targets
+    _normalize_ipw, _dml_tune, _solve_ipw_quantile, _cond_targets
+from ..utils._profiling import _profiler_context, _profile_step
 from ..double_ml_data import DoubleMLData
+from ._shared_propensity import SharedPropensityMixin
 from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, \
-    _check_contains_iv, _check_quantile
+    _check_contains_iv, _check_quantile, _check_ipw_solver
 
 
-class DoubleMLCVAR(LinearScoreMixin, DoubleML):
+class DoubleMLCVAR(SharedPropensityMixin, LinearScoreMixin, DoubleML):
     """Double machine learning for conditional value at risk for potential outcomes
 
     Parameters
@@ -65,6 +67,19 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         Indicates whether the sample splitting should be drawn during initialization of the object.
         Default is ``True``.
 
+    ipw_solver : str
+        A str (``'brent'`` or ``'exact'``) specifying how the preliminary inverse probability weighted quantile is
+        solved. ``'brent'`` minimizes the absolute ipw score with a Brent search. ``'exact'`` sorts the outcomes once
+        and returns the smallest outcome of the step of the weighted empirical cdf with the smallest absolute score.
+        The exact solution can differ from the Brent search, which may stop inside a step that does not minimize the
+        score, and with it the nuisance estimates.
+        Default is ``'brent'``.
+
+    Notes
+    -----
+    .. versionadded:: 0.10
+        The parameter ``ipw_solver``.
+
     Examples
     --------
     >>> import numpy as np
@@ -82,6 +97,11 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
     d  1.591441  0.095781  16.615498  5.382582e-62  1.403715  1.779167
     """
 
+    # the shared propensity predictions are set by DoubleMLQTE before the fit (and estimated with the same learner,
+    # data and sample splitting)
+    _fit_input = ['_shared_propensity', '_shared_ipw_est']
+    _fit_state = DoubleML._fit_state + _fit_input
+
     def __init__(self,
                  obj_dml_data,
                  ml_g,
@@ -94,7 +114,8 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
                  normalize_ipw=True,
                  trimming_rule='truncate',
                  trimming_threshold=1e-2,
-                 draw_sample_splitting=True):
+                 draw_sample_splitting=True,
+                 ipw_solver='brent'):
         super().__init__(obj_dml_data,
                          n_folds,
                          n_rep,
@@ -129,11 +150,16 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         self._trimming_rule = trimming_rule
         self._trimming_threshold = trimming_threshold
         _check_trimming(self._trimming_rule, self._trimming_threshold)
+        self._ipw_solver = ipw_solver
+        _check_ipw_solver(self._ipw_solver)
 
         _ = self._check_learner(ml_g, 'ml_g', regressor=True, classifier=False)
         _ = self._check_learner(ml_m, 'ml_m', regressor=False, classifier=True)
         self._learner = {'ml_g': clone(ml_g), 'ml_m': clone(ml_m)}
         self._predict_method = {'ml_g': 'predict', 'ml_m': 'predict_proba'}
+        # propensity predictions and preliminary ipw estimates shared across quantiles (set by DoubleMLQTE)
+        self._shared_propensity = None
+        self._shared_ipw_est = None
 
         self._initialize_ml_nuisance_params()
 
@@ -172,9 +198,21 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
         """
         return self._trimming_threshold
 
-    def _compute_ipw_score(self, theta, d, y, prop):
-        score = (d == self.treatment) / prop * (y <= theta) - self.quantile
-        return score
+    @property
+    def ipw_solver(self):
+        """
+        Specifies the solver of the preliminary inverse probability weighted quantile.
+        """
+        return self._ipw_solver
+
+    def _compute_ipw_weights(self, d, prop):
+        # weights of the ipw score mean(weights * (y <= theta)) - quantile based on the preliminary propensity
+        prop = _trimm(prop, self.trimming_rule, self.trimming_threshold)
+        if self._normalize_ipw:
+            prop = _normalize_ipw(prop, d)
+        if self.treatment == 0:
+            prop = 1 - prop
+        return (d == self.treatment) / prop
 
     def _score_elements(self, y, d, g_hat, m_hat, pq_est):
         # recalculate the target for g based on the pq_est
@@ -195,6 +233,8 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
                          force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d,
                          force_all_finite=False)
+        # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+        profiler = _profiler_context.get()
 
         # initialize nuisance predictions, targets and models
         g_hat = {'models': None,
@@ -217,6 +257,12 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             else:
                 fitted_models[learner] = [clone(self._learner[learner]) for i_fold in range(self.n_folds)]
 
+        m_shared = self._shared_propensity is not None
+        if m_shared:
+            shared_m_hat = self._shared_propensity[self._i_rep]
+            m_hat['preds'] = shared_m_hat['preds'].copy()
+            fitted_models['ml_m'] = shared_m_hat['models']
+
         ipw_vec = np.full(shape=self.n_folds, fill_value=np.nan)
         # caculate nuisance functions over different folds
         for i_fold in range(self.n_folds):
@@ -233,25 +279,22 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             y_train_1 = y[train_inds_1]
             x_train_1 = x[train_inds_1, :]
 
-            # get a copy of ml_m as a preliminary learner
-            ml_m_prelim = clone(fitted_models['ml_m'][i_fold])
-            m_hat_prelim = _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1,
-                                           method='predict_proba', smpls=smpls_prelim)['preds']
-
-            m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
-
-            if self._normalize_ipw:
-                m_hat_prelim = _normalize_ipw(m_hat_prelim, d_train_1)
-            if self.treatment == 0:
-                m_hat_prelim = 1 - m_hat_prelim
+            if m_shared:
+                m_hat_prelim = shared_m_hat['preds_prelim'][i_fold].copy()
+            else:
+                # get a copy of ml_m as a preliminary learner
+                ml_m_prelim = clone(fitted_models['ml_m'][i_fold])
+                m_hat_prelim = _dml_cv_predict(ml_m_prelim, x_train_1, d_train_1,
+                                               method='predict_proba', smpls=smpls_prelim,
+                                               learner_name='ml_m_prelim', outer_fold=i_fold)['preds']
 
             # preliminary ipw estimate
-            def ipw_score(theta):
-                res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
-                return res
-
-            _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+            if m_shared and (self._shared_ipw_est is not None):
+                ipw_est = self._shared_ipw_est[self._i_rep][i_fold]
+            else:
+                ipw_weights = self._compute_ipw_weights(d_train_1, m_hat_prelim)
+                ipw_est = _solve_ipw_quantile(y_train_1, ipw_weights, self.quantile, self.ipw_solver,
+                                              self._coef_start_val, self._coef_bounds)
             ipw_vec[i_fold] = ipw_est
 
             # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -268,15 +311,20 @@ class DoubleMLCVAR(LinearScoreMixin, DoubleML):
             # only consider values with the right treatment status and fit the model
             dx_treat_train_2 = x_train_2[d_train_2 == self.treatment, :]
             g_target_train_2_d = g_target_train_2[d_train_2 == self.treatment]
-            fitted_models['ml_g'][i_fold].fit(dx_treat_train_2, g_target_train_2_d)
+            with _profile_step(profiler, 'fit', learner='ml_g', fold=i_fold):
+                fitted_models['ml_g'][i_fold].fit(dx_treat_train_2, g_target_train_2_d)
 
             # predict nuisance values on the test data and the corresponding targets
-            g_hat['preds'][test_inds] = fitted_models['ml_g'][i_fold].predict(x_test)
+            with _profile_step(profiler, 'predict', learner='ml_g', fold=i_fold):
+                g_hat['preds'][test_inds] = fitted_models['ml_g'][i_fold].predict(x_test)
             g_hat['targets'][test_inds] = g_target[test_inds]
 
-            # refit the propensity score on the whole training set
-            fitted_models['ml_m'][i_fold].fit(x[train_inds, :], d[train_inds])
-            m_hat['preds'][test_inds] = _predict_zero_one_propensity(fitted_models['ml_m'][i_fold], x_test)
+            if not m_shared:
+                # refit the propensity score on the whole training set
+                with _profile_step(profiler, 'fit', learner='ml_m', fold=i_fold):
+                    fitted_models['ml_m'][i_fold].fit(x[train_inds, :], d[train_inds])
+                with _profile_step(profiler, 'predict', learner='ml_m', fold=i_fold):
+                    m_hat['preds'][test_inds] = _predict_zero_one_propensity(fitted_models['ml_m'][i_fold], x_test)
 
         # set target for propensity score
         m_hat['targets'] = d
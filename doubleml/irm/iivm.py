@@ -6,7 +6,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw
+from ..utils._estimation import _dml_cv_predict_many, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity, \
     _check_binary_predictions
 
@@ -250,15 +250,32 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
         # get train indices for z == 0 and z == 1
         smpls_z0, smpls_z1 = _get_cond_smpls(smpls, z)
 
+        # fit all folds of all nuisance models which are not provided externally in one parallel pool
+        nuisance_jobs = {}
+        if external_predictions['ml_g0'] is None:
+            nuisance_jobs['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_z0,
+                                      'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g']}
+        if external_predictions['ml_g1'] is None:
+            nuisance_jobs['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_z1,
+                                      'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g']}
+        if external_predictions['ml_m'] is None:
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': z, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        if self.subgroups['always_takers'] and (external_predictions['ml_r0'] is None):
+            nuisance_jobs['ml_r0'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls_z0,
+                                      'est_params': self._get_params('ml_r0'), 'method': self._predict_method['ml_r']}
+        if self.subgroups['never_takers'] and (external_predictions['ml_r1'] is None):
+            nuisance_jobs['ml_r1'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls_z1,
+                                      'est_params': self._get_params('ml_r1'), 'method': self._predict_method['ml_r']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance g
         if external_predictions['ml_g0'] is not None:
             g_hat0 = {'preds': external_predictions['ml_g0'],
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = nuisance_res['ml_g0']
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat0['targets'] = g_hat0['targets'].astype(float)
@@ -273,9 +290,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_z1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = nuisance_res['ml_g1']
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = g_hat1['targets'].astype(float)
@@ -291,9 +306,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -307,9 +320,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                           'targets': None,
                           'models': None}
             else:
-                r_hat0 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z0, n_jobs=n_jobs_cv,
-                                         est_params=self._get_params('ml_r0'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                r_hat0 = nuisance_res['ml_r0']
         else:
             r_hat0 = {'preds': np.zeros_like(d), 'targets': np.zeros_like(d), 'models': None}
         if not r0:
@@ -325,9 +336,7 @@ class DoubleMLIIVM(LinearScoreMixin, DoubleML):
                           'targets': None,
                           'models': None}
             else:
-                r_hat1 = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls_z1, n_jobs=n_jobs_cv,
-                                         est_params=self._get_params('ml_r1'), method=self._predict_method['ml_r'],
-                                         return_models=return_models)
+                r_hat1 = nuisance_res['ml_r1']
         else:
             r_hat1 = {'preds': np.ones_like(d), 'targets': np.ones_like(d), 'models': None}
         if not r1:
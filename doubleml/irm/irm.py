@@ -5,13 +5,10 @@ from sklearn.utils import check_X_y
 from sklearn.utils.multiclass import type_of_target
 
 from ..double_ml import DoubleML
-
-from ..utils.blp import DoubleMLBLP
-from ..utils.policytree import DoubleMLPolicyTree
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw, _cond_targets
+from ..utils._estimation import _dml_cv_predict_many, _get_cond_smpls, _dml_tune, _trimm, _normalize_ipw, _cond_targets
 from ..utils._checks import _check_score, _check_trimming, _check_finite_predictions, _check_is_propensity, _check_integer, \
     _check_weights, _check_binary_predictions
 
@@ -113,6 +110,9 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         \\theta_0 = \\mathbb{E}[g_0(1, X) - g_0(0,X) | D=1].
     """
+
+    _outcome_shared_learners = ['ml_m']
+
     def __init__(self,
                  obj_dml_data,
                  ml_g,
@@ -261,6 +261,19 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         g1_external = external_predictions['ml_g1'] is not None
         m_external = external_predictions['ml_m'] is not None
 
+        # fit all folds of all nuisance models which are not provided externally in one parallel pool
+        nuisance_jobs = {}
+        if not g0_external:
+            nuisance_jobs['ml_g0'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0,
+                                      'est_params': self._get_params('ml_g0'), 'method': self._predict_method['ml_g']}
+        if not g1_external:
+            nuisance_jobs['ml_g1'] = {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1,
+                                      'est_params': self._get_params('ml_g1'), 'method': self._predict_method['ml_g']}
+        if not m_external:
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance g
         if g0_external:
             # use external predictions
@@ -268,14 +281,12 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g0'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat0 = nuisance_res['ml_g0']
             _check_finite_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', smpls)
             g_hat0['targets'] = _cond_targets(g_hat0['targets'], cond_sample=(d == 0))
 
             if self._dml_data.binary_outcome:
-                _check_binary_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', self._dml_data.y_col)
+                _check_binary_predictions(g_hat0['preds'], self._learner['ml_g'], 'ml_g', self._dml_data._outcome_var)
 
         if g1_external:
             # use external predictions
@@ -283,15 +294,13 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                       'targets': None,
                       'models': None}
         else:
-            g_hat1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_g1'), method=self._predict_method['ml_g'],
-                                     return_models=return_models)
+            g_hat1 = nuisance_res['ml_g1']
             _check_finite_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', smpls)
             # adjust target values to consider only compatible subsamples
             g_hat1['targets'] = _cond_targets(g_hat1['targets'], cond_sample=(d == 1))
 
         if self._dml_data.binary_outcome & (self.score != 'ATTE'):
-            _check_binary_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', self._dml_data.y_col)
+            _check_binary_predictions(g_hat1['preds'], self._learner['ml_g'], 'ml_g', self._dml_data._outcome_var)
 
         # nuisance m
         if m_external:
@@ -300,9 +309,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
         # also trimm external predictions
@@ -458,6 +465,10 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             raise ValueError('Invalid score ' + self.score + '. ' +
                              'Valid score ' + ' or '.join(valid_score) + '.')
 
+        if self._dml_data.n_outcomes > 1:
+            raise NotImplementedError('Only implemented for single outcome. ' +
+                                      f'Number of outcomes is {str(self._dml_data.n_outcomes)}.')
+
         if self.n_rep != 1:
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
@@ -465,6 +476,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
         # define the orthogonal signal
         orth_signal = self.psi_elements['psi_b'].reshape(-1)
         # fit the best linear predictor
+        from ..utils.blp import DoubleMLBLP
         model = DoubleMLBLP(orth_signal, basis=basis, is_gate=is_gate)
         model.fit(**kwargs)
         return model
@@ -535,6 +547,10 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
             raise ValueError('Invalid score ' + self.score + '. ' +
                              'Valid score ' + ' or '.join(valid_score) + '.')
 
+        if self._dml_data.n_outcomes > 1:
+            raise NotImplementedError('Only implemented for single outcome. ' +
+                                      f'Number of outcomes is {str(self._dml_data.n_outcomes)}.')
+
         if self.n_rep != 1:
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
@@ -547,6 +563,7 @@ class DoubleMLIRM(LinearScoreMixin, DoubleML):
 
         orth_signal = self.psi_elements['psi_b'].reshape(-1)
 
+        from ..utils.policytree import DoubleMLPolicyTree
         model = DoubleMLPolicyTree(orth_signal, depth=depth, features=features, **tree_params).fit()
 
         return model
@@ -3,26 +3,29 @@ from sklearn.utils.multiclass import type_of_target
 from sklearn.base import clone
 from sklearn.utils import check_X_y
 from sklearn.model_selection import StratifiedKFold, train_test_split
+from joblib import Parallel, delayed
 
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import NonLinearScoreMixin
 from ..double_ml_data import DoubleMLData
+from ._shared_propensity import SharedPropensityMixin
 
 from ..utils._estimation import (
     _dml_cv_predict,
     _trimm,
     _predict_zero_one_propensity,
     _cond_targets,
-    _get_bracket_guess,
     _default_kde,
     _normalize_ipw,
     _dml_tune,
-    _solve_ipw_score,
+    _solve_ipw_quantile,
 )
-from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, _check_quantile
+from ..utils._profiling import _profiler_context, _profile_step
+from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_treatment, _check_quantile, \
+    _check_ipw_solver
 
 
-class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
+class DoubleMLLPQ(SharedPropensityMixin, NonLinearScoreMixin, DoubleML):
     """Double machine learning for local potential quantiles
 
     Parameters
@@ -67,7 +70,8 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
         Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        gaussian kernel and silverman for bandwidth determination. For large samples, the linear binning estimator
+        :func:`doubleml.utils.binned_kde` is considerably faster.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -81,6 +85,22 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         Indicates whether the sample splitting should be drawn during initialization of the object.
         Default is ``True``.
 
+    ipw_solver : str
+        A str (``'brent'`` or ``'exact'``) specifying how the preliminary inverse probability weighted quantile is
+        solved. ``'brent'`` minimizes the absolute ipw score with a Brent search. ``'exact'`` sorts the outcomes once
+        and returns the smallest outcome of the step of the weighted empirical cdf with the smallest absolute score.
+        The exact solution can differ from the Brent search, which may stop inside a step that does not minimize the
+        score (or, as the complier weights are signed, in a local minimum), and with it the nuisance estimates.
+        The Brent search of a repetition starts at the mean ipw quantile of the previous repetition, which is not
+        available for repetitions fitted in parallel with ``fit(n_jobs_rep=...)``; they start at the initial value
+        instead. Use ``'exact'`` for results which do not depend on ``n_jobs_rep``.
+        Default is ``'brent'``.
+
+    Notes
+    -----
+    .. versionadded:: 0.10
+        The parameter ``ipw_solver``.
+
     Examples
     --------
     >>> import numpy as np
@@ -98,6 +118,11 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
     d  0.217244  0.636453  0.341336  0.73285 -1.03018  1.464668
     """
 
+    # the shared propensity predictions are set by DoubleMLQTE before the fit (and estimated with the same learner,
+    # data and sample splitting)
+    _fit_input = ['_shared_propensity', '_shared_ipw_est']
+    _fit_state = DoubleML._fit_state + _fit_input
+
     def __init__(
         self,
         obj_dml_data,
@@ -113,6 +138,7 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         trimming_rule="truncate",
         trimming_threshold=1e-2,
         draw_sample_splitting=True,
+        ipw_solver="brent",
     ):
         super().__init__(obj_dml_data,
                          n_folds,
@@ -151,11 +177,16 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
             self.draw_sample_splitting()
 
         self._external_predictions_implemented = True
+        # propensity predictions and preliminary ipw estimates shared across quantiles (set by DoubleMLQTE)
+        self._shared_propensity = None
+        self._shared_ipw_est = None
 
         # initialize and check trimming
         self._trimming_rule = trimming_rule
         self._trimming_threshold = trimming_threshold
         _check_trimming(self._trimming_rule, self._trimming_threshold)
+        self._ipw_solver = ipw_solver
+        _check_ipw_solver(self._ipw_solver)
 
         _ = self._check_learner(ml_g, "ml_g", regressor=False, classifier=True)
         _ = self._check_learner(ml_m, "ml_m", regressor=False, classifier=True)
@@ -218,17 +249,34 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         """
         return self._trimming_threshold
 
+    @property
+    def ipw_solver(self):
+        """
+        Specifies the solver of the preliminary inverse probability weighted quantile.
+        """
+        return self._ipw_solver
+
     @property
     def _score_element_names(self):
         return ["ind_d", "m_z", "g_du_z0", "g_du_z1", "y", "z", "comp_prob"]
 
-    def _compute_ipw_score(self, theta, d, y, prop, z, comp_prob):
+    def _compute_ipw_weights(self, d, z, m_z_prop, m_d_z0_prop, m_d_z1_prop):
+        # weights of the ipw score mean(weights * (y <= theta)) - quantile based on the preliminary propensities
+        m_z_prop = _trimm(m_z_prop, self.trimming_rule, self.trimming_threshold)
+        if self._normalize_ipw:
+            m_z_prop = _normalize_ipw(m_z_prop, z)
+
+        # preliminary estimate of theta_2_aux
+        comp_prob = np.mean(
+            m_d_z1_prop
+            - m_d_z0_prop
+            + z / m_z_prop * (d - m_d_z1_prop)
+            - (1 - z) / (1 - m_z_prop) * (d - m_d_z0_prop)
+        )
+
         sign = 2 * self.treatment - 1.0
-        weights = sign * (z / prop - (1 - z) / (1 - prop)) / comp_prob
-        u = (d == self._treatment) * (y <= theta)
-        v = -1.0 * self.quantile
-        score = weights * u + v
-        return score
+        weights = sign * (z / m_z_prop - (1 - z) / (1 - m_z_prop)) / comp_prob
+        return weights * (d == self._treatment)
 
     def _compute_score(self, psi_elements, coef, inds=None):
         sign = 2 * self.treatment - 1.0
@@ -284,6 +332,8 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
         x, z = check_X_y(x, np.ravel(self._dml_data.z), force_all_finite=False)
+        # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+        profiler = _profiler_context.get()
 
         m_z = external_predictions["ml_m_z"] is not None
         m_d_d0 = external_predictions["ml_m_d_z0"] is not None
@@ -335,6 +385,15 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 else:
                     fitted_models[learner] = [clone(self._learner[learner]) for i_fold in range(self.n_folds)]
             ipw_vec = np.full(shape=self.n_folds, fill_value=np.nan)
+
+            m_shared = self._shared_propensity is not None
+            if m_shared:
+                shared_m_hat = self._shared_propensity[self._i_rep]
+                m_z_hat["preds"] = shared_m_hat["ml_m_z"]["preds"].copy()
+                m_d_z0_hat["preds"] = shared_m_hat["ml_m_d_z0"]["preds"].copy()
+                m_d_z1_hat["preds"] = shared_m_hat["ml_m_d_z1"]["preds"].copy()
+                for learner in ["ml_m_z", "ml_m_d_z0", "ml_m_d_z1"]:
+                    fitted_models[learner] = shared_m_hat[learner]["models"]
         elif any(ext_preds) and not any(ext_preds):
             raise ValueError("External predictions for all estimations or for none are required.")
         else:
@@ -384,50 +443,23 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 x_train_1 = x[train_inds_1, :]
                 z_train_1 = z[train_inds_1]
 
-                # preliminary propensity for z
-                ml_m_z_prelim = clone(fitted_models["ml_m_z"][i_fold])
-                m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
-                                                 method="predict_proba", smpls=smpls_prelim)[
-                    "preds"
-                ]
-
-                m_z_hat_prelim = _trimm(m_z_hat_prelim, self.trimming_rule, self.trimming_threshold)
-                if self._normalize_ipw:
-                    m_z_hat_prelim = _normalize_ipw(m_z_hat_prelim, z_train_1)
-
-                # propensity for d == 1 cond. on z == 0 (training set 1)
-                z0_train_1 = z_train_1 == 0
-                x_z0_train_1 = x_train_1[z0_train_1, :]
-                d_z0_train_1 = d_train_1[z0_train_1]
-                ml_m_d_z0_prelim = clone(fitted_models["ml_m_d_z0"][i_fold])
-                ml_m_d_z0_prelim.fit(x_z0_train_1, d_z0_train_1)
-                m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
-
-                # propensity for d == 1 cond. on z == 1 (training set 1)
-                z1_train_1 = z_train_1 == 1
-                x_z1_train_1 = x_train_1[z1_train_1, :]
-                d_z1_train_1 = d_train_1[z1_train_1]
-                ml_m_d_z1_prelim = clone(fitted_models["ml_m_d_z1"][i_fold])
-                ml_m_d_z1_prelim.fit(x_z1_train_1, d_z1_train_1)
-                m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
-
-                # preliminary estimate of theta_2_aux
-                comp_prob_prelim = np.mean(
-                    m_d_z1_hat_prelim
-                    - m_d_z0_hat_prelim
-                    + z_train_1 / m_z_hat_prelim * (d_train_1 - m_d_z1_hat_prelim)
-                    - (1 - z_train_1) / (1 - m_z_hat_prelim) * (d_train_1 - m_d_z0_hat_prelim)
-                )
-
-                # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(
-                        self._compute_ipw_score(theta, d_train_1, y_train_1, m_z_hat_prelim, z_train_1, comp_prob_prelim)
+                if m_shared:
+                    m_z_hat_prelim = shared_m_hat["ml_m_z"]["preds_prelim"][i_fold].copy()
+                    m_d_z0_hat_prelim = shared_m_hat["ml_m_d_z0"]["preds_prelim"][i_fold]
+                    m_d_z1_hat_prelim = shared_m_hat["ml_m_d_z1"]["preds_prelim"][i_fold]
+                else:
+                    m_z_hat_prelim, m_d_z0_hat_prelim, m_d_z1_hat_prelim = _lpq_propensity_prelim(
+                        fitted_models, i_fold, x_train_1, d_train_1, z_train_1, smpls_prelim
                     )
-                    return res
 
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+                # preliminary ipw estimate
+                if m_shared and (self._shared_ipw_est is not None):
+                    ipw_est = self._shared_ipw_est[self._i_rep][i_fold]
+                else:
+                    ipw_weights = self._compute_ipw_weights(d_train_1, z_train_1, m_z_hat_prelim,
+                                                            m_d_z0_hat_prelim, m_d_z1_hat_prelim)
+                    ipw_est = _solve_ipw_quantile(y_train_1, ipw_weights, self.quantile, self.ipw_solver,
+                                                  self._coef_start_val, self._coef_bounds)
                 ipw_vec[i_fold] = ipw_est
 
                 # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -446,15 +478,21 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                 z0_train_2 = z_train_2 == 0
                 x_z0_train_2 = x_train_2[z0_train_2, :]
                 du_z0_train_2 = (d_train_2[z0_train_2] == self._treatment) * (y_train_2[z0_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z0"][i_fold].fit(x_z0_train_2, du_z0_train_2)
-                g_du_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z0"][i_fold], x_test)
+                with _profile_step(profiler, "fit", learner="ml_g_du_z0", fold=i_fold):
+                    fitted_models["ml_g_du_z0"][i_fold].fit(x_z0_train_2, du_z0_train_2)
+                with _profile_step(profiler, "predict", learner="ml_g_du_z0", fold=i_fold):
+                    g_du_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z0"][i_fold],
+                                                                                   x_test)
 
                 # propensity for (D == treatment)*Ind(Y <= ipq_est) cond. on z == 1
                 z1_train_2 = z_train_2 == 1
                 x_z1_train_2 = x_train_2[z1_train_2, :]
                 du_z1_train_2 = (d_train_2[z1_train_2] == self._treatment) * (y_train_2[z1_train_2] <= ipw_est)
-                fitted_models["ml_g_du_z1"][i_fold].fit(x_z1_train_2, du_z1_train_2)
-                g_du_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z1"][i_fold], x_test)
+                with _profile_step(profiler, "fit", learner="ml_g_du_z1", fold=i_fold):
+                    fitted_models["ml_g_du_z1"][i_fold].fit(x_z1_train_2, du_z1_train_2)
+                with _profile_step(profiler, "predict", learner="ml_g_du_z1", fold=i_fold):
+                    g_du_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g_du_z1"][i_fold],
+                                                                                   x_test)
 
                 # the predictions of both should only be evaluated conditional on z == 0 or z == 1
                 test_inds_z0 = test_inds[z_test == 0]
@@ -466,27 +504,10 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
                     1.0 * (d_test[z_test == 1] == self._treatment) * (y_test[z_test == 1] <= ipw_est)
                 )
 
-                # refit nuisance elements for the local potential quantile
-                z_train = z[train_inds]
-                x_train = x[train_inds]
-                d_train = d[train_inds]
-
-                # refit propensity for z (whole training set)
-                fitted_models["ml_m_z"][i_fold].fit(x_train, z_train)
-                m_z_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_z"][i_fold], x_test)
-
-                # refit propensity for d == 1 cond. on z == 0 (whole training set)
-                z0_train = z_train == 0
-                x_z0_train = x_train[z0_train, :]
-                d_z0_train = d_train[z0_train]
-                fitted_models["ml_m_d_z0"][i_fold].fit(x_z0_train, d_z0_train)
-                m_d_z0_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z0"][i_fold], x_test)
-
-                # propensity for d == 1 cond. on z == 1 (whole training set)
-                x_z1_train = x_train[z_train == 1, :]
-                d_z1_train = d_train[z_train == 1]
-                fitted_models["ml_m_d_z1"][i_fold].fit(x_z1_train, d_z1_train)
-                m_d_z1_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m_d_z1"][i_fold], x_test)
+                if not m_shared:
+                    # refit nuisance elements for the local potential quantile
+                    m_z_hat["preds"][test_inds], m_d_z0_hat["preds"][test_inds], m_d_z1_hat["preds"][test_inds] = \
+                        _lpq_propensity_refit(fitted_models, i_fold, x[train_inds], d[train_inds], z[train_inds], x_test)
 
         # save targets and models
         m_z_hat["targets"] = z
@@ -558,6 +579,46 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
         }
         return psi_elements, preds
 
+    def _shared_propensity_est(self, smpls, i_rep, n_jobs_cv=None):
+        x, d = check_X_y(self._dml_data.x, self._dml_data.d, force_all_finite=False)
+        x, z = check_X_y(x, np.ravel(self._dml_data.z), force_all_finite=False)
+        strata = self._dml_data.d.reshape(-1, 1) + 2 * self._dml_data.z.reshape(-1, 1)
+        learners = {learner: self._learner[learner] for learner in ["ml_m_z", "ml_m_d_z0", "ml_m_d_z1"]}
+
+        # set the (fold-specific) nuisance model parameters
+        fold_learners = [dict() for _ in smpls]
+        for learner, estimator in learners.items():
+            est_params = self._params[learner][self._dml_data.d_cols[0]][i_rep]
+            for i_fold in range(len(smpls)):
+                fold_learners[i_fold][learner] = clone(estimator)
+                if est_params is not None:
+                    fold_learners[i_fold][learner].set_params(**est_params[i_fold])
+
+        parallel = Parallel(n_jobs=n_jobs_cv, verbose=0, pre_dispatch="2*n_jobs")
+        fold_res = parallel(delayed(_lpq_propensity_fold)(
+            fold_learners[i_fold], x, d, z, strata, train_inds, test_inds, self.n_folds)
+                            for i_fold, (train_inds, test_inds) in enumerate(smpls))
+
+        res = {learner: {"preds": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
+                         "preds_prelim": [None] * len(smpls),
+                         "models": [None] * len(smpls)}
+               for learner in learners.keys()}
+        for i_fold, ((_, test_inds), (_, preds_prelim, preds, fitted_models)) in enumerate(zip(smpls, fold_res)):
+            for i_learner, learner in enumerate(learners.keys()):
+                res[learner]["preds"][test_inds] = preds[i_learner]
+                res[learner]["preds_prelim"][i_fold] = preds_prelim[i_learner]
+                res[learner]["models"][i_fold] = fitted_models[learner]
+        res["train_inds_prelim"] = [train_inds_1 for train_inds_1, _, _, _ in fold_res]
+        return res
+
+    def _shared_ipw_weights(self, shared_propensity, i_fold, train_inds_1):
+        d = self._dml_data.d
+        z = np.ravel(self._dml_data.z)
+        return self._compute_ipw_weights(d[train_inds_1], z[train_inds_1],
+                                         shared_propensity["ml_m_z"]["preds_prelim"][i_fold].copy(),
+                                         shared_propensity["ml_m_d_z0"]["preds_prelim"][i_fold],
+                                         shared_propensity["ml_m_d_z1"]["preds_prelim"][i_fold])
+
     def _nuisance_tuning(
         self, smpls, param_grids, scoring_methods, n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search
     ):
@@ -685,3 +746,78 @@ class DoubleMLLPQ(NonLinearScoreMixin, DoubleML):
 
     def _sensitivity_element_est(self, preds):
         pass
+
+
+def _lpq_propensity_prelim(fitted_models, i_fold, x_train_1, d_train_1, z_train_1, smpls_prelim):
+    # preliminary propensity for z
+    ml_m_z_prelim = clone(fitted_models["ml_m_z"][i_fold])
+    m_z_hat_prelim = _dml_cv_predict(ml_m_z_prelim, x_train_1, z_train_1,
+                                     method="predict_proba", smpls=smpls_prelim,
+                                     learner_name="ml_m_z_prelim", outer_fold=i_fold)[
+        "preds"
+    ]
+
+    # propensity for d == 1 cond. on z == 0 (training set 1)
+    z0_train_1 = z_train_1 == 0
+    x_z0_train_1 = x_train_1[z0_train_1, :]
+    d_z0_train_1 = d_train_1[z0_train_1]
+    ml_m_d_z0_prelim = clone(fitted_models["ml_m_d_z0"][i_fold])
+    ml_m_d_z0_prelim.fit(x_z0_train_1, d_z0_train_1)
+    m_d_z0_hat_prelim = _predict_zero_one_propensity(ml_m_d_z0_prelim, x_train_1)
+
+    # propensity for d == 1 cond. on z == 1 (training set 1)
+    z1_train_1 = z_train_1 == 1
+    x_z1_train_1 = x_train_1[z1_train_1, :]
+    d_z1_train_1 = d_train_1[z1_train_1]
+    ml_m_d_z1_prelim = clone(fitted_models["ml_m_d_z1"][i_fold])
+    ml_m_d_z1_prelim.fit(x_z1_train_1, d_z1_train_1)
+    m_d_z1_hat_prelim = _predict_zero_one_propensity(ml_m_d_z1_prelim, x_train_1)
+
+    return m_z_hat_prelim, m_d_z0_hat_prelim, m_d_z1_hat_prelim
+
+
+def _lpq_propensity_refit(fitted_models, i_fold, x_train, d_train, z_train, x_test):
+    # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+    profiler = _profiler_context.get()
+
+    # refit propensity for z (whole training set)
+    with _profile_step(profiler, "fit", learner="ml_m_z", fold=i_fold):
+        fitted_models["ml_m_z"][i_fold].fit(x_train, z_train)
+    with _profile_step(profiler, "predict", learner="ml_m_z", fold=i_fold):
+        m_z_hat = _predict_zero_one_propensity(fitted_models["ml_m_z"][i_fold], x_test)
+
+    # refit propensity for d == 1 cond. on z == 0 (whole training set)
+    z0_train = z_train == 0
+    x_z0_train = x_train[z0_train, :]
+    d_z0_train = d_train[z0_train]
+    with _profile_step(profiler, "fit", learner="ml_m_d_z0", fold=i_fold):
+        fitted_models["ml_m_d_z0"][i_fold].fit(x_z0_train, d_z0_train)
+    with _profile_step(profiler, "predict", learner="ml_m_d_z0", fold=i_fold):
+        m_d_z0_hat = _predict_zero_one_propensity(fitted_models["ml_m_d_z0"][i_fold], x_test)
+
+    # propensity for d == 1 cond. on z == 1 (whole training set)
+    x_z1_train = x_train[z_train == 1, :]
+    d_z1_train = d_train[z_train == 1]
+    with _profile_step(profiler, "fit", learner="ml_m_d_z1", fold=i_fold):
+        fitted_models["ml_m_d_z1"][i_fold].fit(x_z1_train, d_z1_train)
+    with _profile_step(profiler, "predict", learner="ml_m_d_z1", fold=i_fold):
+        m_d_z1_hat = _predict_zero_one_propensity(fitted_models["ml_m_d_z1"][i_fold], x_test)
+
+    return m_z_hat, m_d_z0_hat, m_d_z1_hat
+
+
+def _lpq_propensity_fold(learners, x, d, z, strata, train_inds, test_inds, n_folds_prelim):
+    # propensity nuisance elements of the local potential quantile for a single fold, which do not depend on the
+    # quantile or treatment level and can be shared across models
+    train_inds_1, _ = train_test_split(
+        train_inds, test_size=0.5, random_state=42, stratify=strata[train_inds]
+    )
+    smpls_prelim = [
+        (train, test)
+        for train, test in StratifiedKFold(n_splits=n_folds_prelim).split(X=train_inds_1, y=strata[train_inds_1])
+    ]
+    fitted_models = {learner: [clone(estimator)] for learner, estimator in learners.items()}
+    preds_prelim = _lpq_propensity_prelim(fitted_models, 0, x[train_inds_1, :], d[train_inds_1], z[train_inds_1],
+                                          smpls_prelim)
+    preds = _lpq_propensity_refit(fitted_models, 0, x[train_inds], d[train_inds], z[train_inds], x[test_inds, :])
+    return train_inds_1, preds_prelim, preds, {learner: models[0] for learner, models in fitted_models.items()}
@@ -6,18 +6,19 @@ from sklearn.model_selection import StratifiedKFold, train_test_split
 from ..double_ml import DoubleML
 from ..double_ml_score_mixins import NonLinearScoreMixin
 from ..double_ml_data import DoubleMLData
+from ._shared_propensity import SharedPropensityMixin
 
 from ..utils._estimation import (
     _dml_cv_predict,
     _trimm,
     _predict_zero_one_propensity,
-    _get_bracket_guess,
     _default_kde,
     _normalize_ipw,
     _dml_tune,
-    _solve_ipw_score,
+    _solve_ipw_quantile,
     _cond_targets,
 )
+from ..utils._profiling import _profiler_context, _profile_step
 from ..utils._checks import (
     _check_score,
     _check_trimming,
@@ -25,10 +26,11 @@ from ..utils._checks import (
     _check_treatment,
     _check_contains_iv,
     _check_quantile,
+    _check_ipw_solver,
 )
 
 
-class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
+class DoubleMLPQ(SharedPropensityMixin, NonLinearScoreMixin, DoubleML):
     """Double machine learning for potential quantiles
 
     Parameters
@@ -74,7 +76,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
         Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        gaussian kernel and silverman for bandwidth determination. For large samples, the linear binning estimator
+        :func:`doubleml.utils.binned_kde` is considerably faster.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -88,6 +91,22 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         Indicates whether the sample splitting should be drawn during initialization of the object.
         Default is ``True``.
 
+    ipw_solver : str
+        A str (``'brent'`` or ``'exact'``) specifying how the preliminary inverse probability weighted quantile is
+        solved. ``'brent'`` minimizes the absolute ipw score with a Brent search. ``'exact'`` sorts the outcomes once
+        and returns the smallest outcome of the step of the weighted empirical cdf with the smallest absolute score.
+        The exact solution can differ from the Brent search, which may stop inside a step that does not minimize the
+        score, and with it the nuisance estimates.
+        The Brent search of a repetition starts at the mean ipw quantile of the previous repetition, which is not
+        available for repetitions fitted in parallel with ``fit(n_jobs_rep=...)``; they start at the initial value
+        instead. Use ``'exact'`` for results which do not depend on ``n_jobs_rep``.
+        Default is ``'brent'``.
+
+    Notes
+    -----
+    .. versionadded:: 0.10
+        The parameter ``ipw_solver``.
+
     Examples
     --------
     >>> import numpy as np
@@ -105,6 +124,11 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
     d  0.553878  0.149858  3.696011  0.000219  0.260161  0.847595
     """
 
+    # the shared propensity predictions are set by DoubleMLQTE before the fit (and estimated with the same learner,
+    # data and sample splitting)
+    _fit_input = ['_shared_propensity', '_shared_ipw_est']
+    _fit_state = DoubleML._fit_state + _fit_input
+
     def __init__(self,
                  obj_dml_data,
                  ml_g,
@@ -118,7 +142,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                  kde=None,
                  trimming_rule='truncate',
                  trimming_threshold=1e-2,
-                 draw_sample_splitting=True):
+                 draw_sample_splitting=True,
+                 ipw_solver="brent"):
         super().__init__(obj_dml_data,
                          n_folds,
                          n_rep,
@@ -158,11 +183,16 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
             self.draw_sample_splitting()
 
         self._external_predictions_implemented = True
+        # propensity predictions and preliminary ipw estimates shared across quantiles (set by DoubleMLQTE)
+        self._shared_propensity = None
+        self._shared_ipw_est = None
 
         # initialize and check trimming
         self._trimming_rule = trimming_rule
         self._trimming_threshold = trimming_threshold
         _check_trimming(self._trimming_rule, self._trimming_threshold)
+        self._ipw_solver = ipw_solver
+        _check_ipw_solver(self._ipw_solver)
 
         _ = self._check_learner(ml_g, "ml_g", regressor=False, classifier=True)
         _ = self._check_learner(ml_m, "ml_m", regressor=False, classifier=True)
@@ -213,13 +243,25 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
         """
         return self._trimming_threshold
 
+    @property
+    def ipw_solver(self):
+        """
+        Specifies the solver of the preliminary inverse probability weighted quantile.
+        """
+        return self._ipw_solver
+
     @property
     def _score_element_names(self):
         return ["ind_d", "g", "m", "y"]
 
-    def _compute_ipw_score(self, theta, d, y, prop):
-        score = (d == self.treatment) / prop * (y <= theta) - self.quantile
-        return score
+    def _compute_ipw_weights(self, d, prop):
+        # weights of the ipw score mean(weights * (y <= theta)) - quantile based on the preliminary propensity
+        prop = _trimm(prop, self.trimming_rule, self.trimming_threshold)
+        if self._normalize_ipw:
+            prop = _normalize_ipw(prop, d)
+        if self.treatment == 0:
+            prop = 1 - prop
+        return (d == self.treatment) / prop
 
     def _compute_score(self, psi_elements, coef, inds=None):
         ind_d = psi_elements["ind_d"]
@@ -259,6 +301,8 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
     def _nuisance_est(self, smpls, n_jobs_cv, external_predictions, return_models=False):
         x, y = check_X_y(self._dml_data.x, self._dml_data.y, force_all_finite=False)
         x, d = check_X_y(x, self._dml_data.d, force_all_finite=False)
+        # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+        profiler = _profiler_context.get()
 
         g_external = external_predictions["ml_g"] is not None
         m_external = external_predictions["ml_m"] is not None
@@ -302,6 +346,11 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                 "targets": np.full(shape=self._dml_data.n_obs, fill_value=np.nan),
                 "preds": external_predictions["ml_m"],
             }
+        m_shared = (self._shared_propensity is not None) and not m_external
+        if m_shared:
+            shared_m_hat = self._shared_propensity[self._i_rep]
+            m_hat["preds"] = shared_m_hat["preds"].copy()
+            fitted_models["ml_m"] = shared_m_hat["models"]
 
         # caculate nuisance functions over different folds
         if not all([g_external, m_external]):
@@ -322,27 +371,25 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                 y_train_1 = y[train_inds_1]
                 x_train_1 = x[train_inds_1, :]
 
-                if not m_external:
+                if m_shared:
+                    m_hat_prelim = shared_m_hat["preds_prelim"][i_fold].copy()
+                elif not m_external:
                     # get a copy of ml_m as a preliminary learner
                     ml_m_prelim = clone(fitted_models["ml_m"][i_fold])
                     m_hat_prelim = _dml_cv_predict(
-                        ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim
+                        ml_m_prelim, x_train_1, d_train_1, method="predict_proba", smpls=smpls_prelim,
+                        learner_name="ml_m_prelim", outer_fold=i_fold
                     )["preds"]
                 else:
                     m_hat_prelim = m_hat["preds"][np.concatenate([test for _, test in smpls_prelim])]
-                m_hat_prelim = _trimm(m_hat_prelim, self.trimming_rule, self.trimming_threshold)
-                if self._normalize_ipw:
-                    m_hat_prelim = _normalize_ipw(m_hat_prelim, d_train_1)
-                if self.treatment == 0:
-                    m_hat_prelim = 1 - m_hat_prelim
 
                 # preliminary ipw estimate
-                def ipw_score(theta):
-                    res = np.mean(self._compute_ipw_score(theta, d_train_1, y_train_1, m_hat_prelim))
-                    return res
-
-                _, bracket_guess = _get_bracket_guess(ipw_score, self._coef_start_val, self._coef_bounds)
-                ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+                if m_shared and (self._shared_ipw_est is not None):
+                    ipw_est = self._shared_ipw_est[self._i_rep][i_fold]
+                else:
+                    ipw_weights = self._compute_ipw_weights(d_train_1, m_hat_prelim)
+                    ipw_est = _solve_ipw_quantile(y_train_1, ipw_weights, self.quantile, self.ipw_solver,
+                                                  self._coef_start_val, self._coef_bounds)
                 ipw_vec[i_fold] = ipw_est
 
                 # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -354,15 +401,21 @@ class DoubleMLPQ(NonLinearScoreMixin, DoubleML):
                 y_treat_train_2 = y_train_2[d_train_2 == self.treatment]
 
                 if not g_external:
-                    fitted_models["ml_g"][i_fold].fit(dx_treat_train_2, y_treat_train_2 <= ipw_est)
+                    with _profile_step(profiler, "fit", learner="ml_g", fold=i_fold):
+                        fitted_models["ml_g"][i_fold].fit(dx_treat_train_2, y_treat_train_2 <= ipw_est)
 
                     # predict nuisance values on the test data and the corresponding targets
-                    g_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g"][i_fold], x[test_inds, :])
+                    with _profile_step(profiler, "predict", learner="ml_g", fold=i_fold):
+                        g_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_g"][i_fold],
+                                                                                 x[test_inds, :])
                     g_hat["targets"][test_inds] = y[test_inds] <= ipw_est
-                if not m_external:
+                if not (m_external or m_shared):
                     # refit the propensity score on the whole training set
-                    fitted_models["ml_m"][i_fold].fit(x[train_inds, :], d[train_inds])
-                    m_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m"][i_fold], x[test_inds, :])
+                    with _profile_step(profiler, "fit", learner="ml_m", fold=i_fold):
+                        fitted_models["ml_m"][i_fold].fit(x[train_inds, :], d[train_inds])
+                    with _profile_step(profiler, "predict", learner="ml_m", fold=i_fold):
+                        m_hat["preds"][test_inds] = _predict_zero_one_propensity(fitted_models["ml_m"][i_fold],
+                                                                                 x[test_inds, :])
 
         # set target for propensity score
         m_hat["targets"] = d
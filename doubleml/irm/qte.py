@@ -13,7 +13,8 @@ from ..double_ml_framework import concat
 
 from ..utils._estimation import _default_kde
 from ..utils.resampling import DoubleMLResampling
-from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_sample_splitting
+from ..utils._checks import _check_score, _check_trimming, _check_zero_one_treatment, _check_sample_splitting, \
+    _check_ipw_solver
 
 from ..utils._descriptive import generate_summary
 
@@ -58,7 +59,8 @@ class DoubleMLQTE:
         A callable object / function with signature ``deriv = kde(u, weights)`` for weighted kernel density estimation.
         Here ``deriv`` should evaluate the density in ``0``.
         Default is ``'None'``, which uses :py:class:`statsmodels.nonparametric.kde.KDEUnivariate` with a
-        gaussian kernel and silverman for bandwidth determination.
+        gaussian kernel and silverman for bandwidth determination. For large samples, the linear binning estimator
+        :func:`doubleml.utils.binned_kde` is considerably faster.
 
     trimming_rule : str
         A str (``'truncate'`` is the only choice) specifying the trimming approach.
@@ -72,6 +74,17 @@ class DoubleMLQTE:
         Indicates whether the sample splitting should be drawn during initialization of the object.
         Default is ``True``.
 
+    ipw_solver : str
+        A str (``'brent'`` or ``'exact'``) specifying how the preliminary inverse probability weighted quantiles of the
+        underlying models are solved (see :class:`doubleml.DoubleMLPQ`). With ``'exact'`` and ``share_ml_m=True`` in
+        :meth:`fit`, the preliminary quantiles are solved for the whole quantile grid at once.
+        Default is ``'brent'``.
+
+    Notes
+    -----
+    .. versionadded:: 0.10
+        The parameter ``ipw_solver``.
+
     Examples
     --------
     >>> import numpy as np
@@ -102,7 +115,8 @@ class DoubleMLQTE:
                  kde=None,
                  trimming_rule='truncate',
                  trimming_threshold=1e-2,
-                 draw_sample_splitting=True):
+                 draw_sample_splitting=True,
+                 ipw_solver='brent'):
 
         self._dml_data = obj_dml_data
         self._quantiles = np.asarray(quantiles).reshape((-1, ))
@@ -140,6 +154,9 @@ class DoubleMLQTE:
         self._trimming_threshold = trimming_threshold
         _check_trimming(self._trimming_rule, self._trimming_threshold)
 
+        self._ipw_solver = ipw_solver
+        _check_ipw_solver(self._ipw_solver)
+
         if not isinstance(self.normalize_ipw, bool):
             raise TypeError('Normalization indicator has to be boolean. ' +
                             f'Object of type {str(type(self.normalize_ipw))} passed.')
@@ -265,6 +282,13 @@ class DoubleMLQTE:
         """
         return self._trimming_threshold
 
+    @property
+    def ipw_solver(self):
+        """
+        Specifies the solver of the preliminary inverse probability weighted quantiles.
+        """
+        return self._ipw_solver
+
     @property
     def coef(self):
         """
@@ -366,7 +390,8 @@ class DoubleMLQTE:
                                           self.pval, ci, self.quantiles)
         return df_summary
 
-    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None):
+    def fit(self, n_jobs_models=None, n_jobs_cv=None, store_predictions=True, store_models=False, external_predictions=None,
+            share_ml_m=False):
         """
         Estimate DoubleMLQTE models.
 
@@ -390,6 +415,15 @@ class DoubleMLQTE:
             to analyze the fitted models or extract information like variable importance.
             Default is ``False``.
 
+        share_ml_m : bool
+            Indicates whether the propensity nuisance functions (including the preliminary propensity estimates of the
+            nested cross-fitting) are estimated only once per fold and repetition and shared across all quantiles and
+            both treatment levels. With ``ipw_solver='exact'``, the preliminary ipw estimates are then obtained for the
+            whole quantile grid at once. Then, the computational cost only grows with the number of quantiles through
+            ``ml_g``. The hyperparameters of the propensity learners set for the models in ``modellist_0`` and
+            ``modellist_1`` are used and have to coincide for all quantiles and treatment levels.
+            Default is ``False``.
+
         Returns
         -------
         self : object
@@ -398,9 +432,31 @@ class DoubleMLQTE:
         if external_predictions is not None:
             raise NotImplementedError(f"External predictions not implemented for {self.__class__.__name__}.")
 
+        if not isinstance(share_ml_m, bool):
+            raise TypeError('share_ml_m must be True or False. '
+                            f'Got {str(share_ml_m)}.')
+
+        if share_ml_m:
+            self._check_shared_ml_m_params()
+            # the propensity nuisance does not depend on the quantile or the treatment level
+            shared_propensity = [self.modellist_0[0]._shared_propensity_est(self.smpls[i_rep], i_rep, n_jobs_cv=n_jobs_cv)
+                                 for i_rep in range(self.n_rep)]
+            if self.ipw_solver == 'exact':
+                # preliminary ipw estimates for the whole quantile grid (shape (n_rep, n_folds, n_quantiles))
+                shared_ipw_est = [np.stack([model._shared_ipw_est_quantiles(shared_propensity[i_rep], self.quantiles)
+                                            for i_rep in range(self.n_rep)])
+                                  for model in [self.modellist_0[0], self.modellist_1[0]]]
+            else:
+                # the brent search is started at the quantile-specific start value of each model
+                shared_ipw_est = None
+        else:
+            shared_propensity = None
+            shared_ipw_est = None
+
         # parallel estimation of the quantiles
         parallel = Parallel(n_jobs=n_jobs_models, verbose=0, pre_dispatch='2*n_jobs')
-        fitted_models = parallel(delayed(self._fit_quantile)(i_quant, n_jobs_cv, store_predictions, store_models)
+        fitted_models = parallel(delayed(self._fit_quantile)(i_quant, n_jobs_cv, store_predictions, store_models,
+                                                             shared_propensity, shared_ipw_est)
                                  for i_quant in range(self.n_quantiles))
 
         # combine the estimates and scores
@@ -420,7 +476,7 @@ class DoubleMLQTE:
 
         return self
 
-    def bootstrap(self, method='normal', n_rep_boot=500):
+    def bootstrap(self, method='normal', n_rep_boot=500, chunk_size=None, random_state=None, n_jobs_boot=None):
         """
         Multiplier bootstrap for DoubleML models.
 
@@ -433,13 +489,28 @@ class DoubleMLQTE:
         n_rep_boot : int
             The number of bootstrap replications.
 
+        chunk_size : None or int
+            The number of observations for which the multiplier weights are drawn at once (see
+            :meth:`doubleml.DoubleMLFramework.bootstrap`). Bounds the memory of the bootstrap for large samples.
+            Default is ``None``.
+
+        random_state : None, int or :class:`numpy.random.SeedSequence`
+            Seed for the multiplier weights (see :meth:`doubleml.DoubleMLFramework.bootstrap`). If ``None``, the global
+            numpy random state is used.
+            Default is ``None``.
+
+        n_jobs_boot : None or int
+            The number of CPUs used to draw the bootstrap weights in parallel. ``None`` means ``1``.
+            Default is ``None``.
+
         Returns
         -------
         self : object
         """
         if self._framework is None:
             raise ValueError('Apply fit() before bootstrap().')
-        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot)
+        self._framework.bootstrap(method=method, n_rep_boot=n_rep_boot, chunk_size=chunk_size,
+                                  random_state=random_state, n_jobs_boot=n_jobs_boot)
 
         return self
 
@@ -472,7 +543,7 @@ class DoubleMLQTE:
 
         Parameters
         ----------
-        all_smpls : list or tuple
+        all_smpls : list, tuple or :class:`numpy.ndarray`
             If nested list of lists of tuples:
                 The outer list needs to provide an entry per repeated sample splitting (length of list is set as
                 ``n_rep``).
@@ -485,6 +556,11 @@ class DoubleMLQTE:
                 Must be a tuple with two elements train_ind and test_ind. Only viable option is to set
                 train_ind and test_ind to np.arange(n_obs), which corresponds to no sample splitting.
                 ``n_folds=1`` and ``n_rep=1`` is always set.
+            If :class:`numpy.ndarray`:
+                Integer array of shape ``(n_obs, n_rep)`` (or ``(n_obs,)`` for ``n_rep=1``) with the test fold
+                ``0, ..., n_folds - 1`` of every observation, e.g. from ``DoubleMLResampling.split_fold_ids()``. The
+                splits are then stored as compact int8 / int16 fold assignment and the (train_ind, test_ind) pairs are
+                derived on access. Not available for clustered data.
 
         all_smpls_cluster : list or None
             Nested list or ``None``. The first level of nesting corresponds to the number of repetitions. The second level
@@ -584,16 +660,37 @@ class DoubleMLQTE:
 
         return p_val
 
-    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False):
+    def _fit_quantile(self, i_quant, n_jobs_cv=None, store_predictions=True, store_models=False, shared_propensity=None,
+                      shared_ipw_est=None):
 
         model_0 = self.modellist_0[i_quant]
         model_1 = self.modellist_1[i_quant]
 
-        model_0.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
-        model_1.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
+        for i_treat, model in enumerate([model_0, model_1]):
+            model._shared_propensity = shared_propensity
+            if shared_ipw_est is not None:
+                model._shared_ipw_est = shared_ipw_est[i_treat][:, :, i_quant]
+            try:
+                model.fit(n_jobs_cv=n_jobs_cv, store_predictions=store_predictions, store_models=store_models)
+            finally:
+                model._shared_propensity = None
+                model._shared_ipw_est = None
 
         return model_0, model_1
 
+    def _check_shared_ml_m_params(self):
+        # the hyperparameters of the propensity learners (see set_ml_nuisance_params() of the models in modellist_0 and
+        # modellist_1) have to coincide for all quantiles and treatment levels which share the propensity models
+        all_models = self.modellist_0 + self.modellist_1
+        d_col = self._dml_data.d_cols[0]
+        m_learners = [learner for learner in all_models[0].params_names if learner.startswith('ml_m')]
+        for learner in m_learners:
+            all_params = [model.params[learner][d_col] for model in all_models]
+            if not all(params == all_params[0] for params in all_params):
+                raise ValueError('A shared propensity model requires the same parameters of '
+                                 f'{learner} for all quantiles and treatment levels. Set the parameters of {learner} '
+                                 'equally for all models in modellist_0 and modellist_1 or use share_ml_m=False.')
+
     def _check_data(self, obj_dml_data):
         if not isinstance(obj_dml_data, DoubleMLData):
             raise TypeError('The data must be of DoubleMLData type. '
@@ -618,7 +715,8 @@ class DoubleMLQTE:
             'trimming_rule': self.trimming_rule,
             'trimming_threshold': self.trimming_threshold,
             'normalize_ipw': self.normalize_ipw,
-            'draw_sample_splitting': False
+            'draw_sample_splitting': False,
+            'ipw_solver': self.ipw_solver
         }
         for i_quant in range(self.n_quantiles):
 
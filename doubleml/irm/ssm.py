@@ -9,7 +9,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..utils._estimation import (
     _trimm,
-    _dml_cv_predict,
+    _dml_cv_predict_many,
     _dml_tune,
     _get_cond_smpls_2d,
     _predict_zero_one_propensity)
@@ -220,29 +220,34 @@ class DoubleMLSSM(LinearScoreMixin, DoubleML):
         _, smpls_d0_s1, _, smpls_d1_s1 = _get_cond_smpls_2d(smpls, d, s)
 
         if self._score == 'missing-at-random':
-            pi_hat = _dml_cv_predict(self._learner['ml_pi'], dx, s, smpls=smpls, n_jobs=n_jobs_cv,
-                                     est_params=self._get_params('ml_pi'), method=self._predict_method['ml_pi'],
-                                     return_models=return_models)
+            # fit all folds of all nuisance models in one parallel pool
+            nuisance_jobs = {
+                'ml_pi': {'estimator': self._learner['ml_pi'], 'x': dx, 'y': s, 'smpls': smpls,
+                          'est_params': self._get_params('ml_pi'), 'method': self._predict_method['ml_pi']},
+                'ml_m': {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                         'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']},
+                'ml_g_d1': {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d1_s1,
+                            'est_params': self._get_params('ml_g_d1'), 'method': self._predict_method['ml_g']},
+                'ml_g_d0': {'estimator': self._learner['ml_g'], 'x': x, 'y': y, 'smpls': smpls_d0_s1,
+                            'est_params': self._get_params('ml_g_d0'), 'method': self._predict_method['ml_g']},
+            }
+            nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
+            pi_hat = nuisance_res['ml_pi']
             pi_hat['targets'] = pi_hat['targets'].astype(float)
             _check_finite_predictions(pi_hat['preds'], self._learner['ml_pi'], 'ml_pi', smpls)
 
             # propensity score m
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             m_hat['targets'] = m_hat['targets'].astype(float)
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
             # conditional outcome
-            g_hat_d1 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d1_s1, n_jobs=n_jobs_cv,
-                                       est_params=self._get_params('ml_g_d1'), method=self._predict_method['ml_g'],
-                                       return_models=return_models)
+            g_hat_d1 = nuisance_res['ml_g_d1']
             g_hat_d1['targets'] = g_hat_d1['targets'].astype(float)
             _check_finite_predictions(g_hat_d1['preds'], self._learner['ml_g'], 'ml_g_d1', smpls)
 
-            g_hat_d0 = _dml_cv_predict(self._learner['ml_g'], x, y, smpls=smpls_d0_s1, n_jobs=n_jobs_cv,
-                                       est_params=self._get_params('ml_g_d0'), method=self._predict_method['ml_g'],
-                                       return_models=return_models)
+            g_hat_d0 = nuisance_res['ml_g_d0']
             g_hat_d0['targets'] = g_hat_d0['targets'].astype(float)
             _check_finite_predictions(g_hat_d0['preds'], self._learner['ml_g'], 'ml_g_d0', smpls)
 
@@ -8,7 +8,7 @@ from ...utils._estimation import _dml_cv_predict, _normalize_ipw, _get_bracket_g
 
 def fit_cvar(y, x, d, quantile,
              learner_g, learner_m, all_smpls, treatment, normalize_ipw=True, n_rep=1,
-             trimming_threshold=1e-2, g_params=None, m_params=None):
+             trimming_threshold=1e-2, g_params=None, m_params=None, ipw_solver='brent'):
     n_obs = len(y)
 
     cvars = np.zeros(n_rep)
@@ -21,7 +21,8 @@ def fit_cvar(y, x, d, quantile,
                                                   learner_g, learner_m, smpls, treatment,
                                                   normalize_ipw=normalize_ipw,
                                                   trimming_threshold=trimming_threshold,
-                                                  g_params=g_params, m_params=m_params)
+                                                  g_params=g_params, m_params=m_params,
+                                                  ipw_solver=ipw_solver)
 
         cvars[i_rep], ses[i_rep] = cvar_dml2(y, d, g_hat, m_hat, treatment, quantile, ipw_est)
 
@@ -35,7 +36,7 @@ def fit_cvar(y, x, d, quantile,
 
 
 def fit_nuisance_cvar(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
-                      normalize_ipw, trimming_threshold, g_params, m_params):
+                      normalize_ipw, trimming_threshold, g_params, m_params, ipw_solver='brent'):
     n_folds = len(smpls)
     n_obs = len(y)
     coef_bounds = (y.min(), y.max())
@@ -96,8 +97,14 @@ def fit_nuisance_cvar(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
             res = np.mean((d_train_1 == treatment) * (y_train_1 <= theta) / m_hat_prelim - quantile)
             return res
 
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        if ipw_solver == 'brent':
+            _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
+            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        else:
+            # the ipw score is a step function, evaluate all candidates
+            ipw_candidates = np.unique(y_train_1)
+            ipw_scores = np.array([ipw_score(theta) for theta in ipw_candidates])
+            ipw_est = ipw_candidates[np.argmin(np.abs(ipw_scores))]
         ipw_vec[i_fold] = ipw_est
 
         # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -14,7 +14,7 @@ def fit_lpq(y, x, d, z, quantile,
             kde=_default_kde,
             normalize_ipw=True, m_z_params=None,
             m_d_z0_params=None, m_d_z1_params=None,
-            g_du_z0_params=None, g_du_z1_params=None):
+            g_du_z0_params=None, g_du_z1_params=None, ipw_solver='brent'):
     n_obs = len(y)
 
     lpqs = np.zeros(n_rep)
@@ -34,7 +34,8 @@ def fit_lpq(y, x, d, z, quantile,
                                                                    m_d_z0_params=m_d_z0_params,
                                                                    m_d_z1_params=m_d_z1_params,
                                                                    g_du_z0_params=g_du_z0_params,
-                                                                   g_du_z1_params=g_du_z1_params)
+                                                                   g_du_z1_params=g_du_z1_params,
+                                                                   ipw_solver=ipw_solver)
 
         lpqs[i_rep], ses[i_rep] = lpq_dml2(y, d, z, m_z_hat, g_du_z0_hat, g_du_z1_hat, comp_prob_hat,
                                            treatment, quantile, ipw_vec, coef_bounds, kde)
@@ -50,7 +51,7 @@ def fit_lpq(y, x, d, z, quantile,
 
 def fit_nuisance_lpq(y, x, d, z, quantile, learner_g, learner_m, smpls, treatment,
                      trimming_rule, trimming_threshold, normalize_ipw, m_z_params,
-                     m_d_z0_params, m_d_z1_params, g_du_z0_params, g_du_z1_params):
+                     m_d_z0_params, m_d_z1_params, g_du_z0_params, g_du_z1_params, ipw_solver='brent'):
     n_folds = len(smpls)
     n_obs = len(y)
     # initialize starting values and bounds
@@ -137,8 +138,14 @@ def fit_nuisance_lpq(y, x, d, z, quantile, learner_g, learner_m, smpls, treatmen
             res = np.mean(weights * u + v)
             return res
 
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        if ipw_solver == 'brent':
+            _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
+            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        else:
+            # the ipw score is a step function, evaluate all candidates
+            ipw_candidates = np.unique(y_train_1)
+            ipw_scores = np.array([ipw_score(theta) for theta in ipw_candidates])
+            ipw_est = ipw_candidates[np.argmin(np.abs(ipw_scores))]
         ipw_vec[i_fold] = ipw_est
 
         # use the preliminary estimates to fit the nuisance parameters on train_2
@@ -9,7 +9,7 @@ from ...utils._estimation import _dml_cv_predict, _default_kde, _normalize_ipw,
 
 def fit_pq(y, x, d, quantile,
            learner_g, learner_m, all_smpls, treatment, n_rep=1,
-           trimming_threshold=1e-2, normalize_ipw=True, g_params=None, m_params=None):
+           trimming_threshold=1e-2, normalize_ipw=True, g_params=None, m_params=None, ipw_solver='brent'):
     n_obs = len(y)
 
     pqs = np.zeros(n_rep)
@@ -22,7 +22,8 @@ def fit_pq(y, x, d, quantile,
                                                 learner_g, learner_m, smpls, treatment,
                                                 trimming_threshold=trimming_threshold,
                                                 normalize_ipw=normalize_ipw,
-                                                g_params=g_params, m_params=m_params)
+                                                g_params=g_params, m_params=m_params,
+                                                ipw_solver=ipw_solver)
 
         pqs[i_rep], ses[i_rep] = pq_dml2(y, d, g_hat, m_hat, treatment, quantile, ipw_est)
 
@@ -36,7 +37,7 @@ def fit_pq(y, x, d, quantile,
 
 
 def fit_nuisance_pq(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
-                    trimming_threshold, normalize_ipw, g_params, m_params):
+                    trimming_threshold, normalize_ipw, g_params, m_params, ipw_solver='brent'):
     n_folds = len(smpls)
     n_obs = len(y)
     # initialize starting values and bounds
@@ -87,8 +88,14 @@ def fit_nuisance_pq(y, x, d, quantile, learner_g, learner_m, smpls, treatment,
             res = np.mean((d_train_1 == treatment) * (y_train_1 <= theta) / m_hat_prelim - quantile)
             return res
 
-        _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
-        ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        if ipw_solver == 'brent':
+            _, bracket_guess = _get_bracket_guess(ipw_score, coef_start_val, coef_bounds)
+            ipw_est = _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+        else:
+            # the ipw score is a step function, evaluate all candidates
+            ipw_candidates = np.unique(y_train_1)
+            ipw_scores = np.array([ipw_score(theta) for theta in ipw_candidates])
+            ipw_est = ipw_candidates[np.argmin(np.abs(ipw_scores))]
 
         ipw_vec[i_fold] = ipw_est
 
@@ -0,0 +1,164 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from sklearn.base import clone
+from sklearn.linear_model import LinearRegression, LogisticRegression
+from doubleml import DoubleMLAPOS, DoubleMLData
+from doubleml.datasets import make_irm_data_discrete_treatments
+
+from ...tests._utils import draw_smpls
+
+
+@pytest.fixture(scope="module", params=[1, 3])
+def n_rep(request):
+    return request.param
+
+
+@pytest.fixture(scope="module", params=[[0, 1, 2, 3], [1, 3]])
+def treatment_levels(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def doubleml_apos_shared_fixture(n_rep, treatment_levels):
+    np.random.seed(3141)
+    n_obs = 500
+    data_apo = make_irm_data_discrete_treatments(n_obs=n_obs)
+    df_apo = pd.DataFrame(
+        np.column_stack((data_apo['y'], data_apo['d'], data_apo['x'])),
+        columns=['y', 'd'] + ['x' + str(i) for i in range(data_apo['x'].shape[1])]
+    )
+
+    dml_data = DoubleMLData(df_apo, 'y', 'd')
+    d = data_apo['d']
+    x = data_apo['x']
+    all_smpls = draw_smpls(n_obs, n_folds=5, n_rep=n_rep, groups=d)
+    ml_m = LogisticRegression(max_iter=1000)
+
+    dml_obj = DoubleMLAPOS(dml_data, ml_g=LinearRegression(), ml_m=ml_m, treatment_levels=treatment_levels,
+                           n_rep=n_rep, draw_sample_splitting=False)
+    dml_obj.set_sample_splitting(all_smpls=all_smpls)
+    dml_obj.fit(share_ml_m=True, store_models=True)
+
+    # manual multiclass propensity predictions passed as external predictions
+    m_hat = np.full((n_obs, len(treatment_levels), n_rep), np.nan)
+    for i_rep, smpls in enumerate(all_smpls):
+        for train_index, test_index in smpls:
+            model = clone(ml_m).fit(x[train_index, :], d[train_index])
+            idx_levels = np.searchsorted(model.classes_, treatment_levels)
+            m_hat[test_index, :, i_rep] = model.predict_proba(x[test_index, :])[:, idx_levels]
+    ext_predictions = {treatment_level: {'ml_m': m_hat[:, i_level, :]}
+                       for i_level, treatment_level in enumerate(treatment_levels)}
+
+    dml_obj_ext = DoubleMLAPOS(dml_data, ml_g=LinearRegression(), ml_m=ml_m, treatment_levels=treatment_levels,
+                               n_rep=n_rep, draw_sample_splitting=False)
+    dml_obj_ext.set_sample_splitting(all_smpls=all_smpls)
+    dml_obj_ext.fit(external_predictions=ext_predictions)
+
+    res_dict = {
+        'coef': dml_obj.coef,
+        'coef_ext': dml_obj_ext.coef,
+        'se': dml_obj.se,
+        'se_ext': dml_obj_ext.se,
+        'm_hat': np.stack([model.predictions['ml_m'][:, :, 0] for model in dml_obj.modellist], axis=1),
+        'm_hat_ext': np.stack([model.predictions['ml_m'][:, :, 0] for model in dml_obj_ext.modellist], axis=1),
+        'shared_models': dml_obj.shared_ml_m_models,
+        'modellist': dml_obj.modellist,
+        'n_rep': n_rep,
+    }
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_coef(doubleml_apos_shared_fixture):
+    assert np.allclose(doubleml_apos_shared_fixture['coef'],
+                       doubleml_apos_shared_fixture['coef_ext'],
+                       rtol=1e-9, atol=1e-4)
+    assert np.allclose(doubleml_apos_shared_fixture['se'],
+                       doubleml_apos_shared_fixture['se_ext'],
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_predictions(doubleml_apos_shared_fixture):
+    assert np.allclose(doubleml_apos_shared_fixture['m_hat'],
+                       doubleml_apos_shared_fixture['m_hat_ext'],
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_models(doubleml_apos_shared_fixture):
+    shared_models = doubleml_apos_shared_fixture['shared_models']
+    assert len(shared_models) == doubleml_apos_shared_fixture['n_rep']
+    for rep_models in shared_models:
+        assert len(rep_models) == 5
+        assert all(isinstance(model, LogisticRegression) for model in rep_models)
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_exceptions():
+    np.random.seed(3141)
+    data_apo = make_irm_data_discrete_treatments(n_obs=200)
+    df_apo = pd.DataFrame(
+        np.column_stack((data_apo['y'], data_apo['d'], data_apo['x'])),
+        columns=['y', 'd'] + ['x' + str(i) for i in range(data_apo['x'].shape[1])]
+    )
+    dml_data = DoubleMLData(df_apo, 'y', 'd')
+    dml_obj = DoubleMLAPOS(dml_data, ml_g=LinearRegression(), ml_m=LogisticRegression(), treatment_levels=[0, 1])
+
+    msg = 'share_ml_m must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(share_ml_m=1)
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_nuisance_loss(doubleml_apos_shared_fixture):
+    for model in doubleml_apos_shared_fixture['modellist']:
+        assert np.array_equal(model.nuisance_targets['ml_m'][:, :, 0],
+                              np.tile(model.treated.reshape(-1, 1), (1, doubleml_apos_shared_fixture['n_rep'])))
+        assert np.all(np.isfinite(model.nuisance_loss['ml_m']))
+
+
+@pytest.mark.ci
+def test_apos_shared_ml_m_params():
+    np.random.seed(3141)
+    n_obs = 300
+    n_rep = 2
+    treatment_levels = [0, 1, 2]
+    data_apo = make_irm_data_discrete_treatments(n_obs=n_obs)
+    df_apo = pd.DataFrame(
+        np.column_stack((data_apo['y'], data_apo['d'], data_apo['x'])),
+        columns=['y', 'd'] + ['x' + str(i) for i in range(data_apo['x'].shape[1])]
+    )
+    dml_data = DoubleMLData(df_apo, 'y', 'd')
+    d = data_apo['d']
+    x = data_apo['x']
+    all_smpls = draw_smpls(n_obs, n_folds=3, n_rep=n_rep, groups=d)
+    ml_m = LogisticRegression(max_iter=1000)
+    # fold-specific parameters for the first and the same parameters for all folds for the second repetition
+    params = [[{'C': 0.01}, {'C': 0.1}, {'C': 1.0}], {'C': 0.05}]
+
+    dml_obj = DoubleMLAPOS(dml_data, ml_g=LinearRegression(), ml_m=ml_m, treatment_levels=treatment_levels,
+                           n_rep=n_rep, draw_sample_splitting=False)
+    dml_obj.set_sample_splitting(all_smpls=all_smpls)
+    for model in dml_obj.modellist:
+        model.set_ml_nuisance_params('ml_m', 'd', [params[0], [params[1]] * 3])
+    dml_obj.fit(share_ml_m=True)
+
+    m_hat = np.full((n_obs, len(treatment_levels), n_rep), np.nan)
+    for i_rep, smpls in enumerate(all_smpls):
+        for i_fold, (train_index, test_index) in enumerate(smpls):
+            fold_params = params[0][i_fold] if i_rep == 0 else params[1]
+            model = clone(ml_m).set_params(**fold_params).fit(x[train_index, :], d[train_index])
+            idx_levels = np.searchsorted(model.classes_, treatment_levels)
+            m_hat[test_index, :, i_rep] = model.predict_proba(x[test_index, :])[:, idx_levels]
+    m_hat_shared = np.stack([model.predictions['ml_m'][:, :, 0] for model in dml_obj.modellist], axis=1)
+    assert np.allclose(m_hat_shared, m_hat, rtol=1e-9, atol=1e-4)
+
+    # unequal parameters for the treatment levels
+    dml_obj.modellist[0].set_ml_nuisance_params('ml_m', 'd', {'C': 2.0})
+    msg = 'A shared propensity model requires the same ml_m parameters for all treatment levels.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.fit(share_ml_m=True)
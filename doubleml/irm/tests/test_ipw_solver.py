@@ -0,0 +1,180 @@
+import numpy as np
+import pytest
+import math
+
+import doubleml as dml
+
+from sklearn.base import clone
+from sklearn.linear_model import LogisticRegression, LinearRegression
+
+from ...tests._utils import draw_smpls
+from ._utils_pq_manual import fit_pq
+from ._utils_lpq_manual import fit_lpq
+from ._utils_cvar_manual import fit_cvar
+from ...utils._estimation import _default_kde
+
+
+@pytest.fixture(scope='module',
+                params=[0, 1])
+def treatment(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[0.25, 0.75])
+def quantile(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def normalize_ipw(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def dml_pq_exact_fixture(generate_data_quantiles, treatment, quantile, normalize_ipw):
+    n_folds = 3
+    learner = LogisticRegression()
+
+    (x, y, d) = generate_data_quantiles
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    np.random.seed(42)
+    all_smpls = draw_smpls(len(y), n_folds, n_rep=1, groups=d)
+
+    dml_pq_obj = dml.DoubleMLPQ(obj_dml_data, clone(learner), clone(learner),
+                                treatment=treatment, quantile=quantile,
+                                n_folds=n_folds, normalize_ipw=normalize_ipw,
+                                draw_sample_splitting=False, ipw_solver='exact')
+    dml_pq_obj.set_sample_splitting(all_smpls=all_smpls)
+    np.random.seed(42)
+    dml_pq_obj.fit()
+
+    np.random.seed(42)
+    res_manual = fit_pq(y, x, d, quantile, clone(learner), clone(learner),
+                        all_smpls, treatment, n_rep=1,
+                        normalize_ipw=normalize_ipw, ipw_solver='exact')
+
+    res_dict = {'coef': dml_pq_obj.coef[0],
+                'coef_manual': res_manual['pq'],
+                'se': dml_pq_obj.se[0],
+                'se_manual': res_manual['se']}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_pq_exact_coef(dml_pq_exact_fixture):
+    assert math.isclose(dml_pq_exact_fixture['coef'],
+                        dml_pq_exact_fixture['coef_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_pq_exact_se(dml_pq_exact_fixture):
+    assert math.isclose(dml_pq_exact_fixture['se'],
+                        dml_pq_exact_fixture['se_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.fixture(scope="module")
+def dml_lpq_exact_fixture(generate_data_local_quantiles, treatment, quantile, normalize_ipw):
+    n_folds = 3
+    learner = LogisticRegression()
+
+    (x, y, d, z) = generate_data_local_quantiles
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d, z)
+    np.random.seed(42)
+    all_smpls = draw_smpls(len(y), n_folds, n_rep=1, groups=d + 2 * z)
+
+    dml_lpq_obj = dml.DoubleMLLPQ(obj_dml_data, clone(learner), clone(learner),
+                                  treatment=treatment, quantile=quantile,
+                                  n_folds=n_folds, normalize_ipw=normalize_ipw,
+                                  trimming_threshold=0.05,
+                                  draw_sample_splitting=False, ipw_solver='exact')
+    dml_lpq_obj.set_sample_splitting(all_smpls=all_smpls)
+    dml_lpq_obj.fit()
+
+    np.random.seed(42)
+    res_manual = fit_lpq(y, x, d, z, quantile, clone(learner), clone(learner),
+                         all_smpls, treatment, n_rep=1, kde=_default_kde,
+                         normalize_ipw=normalize_ipw, trimming_threshold=0.05,
+                         ipw_solver='exact')
+
+    res_dict = {'coef': dml_lpq_obj.coef[0],
+                'coef_manual': res_manual['lpq'],
+                'se': dml_lpq_obj.se[0],
+                'se_manual': res_manual['se']}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_lpq_exact_coef(dml_lpq_exact_fixture):
+    assert math.isclose(dml_lpq_exact_fixture['coef'],
+                        dml_lpq_exact_fixture['coef_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_lpq_exact_se(dml_lpq_exact_fixture):
+    assert math.isclose(dml_lpq_exact_fixture['se'],
+                        dml_lpq_exact_fixture['se_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.fixture(scope="module")
+def dml_cvar_exact_fixture(generate_data_quantiles, treatment, quantile, normalize_ipw):
+    n_folds = 3
+    ml_g = LinearRegression()
+    ml_m = LogisticRegression(solver='lbfgs', max_iter=250)
+
+    (x, y, d) = generate_data_quantiles
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    np.random.seed(42)
+    all_smpls = draw_smpls(len(y), n_folds, n_rep=1, groups=d)
+
+    dml_cvar_obj = dml.DoubleMLCVAR(obj_dml_data, clone(ml_g), clone(ml_m),
+                                    treatment=treatment, quantile=quantile,
+                                    n_folds=n_folds, normalize_ipw=normalize_ipw,
+                                    draw_sample_splitting=False, ipw_solver='exact')
+    dml_cvar_obj.set_sample_splitting(all_smpls=all_smpls)
+    np.random.seed(42)
+    dml_cvar_obj.fit()
+
+    np.random.seed(42)
+    res_manual = fit_cvar(y, x, d, quantile, clone(ml_g), clone(ml_m),
+                          all_smpls, treatment, n_rep=1,
+                          normalize_ipw=normalize_ipw, ipw_solver='exact')
+
+    res_dict = {'coef': dml_cvar_obj.coef[0],
+                'coef_manual': res_manual['pq'],
+                'se': dml_cvar_obj.se[0],
+                'se_manual': res_manual['se']}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_cvar_exact_coef(dml_cvar_exact_fixture):
+    assert math.isclose(dml_cvar_exact_fixture['coef'],
+                        dml_cvar_exact_fixture['coef_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_cvar_exact_se(dml_cvar_exact_fixture):
+    assert math.isclose(dml_cvar_exact_fixture['se'],
+                        dml_cvar_exact_fixture['se_manual'],
+                        rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.mark.ci
+def test_ipw_solver_exceptions(generate_data_quantiles):
+    (x, y, d) = generate_data_quantiles
+    obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d)
+    msg = 'Invalid ipw_solver newton. Valid ipw_solver brent or exact.'
+    with pytest.raises(ValueError, match=msg):
+        _ = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), ipw_solver='newton')
+    with pytest.raises(ValueError, match=msg):
+        _ = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression(), ipw_solver='newton')
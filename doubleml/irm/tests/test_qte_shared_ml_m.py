@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+
+import doubleml as dml
+
+from sklearn.linear_model import LogisticRegression, LinearRegression
+from sklearn.ensemble import RandomForestClassifier
+
+from doubleml.datasets import make_irm_data, make_iivm_data
+
+
+@pytest.fixture(scope='module',
+                params=['PQ', 'LPQ', 'CVaR'])
+def score(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_rep(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def normalize_ipw(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=['brent', 'exact'])
+def ipw_solver(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_qte_shared_ml_m_fixture(score, n_rep, normalize_ipw, ipw_solver):
+    np.random.seed(3141)
+    if score == 'LPQ':
+        obj_dml_data = make_iivm_data(n_obs=500, dim_x=5)
+    else:
+        obj_dml_data = make_irm_data(n_obs=500, dim_x=5)
+
+    if score == 'CVaR':
+        ml_g = LinearRegression()
+    else:
+        ml_g = RandomForestClassifier(max_depth=2, n_estimators=5, random_state=42)
+    ml_m = LogisticRegression()
+
+    input_args = {
+        'quantiles': [0.25, 0.5, 0.75],
+        'n_folds': 3,
+        'n_rep': n_rep,
+        'score': score,
+        'normalize_ipw': normalize_ipw,
+        'draw_sample_splitting': False,
+        'ipw_solver': ipw_solver,
+    }
+
+    np.random.seed(42)
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, ml_g, ml_m, **input_args)
+    dml_qte_obj.draw_sample_splitting()
+    smpls = dml_qte_obj.smpls
+    dml_qte_obj.fit(store_models=True)
+
+    dml_qte_obj_shared = dml.DoubleMLQTE(obj_dml_data, ml_g, ml_m, **input_args)
+    dml_qte_obj_shared.set_sample_splitting(smpls)
+    dml_qte_obj_shared.fit(store_models=True, share_ml_m=True)
+
+    res_dict = {'qte': dml_qte_obj,
+                'qte_shared': dml_qte_obj_shared}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_ml_m_coef(dml_qte_shared_ml_m_fixture):
+    dml_qte_obj = dml_qte_shared_ml_m_fixture['qte']
+    dml_qte_obj_shared = dml_qte_shared_ml_m_fixture['qte_shared']
+    assert np.allclose(dml_qte_obj.all_coef, dml_qte_obj_shared.all_coef,
+                       rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_qte_obj.all_se, dml_qte_obj_shared.all_se,
+                       rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_ml_m_predictions(dml_qte_shared_ml_m_fixture):
+    dml_qte_obj = dml_qte_shared_ml_m_fixture['qte']
+    dml_qte_obj_shared = dml_qte_shared_ml_m_fixture['qte_shared']
+    for model, model_shared in zip(dml_qte_obj.modellist_0 + dml_qte_obj.modellist_1,
+                                   dml_qte_obj_shared.modellist_0 + dml_qte_obj_shared.modellist_1):
+        assert model_shared._shared_propensity is None
+        for learner in model.params_names:
+            assert np.allclose(model.predictions[learner], model_shared.predictions[learner],
+                               rtol=1e-9, atol=1e-4, equal_nan=True)
+            for i_rep in range(model.n_rep):
+                assert len(model_shared.models[learner]['d'][i_rep]) == model.n_folds
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_ml_m_exceptions():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, LogisticRegression(), LogisticRegression())
+
+    msg = 'share_ml_m must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_qte_obj.fit(share_ml_m=1)
+
+
+@pytest.mark.ci
+def test_dml_qte_shared_ml_m_params(score):
+    np.random.seed(3141)
+    if score == 'LPQ':
+        obj_dml_data = make_iivm_data(n_obs=500, dim_x=5)
+    else:
+        obj_dml_data = make_irm_data(n_obs=500, dim_x=5)
+    if score == 'CVaR':
+        ml_g = LinearRegression()
+    else:
+        ml_g = RandomForestClassifier(max_depth=2, n_estimators=5, random_state=42)
+
+    input_args = {'quantiles': [0.25, 0.75], 'n_folds': 3, 'n_rep': 2, 'score': score, 'draw_sample_splitting': False}
+    # fold-specific parameters of the propensity learners
+    m_params = [[{'C': 0.01}, {'C': 0.1}, {'C': 1.0}], [{'C': 0.05}] * 3]
+
+    def _set_m_params(dml_qte_obj):
+        for model in dml_qte_obj.modellist_0 + dml_qte_obj.modellist_1:
+            for learner in model.params_names:
+                if learner.startswith('ml_m'):
+                    model.set_ml_nuisance_params(learner, 'd', m_params)
+
+    np.random.seed(42)
+    dml_qte_obj = dml.DoubleMLQTE(obj_dml_data, ml_g, LogisticRegression(), **input_args)
+    dml_qte_obj.draw_sample_splitting()
+    _set_m_params(dml_qte_obj)
+    dml_qte_obj.fit(store_models=True)
+
+    dml_qte_obj_shared = dml.DoubleMLQTE(obj_dml_data, ml_g, LogisticRegression(), **input_args)
+    dml_qte_obj_shared.set_sample_splitting(dml_qte_obj.smpls)
+    _set_m_params(dml_qte_obj_shared)
+    dml_qte_obj_shared.fit(store_models=True, share_ml_m=True)
+
+    assert np.allclose(dml_qte_obj.all_coef, dml_qte_obj_shared.all_coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_qte_obj.all_se, dml_qte_obj_shared.all_se, rtol=1e-9, atol=1e-4)
+    for model, model_shared in zip(dml_qte_obj.modellist_0 + dml_qte_obj.modellist_1,
+                                   dml_qte_obj_shared.modellist_0 + dml_qte_obj_shared.modellist_1):
+        for learner in model.params_names:
+            assert np.allclose(model.predictions[learner], model_shared.predictions[learner],
+                               rtol=1e-9, atol=1e-4, equal_nan=True)
+            if learner.startswith('ml_m'):
+                for i_rep in range(model.n_rep):
+                    for i_fold in range(model.n_folds):
+                        assert model_shared.models[learner]['d'][i_rep][i_fold].C == m_params[i_rep][i_fold]['C']
+
+    # the shared propensity models require equal parameters for all quantiles and treatment levels
+    m_learner = 'ml_m_z' if score == 'LPQ' else 'ml_m'
+    dml_qte_obj_shared.modellist_1[1].set_ml_nuisance_params(m_learner, 'd', {'C': 0.5})
+    msg = f'A shared propensity model requires the same parameters of {m_learner} for all quantiles and treatment levels.'
+    with pytest.raises(ValueError, match=msg):
+        dml_qte_obj_shared.fit(share_ml_m=True)
@@ -2,8 +2,12 @@
 The :mod:`doubleml.plm` module implements double machine learning estimates based on partially linear models.
 """
 
-from .plr import DoubleMLPLR
-from .pliv import DoubleMLPLIV
+from ..utils._lazy import _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(globals(), {
+    'DoubleMLPLR': '.plr',
+    'DoubleMLPLIV': '.pliv',
+})
 
 __all__ = [
     "DoubleMLPLR",
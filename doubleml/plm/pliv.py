@@ -1,7 +1,5 @@
 import numpy as np
 from sklearn.utils import check_X_y
-from sklearn.model_selection import KFold
-from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
 from sklearn.linear_model import LinearRegression
 from sklearn.dummy import DummyRegressor
 
@@ -11,7 +9,7 @@ from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_many, _dml_tune
 from ..utils._checks import _check_finite_predictions
 
 
@@ -292,15 +290,39 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         x, d = check_X_y(x, self._dml_data.d,
                          force_all_finite=False)
 
+        if self._dml_data.n_instr == 1:
+            x, z = check_X_y(x, np.ravel(self._dml_data.z),
+                             force_all_finite=False)
+            m_keys = ['ml_m']
+            m_targets = [z]
+        else:
+            z = self._dml_data.z
+            m_keys = ['ml_m_' + z_col for z_col in self._dml_data.z_cols]
+            m_targets = [check_X_y(x, z[:, i_instr], force_all_finite=False)[1]
+                         for i_instr in range(self._dml_data.n_instr)]
+
+        # fit all folds of ml_l, ml_m (one per instrument) and ml_r (if not provided externally) in one parallel pool;
+        # ml_g depends on the predictions of all of them and is fitted afterwards
+        nuisance_jobs = {}
+        if external_predictions['ml_l'] is None:
+            nuisance_jobs['ml_l'] = {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l']}
+        for m_key, m_target in zip(m_keys, m_targets):
+            if external_predictions[m_key] is None:
+                nuisance_jobs[m_key] = {'estimator': self._learner['ml_m'], 'x': x, 'y': m_target, 'smpls': smpls,
+                                        'est_params': self._get_params(m_key), 'method': self._predict_method['ml_m']}
+        if external_predictions['ml_r'] is None:
+            nuisance_jobs['ml_r'] = {'estimator': self._learner['ml_r'], 'x': x, 'y': d, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_r'), 'method': self._predict_method['ml_r']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance l
         if external_predictions['ml_l'] is not None:
             l_hat = {'preds': external_predictions['ml_l'],
                      'targets': None,
                      'models': None}
         else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+            l_hat = nuisance_res['ml_l']
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         predictions = {'ml_l': l_hat['preds']}
@@ -309,16 +331,12 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # nuisance m
         if self._dml_data.n_instr == 1:
             # one instrument: just identified
-            x, z = check_X_y(x, np.ravel(self._dml_data.z),
-                             force_all_finite=False)
             if external_predictions['ml_m'] is not None:
                 m_hat = {'preds': external_predictions['ml_m'],
                          'targets': None,
                          'models': None}
             else:
-                m_hat = _dml_cv_predict(self._learner['ml_m'], x, z, smpls=smpls, n_jobs=n_jobs_cv,
-                                        est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                        return_models=return_models)
+                m_hat = nuisance_res['ml_m']
             predictions['ml_m'] = m_hat['preds']
             targets['ml_m'] = m_hat['targets']
             models['ml_m'] = m_hat['models']
@@ -327,26 +345,17 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
             m_hat = {'preds': np.full((self._dml_data.n_obs, self._dml_data.n_instr), np.nan),
                      'targets': [None] * self._dml_data.n_instr,
                      'models': [None] * self._dml_data.n_instr}
-            for i_instr in range(self._dml_data.n_instr):
-                z = self._dml_data.z
-                x, this_z = check_X_y(x, z[:, i_instr],
-                                      force_all_finite=False)
-                if external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]] is not None:
-                    m_hat['preds'][:, i_instr] = external_predictions['ml_m_' + self._dml_data.z_cols[i_instr]]
-                    predictions['ml_m_' + self._dml_data.z_cols[i_instr]] = external_predictions[
-                        'ml_m_' + self._dml_data.z_cols[i_instr]]
-                    targets['ml_m_' + self._dml_data.z_cols[i_instr]] = None
-                    models['ml_m_' + self._dml_data.z_cols[i_instr]] = None
+            for i_instr, m_key in enumerate(m_keys):
+                if external_predictions[m_key] is not None:
+                    m_hat['preds'][:, i_instr] = external_predictions[m_key]
+                    predictions[m_key] = external_predictions[m_key]
+                    targets[m_key] = None
+                    models[m_key] = None
                 else:
-                    res_cv_predict = _dml_cv_predict(self._learner['ml_m'], x, this_z, smpls=smpls, n_jobs=n_jobs_cv,
-                                                     est_params=self._get_params('ml_m_' + self._dml_data.z_cols[i_instr]),
-                                                     method=self._predict_method['ml_m'], return_models=return_models)
-
-                    m_hat['preds'][:, i_instr] = res_cv_predict['preds']
-
-                    predictions['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['preds']
-                    targets['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['targets']
-                    models['ml_m_' + self._dml_data.z_cols[i_instr]] = res_cv_predict['models']
+                    m_hat['preds'][:, i_instr] = nuisance_res[m_key]['preds']
+                    predictions[m_key] = nuisance_res[m_key]['preds']
+                    targets[m_key] = nuisance_res[m_key]['targets']
+                    models[m_key] = nuisance_res[m_key]['models']
 
         _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
@@ -356,9 +365,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            r_hat = _dml_cv_predict(self._learner['ml_r'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                    return_models=return_models)
+            r_hat = nuisance_res['ml_r']
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
         predictions['ml_r'] = r_hat['preds']
         targets['ml_r'] = r_hat['targets']
@@ -379,7 +386,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
                 # nuisance g
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial * d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
-                                        return_models=return_models)
+                                        return_models=return_models, learner_name='ml_g')
             _check_finite_predictions(g_hat['preds'], self._learner['ml_g'], 'ml_g', smpls)
 
         predictions['ml_g'] = g_hat['preds']
@@ -444,7 +451,7 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         # nuisance m
         r_hat = _dml_cv_predict(self._learner['ml_r'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
                                 est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                return_models=return_models)
+                                return_models=return_models, learner_name='ml_r')
         _check_finite_predictions(r_hat['preds'], self._learner['ml_r'], 'ml_r', smpls)
 
         if isinstance(self.score, str):
@@ -472,22 +479,27 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         x, d = check_X_y(x, self._dml_data.d,
                          force_all_finite=False)
 
+        # fit all folds of ml_l and ml_m in one parallel pool; ml_r is fitted on the in-sample predictions of ml_m
+        # afterwards
+        nuisance_jobs = {'ml_l': {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                                  'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l']},
+                         'ml_m': {'estimator': self._learner['ml_m'], 'x': xz, 'y': d, 'smpls': smpls,
+                                  'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m'],
+                                  'return_train_preds': True}}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance l
-        l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                return_models=return_models)
+        l_hat = nuisance_res['ml_l']
         _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
-        m_hat = _dml_cv_predict(self._learner['ml_m'], xz, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                est_params=self._get_params('ml_m'), return_train_preds=True,
-                                method=self._predict_method['ml_m'], return_models=return_models)
+        m_hat = nuisance_res['ml_m']
         _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
 
         # nuisance r
         m_hat_tilde = _dml_cv_predict(self._learner['ml_r'], x, m_hat['train_preds'], smpls=smpls, n_jobs=n_jobs_cv,
                                       est_params=self._get_params('ml_r'), method=self._predict_method['ml_r'],
-                                      return_models=return_models)
+                                      return_models=return_models, learner_name='ml_r')
         _check_finite_predictions(m_hat_tilde['preds'], self._learner['ml_r'], 'ml_r', smpls)
 
         # compute residuals
@@ -661,18 +673,9 @@ class DoubleMLPLIV(LinearScoreMixin, DoubleML):
         r_tune_res = list()
         for idx, (train_index, _) in enumerate(smpls):
             m_hat = m_tune_res[idx].predict(xz[train_index, :])
-            r_tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
-            if search_mode == 'grid_search':
-                r_grid_search = GridSearchCV(self._learner['ml_r'], param_grids['ml_r'],
-                                             scoring=scoring_methods['ml_r'],
-                                             cv=r_tune_resampling, n_jobs=n_jobs_cv)
-            else:
-                assert search_mode == 'randomized_search'
-                r_grid_search = RandomizedSearchCV(self._learner['ml_r'], param_grids['ml_r'],
-                                                   scoring=scoring_methods['ml_r'],
-                                                   cv=r_tune_resampling, n_jobs=n_jobs_cv,
-                                                   n_iter=n_iter_randomized_search)
-            r_tune_res.append(r_grid_search.fit(x[train_index, :], m_hat))
+            r_tune_res.append(_dml_tune(m_hat, x[train_index, :], [np.arange(len(train_index))],
+                                        self._learner['ml_r'], param_grids['ml_r'], scoring_methods['ml_r'],
+                                        n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search)[0])
 
         l_best_params = [xx.best_params_ for xx in l_tune_res]
         m_best_params = [xx.best_params_ for xx in m_tune_res]
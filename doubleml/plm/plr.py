@@ -8,9 +8,8 @@ import warnings
 from ..double_ml import DoubleML
 from ..double_ml_data import DoubleMLData
 from ..double_ml_score_mixins import LinearScoreMixin
-from ..utils.blp import DoubleMLBLP
 
-from ..utils._estimation import _dml_cv_predict, _dml_tune
+from ..utils._estimation import _dml_cv_predict, _dml_cv_predict_many, _dml_tune
 from ..utils._checks import _check_score, _check_finite_predictions, _check_is_propensity, _check_binary_predictions
 
 
@@ -89,6 +88,8 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
     and :math:`\\zeta` and :math:`V` are stochastic errors.
     """
 
+    _outcome_shared_learners = ['ml_m']
+
     def __init__(self,
                  obj_dml_data,
                  ml_l,
@@ -168,19 +169,29 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         else:
             g_external = False
 
+        # fit all folds of ml_l and ml_m (if not provided externally) in one parallel pool; ml_g depends on the
+        # predictions of both and is fitted afterwards
+        l_fitted = not (l_external or (self._score == 'IV-type' and g_external))
+        nuisance_jobs = {}
+        if l_fitted:
+            nuisance_jobs['ml_l'] = {'estimator': self._learner['ml_l'], 'x': x, 'y': y, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_l'), 'method': self._predict_method['ml_l']}
+        if not m_external:
+            nuisance_jobs['ml_m'] = {'estimator': self._learner['ml_m'], 'x': x, 'y': d, 'smpls': smpls,
+                                     'est_params': self._get_params('ml_m'), 'method': self._predict_method['ml_m']}
+        nuisance_res = _dml_cv_predict_many(nuisance_jobs, n_jobs=n_jobs_cv, return_models=return_models)
+
         # nuisance l
         if l_external:
             l_hat = {'preds': external_predictions['ml_l'],
                      'targets': None,
                      'models': None}
-        elif self._score == "IV-type" and g_external:
+        elif not l_fitted:
             l_hat = {'preds': None,
                      'targets': None,
                      'models': None}
         else:
-            l_hat = _dml_cv_predict(self._learner['ml_l'], x, y, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_l'), method=self._predict_method['ml_l'],
-                                    return_models=return_models)
+            l_hat = nuisance_res['ml_l']
             _check_finite_predictions(l_hat['preds'], self._learner['ml_l'], 'ml_l', smpls)
 
         # nuisance m
@@ -189,9 +200,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                      'targets': None,
                      'models': None}
         else:
-            m_hat = _dml_cv_predict(self._learner['ml_m'], x, d, smpls=smpls, n_jobs=n_jobs_cv,
-                                    est_params=self._get_params('ml_m'), method=self._predict_method['ml_m'],
-                                    return_models=return_models)
+            m_hat = nuisance_res['ml_m']
             _check_finite_predictions(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls)
         if self._check_learner(self._learner['ml_m'], 'ml_m', regressor=True, classifier=True):
             _check_is_propensity(m_hat['preds'], self._learner['ml_m'], 'ml_m', smpls, eps=1e-12)
@@ -214,7 +223,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
                 theta_initial = -np.nanmean(psi_b) / np.nanmean(psi_a)
                 g_hat = _dml_cv_predict(self._learner['ml_g'], x, y - theta_initial*d, smpls=smpls, n_jobs=n_jobs_cv,
                                         est_params=self._get_params('ml_g'), method=self._predict_method['ml_g'],
-                                        return_models=return_models)
+                                        return_models=return_models, learner_name='ml_g')
                 _check_finite_predictions(g_hat['preds'], self._learner['ml_g'], 'ml_g', smpls)
 
         psi_a, psi_b = self._score_elements(y, d, l_hat['preds'], m_hat['preds'], g_hat['preds'], smpls)
@@ -259,7 +268,7 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         d = self._dml_data.d
 
         m_hat = preds['predictions']['ml_m']
-        theta = self.all_coef[self._i_treat, self._i_rep]
+        theta = self.all_coef[self._i_coef, self._i_rep]
 
         if self.score == 'partialling out':
             l_hat = preds['predictions']['ml_l']
@@ -366,10 +375,14 @@ class DoubleMLPLR(LinearScoreMixin, DoubleML):
         if self._dml_data.n_treat > 1:
             raise NotImplementedError('Only implemented for single treatment. ' +
                                       f'Number of treatments is {str(self._dml_data.n_treat)}.')
+        if self._dml_data.n_outcomes > 1:
+            raise NotImplementedError('Only implemented for single outcome. ' +
+                                      f'Number of outcomes is {str(self._dml_data.n_outcomes)}.')
         if self.n_rep != 1:
             raise NotImplementedError('Only implemented for one repetition. ' +
                                       f'Number of repetitions is {str(self.n_rep)}.')
 
+        from ..utils.blp import DoubleMLBLP
         Y_tilde, D_tilde = self._partial_out()
 
         D_basis = basis * D_tilde
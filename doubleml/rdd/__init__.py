@@ -2,7 +2,12 @@
 The :mod:`doubleml.rdd` module implements double machine learning estimates for regression discontinuity designs.
 """
 
-from .rdd import RDFlex
+from ..utils._lazy import _lazy_attributes
+
+# rdrobust is only imported on first access of RDFlex
+__getattr__, __dir__ = _lazy_attributes(globals(), {
+    'RDFlex': '.rdd',
+})
 
 __all__ = [
     "RDFlex",
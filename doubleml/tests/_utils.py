@@ -1,11 +1,19 @@
 import numpy as np
 from sklearn.model_selection import KFold, GridSearchCV, StratifiedKFold
 from sklearn.base import clone
+from sklearn.linear_model import LinearRegression, LogisticRegression
 import pandas as pd
 from scipy.stats import norm
 
 from ..utils._estimation import _var_est, _aggregate_coefs_and_ses
 from ..double_ml_data import DoubleMLBaseData
+from ..plm.plr import DoubleMLPLR
+from ..plm.pliv import DoubleMLPLIV
+from ..irm.irm import DoubleMLIRM
+from ..irm.pq import DoubleMLPQ
+from ..irm.lpq import DoubleMLLPQ
+from ..irm.cvar import DoubleMLCVAR
+from ..did.did import DoubleMLDID
 
 
 class DummyDataClass(DoubleMLBaseData):
@@ -142,3 +150,71 @@ def confint_manual(coef, se, index_names, boot_t_stat=None, joint=True, level=0.
                          columns=['{:.1f} %'.format(i * 100) for i in ab],
                          index=index_names)
     return df_ci
+
+
+def p_adjust_romano_wolf_manual(t_stats, boot_t_stat):
+    # step-down procedure for a single repetition with t_stats of shape (n_thetas,) and boot_t_stat of shape
+    # (n_rep_boot, n_thetas)
+    n_thetas = t_stats.shape[0]
+    abs_t_stats = np.abs(t_stats)
+    stepdown_ind = np.argsort(abs_t_stats)[::-1]
+    ro = np.argsort(stepdown_ind)
+
+    p_init = np.full(n_thetas, np.nan)
+    for i_theta in range(n_thetas):
+        bootstrap_critical_value = np.max(np.abs(np.delete(boot_t_stat, stepdown_ind[:i_theta], axis=1)), axis=1)
+        p_init[i_theta] = np.minimum(1, np.mean(bootstrap_critical_value >= abs_t_stats[stepdown_ind][i_theta]))
+
+    p_vals_corrected_sorted = np.full(n_thetas, np.nan)
+    for i_theta in range(n_thetas):
+        if i_theta == 0:
+            p_vals_corrected_sorted[i_theta] = p_init[i_theta]
+        else:
+            p_vals_corrected_sorted[i_theta] = np.maximum(p_init[i_theta], p_vals_corrected_sorted[i_theta - 1])
+
+    return p_vals_corrected_sorted[ro]
+
+
+class CountingLinearRegression(LinearRegression):
+    # the fits are counted in the class, i.e. only fits in the current process are counted (not the fits in workers)
+    n_fits = 0
+
+    def fit(self, X, y, sample_weight=None):
+        CountingLinearRegression.n_fits += 1
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+class CountingLogisticRegression(LogisticRegression):
+    n_fits = 0
+
+    def fit(self, X, y, sample_weight=None):
+        CountingLogisticRegression.n_fits += 1
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+def reset_fit_counters():
+    CountingLinearRegression.n_fits = 0
+    CountingLogisticRegression.n_fits = 0
+
+
+def get_n_fits():
+    return CountingLinearRegression.n_fits + CountingLogisticRegression.n_fits
+
+
+def make_dml_model(model, obj_dml_data, ml_reg=None, ml_clf=None, **kwargs):
+    # the regression and classification learners are used for all nuisance models of the corresponding type, learners
+    # passed via kwargs (e.g. ml_m or ml_g) replace them
+    if ml_reg is None:
+        ml_reg = LinearRegression()
+    if ml_clf is None:
+        ml_clf = LogisticRegression()
+    model_classes = {'PLR': (DoubleMLPLR, {'ml_l': ml_reg, 'ml_m': ml_reg}),
+                     'PLIV': (DoubleMLPLIV, {'ml_l': ml_reg, 'ml_m': ml_reg, 'ml_r': ml_reg}),
+                     'IRM': (DoubleMLIRM, {'ml_g': ml_reg, 'ml_m': ml_clf}),
+                     'PQ': (DoubleMLPQ, {'ml_g': ml_clf, 'ml_m': ml_clf}),
+                     'LPQ': (DoubleMLLPQ, {'ml_g': ml_clf, 'ml_m': ml_clf}),
+                     'CVAR': (DoubleMLCVAR, {'ml_g': ml_reg, 'ml_m': ml_clf}),
+                     'DID': (DoubleMLDID, {'ml_g': ml_reg, 'ml_m': ml_clf})}
+    model_class, learners = model_classes[model]
+    learners = {learner: clone(ml) for learner, ml in learners.items() if learner not in kwargs}
+    return model_class(obj_dml_data, **learners, **kwargs)
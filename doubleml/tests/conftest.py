@@ -152,3 +152,15 @@ def generate_data_bivariate(request):
                         columns=column_names)
 
     return data
+
+
+@pytest.fixture(scope='module',
+                params=['PLR', 'IRM'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[None, 2])
+def n_jobs_rep(request):
+    return request.param
@@ -1,3 +1,5 @@
+import gc
+import os
 import pytest
 import numpy as np
 import pandas as pd
@@ -518,11 +520,32 @@ def test_y_col_setter():
     with pytest.raises(ValueError, match=msg):
         dml_data.y_col = 'd13'
 
-    msg = (r'The outcome variable y_col must be of str type. '
+    msg = (r'The outcome variable\(s\) y_col must be of str or list type. '
            "5 of type <class 'int'> was passed.")
     with pytest.raises(TypeError, match=msg):
         dml_data.y_col = 5
 
+    # multiple outcome variables
+    dml_data.y_col = ['y', 'y123']
+    assert dml_data.y_cols == ['y', 'y123']
+    assert dml_data.n_outcomes == 2
+    assert dml_data.n_coefs == 2
+    assert np.array_equal(dml_data.y, y_comp)
+    dml_data.set_y('y')
+    assert np.array_equal(dml_data.y, dml_data.data['y'].values)
+
+    msg = r'Invalid outcome variable y_col. d13 is no data column.'
+    with pytest.raises(ValueError, match=msg):
+        dml_data.y_col = ['y', 'd13']
+
+    msg = r'Invalid outcome_var. X1 is not in y_cols.'
+    with pytest.raises(ValueError, match=msg):
+        dml_data.set_y('X1')
+
+    msg = r"outcome_var must be of str type. \['y'\] of type <class 'list'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_data.set_y(['y'])
+
 
 @pytest.mark.ci
 def test_use_other_treat_as_covariate():
@@ -659,6 +682,10 @@ def test_duplicates():
     with pytest.raises(ValueError, match=msg):
         dml_data.d_cols = ['d', 'd', 'X1']
 
+    msg = r'Invalid outcome variable\(s\) y_col: Contains duplicate values.'
+    with pytest.raises(ValueError, match=msg):
+        _ = DoubleMLData(dml_data.data, y_col=['y', 'y'], d_cols=['d'], x_cols=['X3', 'X2'])
+
     msg = 'Invalid covariates x_cols: Contains duplicate values.'
     with pytest.raises(ValueError, match=msg):
         _ = DoubleMLData(dml_data.data, y_col='y', d_cols=['d'], x_cols=['X3', 'X2', 'X3'])
@@ -759,3 +786,146 @@ def test_dml_data_w_missings(generate_data_irm_w_missings):
     assert dml_data.force_all_x_finite is False
     dml_data.force_all_x_finite = 'allow-nan'
     assert dml_data.force_all_x_finite == 'allow-nan'
+
+
+@pytest.mark.ci
+def test_dml_data_share_memory(tmp_path):
+    np.random.seed(3141)
+    df = make_plr_CCDDHNR2018(n_obs=100, return_type='DataFrame')
+    dml_data = DoubleMLData(df, 'y', ['d', 'X1'])
+    dml_data_shared = DoubleMLData(df, 'y', ['d', 'X1']).share_memory(str(tmp_path))
+    assert dml_data.memmap_folder is None
+    assert dml_data_shared.memmap_folder == str(tmp_path)
+
+    for treatment_var in ['X1', 'd']:
+        dml_data.set_x_d(treatment_var)
+        dml_data_shared.set_x_d(treatment_var)
+        for arr in ['x', 'y', 'd']:
+            shared_arr = getattr(dml_data_shared, arr)
+            assert isinstance(shared_arr, np.memmap)
+            assert not shared_arr.flags.writeable
+            assert np.array_equal(getattr(dml_data, arr), shared_arr)
+    # arrays are only written once per column selection
+    assert dml_data_shared.x is dml_data_shared.x
+
+    np.random.seed(3141)
+    dml_plr = DoubleMLPLR(dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr.fit()
+    np.random.seed(3141)
+    dml_plr_shared = DoubleMLPLR(dml_data_shared, Lasso(), Lasso(), n_folds=2)
+    dml_plr_shared.fit(n_jobs_cv=2)
+    assert np.allclose(dml_plr.coef, dml_plr_shared.coef, rtol=1e-9, atol=1e-4)
+
+    msg = r"temp_folder must be of str type \(or None\). 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_data.share_memory(1)
+
+
+@pytest.mark.ci
+def test_dml_data_share_memory_files(tmp_path):
+    np.random.seed(3141)
+    df = make_plr_CCDDHNR2018(n_obs=100, return_type='DataFrame')
+    dml_data = DoubleMLData(df, 'y', ['d', 'X1']).share_memory(str(tmp_path))
+    # one file for the data array and one for the covariates of the first treatment variable (not the last one)
+    assert len(os.listdir(tmp_path)) == 2
+
+    # the files of superseded selections are removed after repeated role changes
+    for x_cols in [['X2', 'X4'], ['X3', 'X5'], ['X2', 'X3'], ['X5', 'X2'], None]:
+        dml_data.x_cols = x_cols
+        dml_data.set_x_d('X1')
+        gc.collect()
+        assert len(os.listdir(tmp_path)) <= 3
+    assert len(os.listdir(tmp_path)) == 2
+
+    # the files are removed together with the data object, also for a folder passed by the user
+    del dml_data
+    gc.collect()
+    assert os.listdir(tmp_path) == []
+
+    # a temporary folder is removed with its last file
+    dml_data = DoubleMLData(df, 'y', 'd').share_memory()
+    temp_folder = dml_data.memmap_folder
+    assert len(os.listdir(temp_folder)) == 1
+    del dml_data
+    gc.collect()
+    assert not os.path.exists(temp_folder)
+
+
+@pytest.mark.ci
+def test_dml_data_array_views():
+    np.random.seed(3141)
+    df = make_plr_CCDDHNR2018(n_obs=100, return_type='DataFrame')
+    dml_data = DoubleMLData(df, 'y', ['X1', 'd'], z_cols='X2')
+    x_cols = dml_data.x_cols
+
+    dml_data.set_x_d('d')
+    for arr in [dml_data.x, dml_data.d, dml_data.y, dml_data.z]:
+        assert np.shares_memory(arr, dml_data._data_array)
+    assert np.array_equal(dml_data.x, df[x_cols + ['X1']].values)
+    assert np.array_equal(dml_data.d, df['d'].values)
+    assert np.array_equal(dml_data.y, df['y'].values)
+    assert np.array_equal(dml_data.z, df[['X2']].values)
+
+    dml_data.set_x_d('X1')
+    assert np.array_equal(dml_data.x, df[x_cols + ['d']].values)
+    assert np.array_equal(dml_data.d, df['X1'].values)
+    # the covariates of a treatment variable which is not the last one are copied
+    assert not np.shares_memory(dml_data.x, dml_data._data_array)
+
+    dml_data.use_other_treat_as_covariate = False
+    assert np.shares_memory(dml_data.x, dml_data._data_array)
+    assert np.array_equal(dml_data.x, df[x_cols].values)
+    for arr in [dml_data.x, dml_data.d, dml_data.y, dml_data.z]:
+        assert not arr.flags.writeable
+
+    # the data array holds all numeric columns and a change of the covariates only changes the selected columns
+    data_array = dml_data._data_array
+    assert data_array.shape == df.shape
+    dml_data.x_cols = ['X3', 'X4']
+    assert dml_data._data_array is data_array
+    assert np.shares_memory(dml_data.x, dml_data._data_array)
+    assert np.array_equal(dml_data.x, df[['X3', 'X4']].values)
+    dml_data.x_cols = ['X4', 'X3']
+    assert dml_data._data_array is data_array
+    assert np.array_equal(dml_data.x, df[['X4', 'X3']].values)
+    dml_data.x_cols = None
+    assert dml_data._data_array is data_array
+    assert np.shares_memory(dml_data.x, dml_data._data_array)
+    assert np.array_equal(dml_data.x, df[x_cols].values)
+
+    # integer and boolean columns are cast to float64 and are views as well, other columns keep their dtype
+    df['X4'] = (df['X4'] > 0).astype(int)
+    df['X5'] = df['X5'] > 0
+    df['d'] = (df['d'] > 0).astype(int)
+    df['y'] = df['y'] > 0
+    dml_data = DoubleMLData(df, 'y', 'd', x_cols=['X4', 'X5'])
+    assert dml_data._data_array.shape == df.shape
+    for arr in [dml_data.x, dml_data.d, dml_data.y]:
+        assert np.shares_memory(arr, dml_data._data_array)
+        assert arr.dtype == np.float64
+        assert not arr.flags.writeable
+    assert np.array_equal(dml_data.x, df[['X4', 'X5']].values)
+    assert np.array_equal(dml_data.y, df['y'].values)
+    assert np.array_equal(dml_data.d, df['d'].values)
+
+    df['X3'] = df['X3'].astype(str)
+    dml_data = DoubleMLData(df, 'y', 'd', x_cols=['X3', 'X4'])
+    assert dml_data._data_array.shape[1] == df.shape[1] - 1
+    assert np.array_equal(dml_data.x, df[['X3', 'X4']].values)
+    assert dml_data.x.dtype == object
+    assert not dml_data.x.flags.writeable
+
+
+@pytest.mark.ci
+def test_dml_cluster_data_array_views(tmp_path):
+    np.random.seed(3141)
+    df = make_pliv_multiway_cluster_CKMS2021(N=10, M=10, return_type='DataFrame')
+    dml_data = DoubleMLClusterData(df, 'Y', 'D', ['cluster_var_i', 'cluster_var_j'], z_cols='Z')
+    assert np.array_equal(dml_data.cluster_vars, df[['cluster_var_i', 'cluster_var_j']].values)
+    assert dml_data.cluster_vars.dtype == df['cluster_var_i'].dtype
+    assert not dml_data.cluster_vars.flags.writeable
+
+    dml_data.share_memory(str(tmp_path))
+    for arr in [dml_data.x, dml_data.y, dml_data.d, dml_data.z, dml_data.cluster_vars]:
+        assert isinstance(arr, np.memmap)
+    assert np.array_equal(dml_data.cluster_vars, df[['cluster_var_i', 'cluster_var_j']].values)
@@ -693,6 +693,9 @@ def test_doubleml_exception_fit():
     msg = "The number of CPUs used to fit the learners must be of int type. 5 of type <class 'str'> was passed."
     with pytest.raises(TypeError, match=msg):
         dml_plr.fit(n_jobs_cv='5')
+    msg = "The number of CPUs used to fit the repetitions must be of int type. 5 of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.fit(n_jobs_rep='5')
     msg = 'store_predictions must be True or False. Got 1.'
     with pytest.raises(TypeError, match=msg):
         dml_plr.fit(store_predictions=1)
@@ -804,7 +807,8 @@ def test_doubleml_exception_tune():
     with pytest.raises(TypeError, match=msg):
         dml_plr.tune(param_grids, n_folds_tune=1.)
 
-    msg = 'search_mode must be "grid_search" or "randomized_search". Got gridsearch.'
+    msg = ('search_mode must be "grid_search", "randomized_search", "halving_grid_search" or "halving_random_search". '
+           'Got gridsearch.')
     with pytest.raises(ValueError, match=msg):
         dml_plr.tune(param_grids, search_mode='gridsearch')
 
@@ -828,6 +832,14 @@ def test_doubleml_exception_tune():
     with pytest.raises(TypeError, match=msg):
         dml_plr.tune(param_grids, return_tune_res=1)
 
+    msg = "The number of CPUs used to run the searches must be of int type. 2 of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.tune(param_grids, n_jobs_tune='2')
+
+    msg = "random_state must be None, an int or a numpy.random.SeedSequence. 1.5 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.tune(param_grids, random_state=1.5)
+
 
 @pytest.mark.ci
 def test_doubleml_exception_set_ml_nuisance_params():
@@ -1132,6 +1144,21 @@ def test_doubleml_sensitivity_benchmark():
            r"'X11', 'X12', 'X13', 'X14', 'X15', 'X16', 'X17', 'X18', 'X19', 'X20'\]. \['test_var'\] was passed.")
     with pytest.raises(ValueError, match=msg):
         _ = dml_irm.sensitivity_benchmark(benchmarking_set=['test_var'])
+    with pytest.raises(ValueError, match=msg):
+        _ = dml_irm.sensitivity_benchmark(benchmarking_set=[['X1'], ['test_var']])
+
+    msg = "benchmarking_set must not be empty."
+    with pytest.raises(ValueError, match=msg):
+        _ = dml_irm.sensitivity_benchmark(benchmarking_set=[['X1'], []])
+
+    msg = (r"benchmarking_set must be a list of features or a list of lists of features. "
+           r"\['X1', \['X2'\]\] was passed.")
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_irm.sensitivity_benchmark(benchmarking_set=['X1', ['X2']])
+
+    msg = "The number of CPUs used to fit the benchmarking sets must be of int type. 2.0 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_irm.sensitivity_benchmark(benchmarking_set=['X1'], n_jobs_benchmark=2.0)
 
 
 @pytest.mark.ci
@@ -1204,12 +1231,6 @@ def test_doubleml_sensitivity_plot_input():
 
 @pytest.mark.ci
 def test_doubleml_cluster_not_yet_implemented():
-    dml_pliv_cluster = DoubleMLPLIV(dml_cluster_data_pliv, ml_g, ml_m, ml_r)
-    dml_pliv_cluster.fit()
-    msg = 'bootstrap not yet implemented with clustering.'
-    with pytest.raises(NotImplementedError, match=msg):
-        _ = dml_pliv_cluster.bootstrap()
-
     df = dml_cluster_data_pliv.data.copy()
     df['cluster_var_k'] = df['cluster_var_i'] + df['cluster_var_j'] - 2
     dml_cluster_data_multiway = DoubleMLClusterData(df, y_col='Y', d_cols='D', x_cols=['X1', 'X5'], z_cols='Z',
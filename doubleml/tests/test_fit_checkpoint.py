@@ -0,0 +1,239 @@
+import os
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+from doubleml.utils import binned_kde
+
+from ._utils import make_dml_model
+
+
+class _InterruptedLinearRegression(LinearRegression):
+    # simulates a worker dying after a fixed number of fits (the counter is not a parameter of the learner)
+    n_fits = 0
+    max_fits = None
+
+    def fit(self, X, y, sample_weight=None):
+        _InterruptedLinearRegression.n_fits += 1
+        if (_InterruptedLinearRegression.max_fits is not None) and \
+                (_InterruptedLinearRegression.n_fits > _InterruptedLinearRegression.max_fits):
+            raise RuntimeError('Interrupted fit.')
+        return super().fit(X, y, sample_weight=sample_weight)
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def store_models(request):
+    return request.param
+
+
+def _make_model(model, obj_dml_data):
+    return make_dml_model(model, obj_dml_data, ml_reg=_InterruptedLinearRegression(),
+                          n_folds=2, n_rep=3, draw_sample_splitting=False)
+
+
+@pytest.fixture(scope='module')
+def dml_checkpoint_fixture(model, n_jobs_rep, store_models, tmp_path_factory):
+    np.random.seed(3141)
+    if model == 'PLR':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+        obj_dml_data = dml.DoubleMLData(obj_dml_data.data, 'y', ['d', 'X1'])
+    else:
+        obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    checkpoint_path = tmp_path_factory.mktemp('checkpoint')
+
+    np.random.seed(42)
+    dml_obj = _make_model(model, obj_dml_data)
+    dml_obj.draw_sample_splitting()
+    smpls = dml_obj.smpls
+    _InterruptedLinearRegression.max_fits = None
+    dml_obj.fit(store_models=store_models)
+    dml_obj.sensitivity_analysis()
+
+    # interrupt the fit in the second repetition (four fits per repetition and treatment variable)
+    _InterruptedLinearRegression.n_fits = 0
+    _InterruptedLinearRegression.max_fits = 4 * obj_dml_data.n_treat + 1
+    dml_obj_resumed = _make_model(model, obj_dml_data)
+    dml_obj_resumed.set_sample_splitting(smpls)
+    with pytest.raises(RuntimeError, match='Interrupted fit.'):
+        dml_obj_resumed.fit(store_models=store_models, checkpoint_path=checkpoint_path)
+    n_cells_interrupted = len(os.listdir(checkpoint_path))
+
+    _InterruptedLinearRegression.n_fits = 0
+    _InterruptedLinearRegression.max_fits = None
+    dml_obj_resumed.fit(store_models=store_models, checkpoint_path=checkpoint_path, n_jobs_rep=n_jobs_rep)
+    dml_obj_resumed.sensitivity_analysis()
+    n_fits_resumed = _InterruptedLinearRegression.n_fits
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_resumed': dml_obj_resumed,
+                'n_cells_interrupted': n_cells_interrupted,
+                'n_cells': len(os.listdir(checkpoint_path)),
+                'n_fits_resumed': n_fits_resumed,
+                'n_jobs_rep': n_jobs_rep,
+                'store_models': store_models}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_coef(dml_checkpoint_fixture):
+    dml_obj = dml_checkpoint_fixture['dml_obj']
+    dml_obj_resumed = dml_checkpoint_fixture['dml_obj_resumed']
+    assert np.array_equal(dml_obj.all_coef, dml_obj_resumed.all_coef)
+    assert np.array_equal(dml_obj.all_se, dml_obj_resumed.all_se)
+    assert np.array_equal(dml_obj.coef, dml_obj_resumed.coef)
+    assert np.array_equal(dml_obj.se, dml_obj_resumed.se)
+    for key in ['theta', 'se']:
+        for bound in ['lower', 'upper']:
+            assert np.array_equal(dml_obj.sensitivity_params[key][bound],
+                                  dml_obj_resumed.sensitivity_params[key][bound])
+    assert np.array_equal(dml_obj.sensitivity_params['rv'], dml_obj_resumed.sensitivity_params['rv'])
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_predictions(dml_checkpoint_fixture):
+    dml_obj = dml_checkpoint_fixture['dml_obj']
+    dml_obj_resumed = dml_checkpoint_fixture['dml_obj_resumed']
+    for learner in dml_obj.params_names:
+        assert np.array_equal(dml_obj.predictions[learner], dml_obj_resumed.predictions[learner], equal_nan=True)
+        assert np.array_equal(dml_obj.nuisance_loss[learner], dml_obj_resumed.nuisance_loss[learner], equal_nan=True)
+        if dml_checkpoint_fixture['store_models']:
+            for treat_var in dml_obj._dml_data.d_cols:
+                for i_rep in range(dml_obj.n_rep):
+                    assert len(dml_obj_resumed.models[learner][treat_var][i_rep]) == dml_obj.n_folds
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_resumed(dml_checkpoint_fixture):
+    dml_obj = dml_checkpoint_fixture['dml_obj']
+    n_treat = dml_obj._dml_data.n_treat
+    # the first repetition was saved before the interruption, the remaining ones are fitted after the restart
+    assert dml_checkpoint_fixture['n_cells_interrupted'] == n_treat
+    assert dml_checkpoint_fixture['n_cells'] == dml_obj.n_rep * n_treat
+    if dml_checkpoint_fixture['n_jobs_rep'] is None:
+        assert dml_checkpoint_fixture['n_fits_resumed'] == (dml_obj.n_rep - 1) * n_treat * 4
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_exceptions(tmp_path):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=2)
+
+    msg = "checkpoint_path must be None, a str or a path-like object. 5 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(checkpoint_path=5)
+
+    dml_obj.fit(checkpoint_path=tmp_path)
+    dml_obj.draw_sample_splitting()
+    msg = ('was created for a different model, data, sample splitting or fit setting. '
+           'Remove the checkpoint or use a different checkpoint_path.')
+    with pytest.raises(ValueError, match=msg):
+        dml_obj.fit(checkpoint_path=tmp_path)
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_parallel_interrupted(tmp_path):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_obj = _make_model('PLR', obj_dml_data)
+    dml_obj.draw_sample_splitting()
+    _InterruptedLinearRegression.max_fits = None
+    dml_obj.fit()
+
+    # the cells which are finished before the interruption are saved, also in the parallel estimation
+    _InterruptedLinearRegression.n_fits = 0
+    _InterruptedLinearRegression.max_fits = 4 + 1
+    dml_obj_resumed = _make_model('PLR', obj_dml_data)
+    dml_obj_resumed.set_sample_splitting(dml_obj.smpls)
+    with pytest.raises(RuntimeError, match='Interrupted fit.'):
+        dml_obj_resumed.fit(checkpoint_path=tmp_path, n_jobs_rep=1)
+    assert len(os.listdir(tmp_path)) == 1
+
+    _InterruptedLinearRegression.n_fits = 0
+    _InterruptedLinearRegression.max_fits = None
+    dml_obj_resumed.fit(checkpoint_path=tmp_path, n_jobs_rep=1)
+    assert _InterruptedLinearRegression.n_fits == (dml_obj.n_rep - 1) * 4
+    assert np.array_equal(dml_obj.all_coef, dml_obj_resumed.all_coef)
+    assert np.array_equal(dml_obj.all_se, dml_obj_resumed.all_se)
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_nuisance_est_state(tmp_path):
+    # the start value of DoubleMLPQ is readjusted in the nuisance estimation and must not invalidate the checkpoint
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                             n_rep=2)
+    dml_obj.fit(checkpoint_path=tmp_path)
+    coef = dml_obj.coef.copy()
+    se = dml_obj.se.copy()
+
+    dml_obj.fit(checkpoint_path=tmp_path)
+    assert np.array_equal(dml_obj.coef, coef)
+    assert np.array_equal(dml_obj.se, se)
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_nuisance_est_state_resumed(tmp_path):
+    # the start value of the Brent search of DoubleMLPQ depends on the previous repetition and is restored from the
+    # checkpoint, such that a resumed fit yields the same estimates as an uninterrupted one
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                             n_rep=3)
+    dml_obj.fit(checkpoint_path=tmp_path)
+
+    # remove the cells of the last two repetitions, as if the fit was interrupted after the first one
+    for file_name in sorted(os.listdir(tmp_path))[1:]:
+        os.remove(tmp_path / file_name)
+    dml_obj_resumed = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                                     n_rep=3, draw_sample_splitting=False)
+    dml_obj_resumed.set_sample_splitting(dml_obj.smpls)
+    dml_obj_resumed.fit(checkpoint_path=tmp_path)
+    assert len(os.listdir(tmp_path)) == 3
+    assert np.array_equal(dml_obj.all_coef, dml_obj_resumed.all_coef)
+    assert np.array_equal(dml_obj.all_se, dml_obj_resumed.all_se)
+    assert dml_obj._coef_start_val == dml_obj_resumed._coef_start_val
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_weights_changed(tmp_path):
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLIRM(obj_dml_data, LinearRegression(), LogisticRegression(), n_folds=2, score='ATE')
+    dml_obj.fit(checkpoint_path=tmp_path)
+
+    weights = np.random.uniform(0.5, 1.5, size=obj_dml_data.n_obs)
+    dml_obj_weighted = dml.DoubleMLIRM(obj_dml_data, LinearRegression(), LogisticRegression(), n_folds=2, score='ATE',
+                                       weights=weights, draw_sample_splitting=False)
+    dml_obj_weighted.set_sample_splitting(dml_obj.smpls)
+    msg = 'was created for a different model, data, sample splitting or fit setting.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj_weighted.fit(checkpoint_path=tmp_path)
+
+
+@pytest.mark.ci
+def test_dml_checkpoint_kde_changed(tmp_path):
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2)
+    dml_obj.fit(checkpoint_path=tmp_path)
+
+    dml_obj_binned = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                                    kde=binned_kde, draw_sample_splitting=False)
+    dml_obj_binned.set_sample_splitting(dml_obj.smpls)
+    msg = 'was created for a different model, data, sample splitting or fit setting.'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj_binned.fit(checkpoint_path=tmp_path)
+
+    # a lambda cannot be hashed deterministically
+    dml_obj_lambda = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), quantile=0.5, n_folds=2,
+                                    kde=lambda u, weights: binned_kde(u, weights))
+    msg = 'The model cannot be fitted with a checkpoint_path, as some of its settings cannot be hashed'
+    with pytest.raises(ValueError, match=msg):
+        dml_obj_lambda.fit(checkpoint_path=tmp_path)
@@ -0,0 +1,133 @@
+import pytest
+import numpy as np
+import doubleml as dml
+from doubleml.datasets import make_irm_data, make_plr_CCDDHNR2018, make_did_SZ2020
+
+from ._utils import make_dml_model
+
+
+np.random.seed(3141)
+dml_data_plr = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+data_multi_treat = make_plr_CCDDHNR2018(n_obs=200, dim_x=5, return_type='DataFrame')
+dml_data_multi_treat = dml.DoubleMLData(data_multi_treat, 'y', ['d', 'X1'])
+dml_data_irm = make_irm_data(n_obs=200, dim_x=5)
+x_lpq = np.random.uniform(size=(300, 5))
+z_lpq = np.random.binomial(1, p=0.5, size=300)
+d_lpq = ((1.5 * z_lpq + np.random.normal(size=300)) > 0) * 1.0
+y_lpq = 2 * d_lpq + np.sqrt(0.5 * d_lpq + 1) * np.random.normal(size=300)
+dml_data_lpq = dml.DoubleMLData.from_arrays(x_lpq, y_lpq, d_lpq, z_lpq)
+dml_data_did = make_did_SZ2020(n_obs=200)
+
+
+# overrides the fixture of the conftest, as the fit without n_jobs_rep is the reference of the tests
+@pytest.fixture(scope='module',
+                params=[1, 2])
+def n_jobs_rep(request):
+    return request.param
+
+
+# the Brent search of the preliminary ipw quantile of DoubleMLPQ and DoubleMLLPQ starts at the estimate of the previous
+# repetition in a sequential fit, such that only the exact solver yields the same results for parallel repetitions
+@pytest.fixture(scope='module',
+                params=[('PLR', dml_data_plr, {}), ('PLR', dml_data_multi_treat, {}), ('IRM', dml_data_irm, {}),
+                        ('PQ', dml_data_irm, {'ipw_solver': 'exact'}), ('LPQ', dml_data_lpq, {'ipw_solver': 'exact'}),
+                        ('CVAR', dml_data_irm, {}), ('DID', dml_data_did, {})],
+                ids=['PLR', 'PLR_multi_treat', 'IRM', 'PQ', 'LPQ', 'CVAR', 'DID'])
+def model_data(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_fit_n_jobs_rep_fixture(model_data, n_jobs_rep):
+    model, obj_dml_data, model_kwargs = model_data
+    n_rep = 3
+    np.random.seed(3141)
+    dml_obj = make_dml_model(model, obj_dml_data, n_folds=2, n_rep=n_rep, **model_kwargs)
+    dml_obj.fit(store_models=True)
+    res_serial = {'coef': dml_obj.coef,
+                  'se': dml_obj.se,
+                  'all_coef': dml_obj.all_coef,
+                  'psi': dml_obj.psi,
+                  'predictions': dml_obj.predictions,
+                  'sensitivity_elements': dml_obj.sensitivity_elements or {},
+                  'nuisance_loss': dml_obj.nuisance_loss,
+                  'coef_start_val': getattr(dml_obj, '_coef_start_val', np.nan)}
+
+    # a new model object, such that no state of the serial fit is reused
+    dml_obj_parallel = make_dml_model(model, obj_dml_data, n_folds=2, n_rep=n_rep, **model_kwargs)
+    dml_obj_parallel.set_sample_splitting(dml_obj.smpls)
+    dml_obj_parallel.fit(store_models=True, n_jobs_rep=n_jobs_rep)
+    res_parallel = {'coef': dml_obj_parallel.coef,
+                    'se': dml_obj_parallel.se,
+                    'all_coef': dml_obj_parallel.all_coef,
+                    'psi': dml_obj_parallel.psi,
+                    'predictions': dml_obj_parallel.predictions,
+                    'sensitivity_elements': dml_obj_parallel.sensitivity_elements or {},
+                    'nuisance_loss': dml_obj_parallel.nuisance_loss,
+                    'coef_start_val': getattr(dml_obj_parallel, '_coef_start_val', np.nan),
+                    'models': dml_obj_parallel.models}
+
+    return {'serial': res_serial, 'parallel': res_parallel, 'n_rep': n_rep}
+
+
+@pytest.mark.ci
+def test_dml_fit_n_jobs_rep_coef(dml_fit_n_jobs_rep_fixture):
+    res_serial = dml_fit_n_jobs_rep_fixture['serial']
+    res_parallel = dml_fit_n_jobs_rep_fixture['parallel']
+    for key in ['coef', 'se', 'all_coef', 'psi']:
+        assert np.allclose(res_serial[key], res_parallel[key], rtol=1e-9, atol=1e-4)
+    # state which is set during the nuisance estimation (e.g. the start value of DoubleMLPQ) is taken over
+    assert np.allclose(res_serial['coef_start_val'], res_parallel['coef_start_val'], equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_fit_n_jobs_rep_nuisance(dml_fit_n_jobs_rep_fixture):
+    res_serial = dml_fit_n_jobs_rep_fixture['serial']
+    res_parallel = dml_fit_n_jobs_rep_fixture['parallel']
+    for key in ['predictions', 'sensitivity_elements', 'nuisance_loss']:
+        for element in res_serial[key].keys():
+            assert np.allclose(res_serial[key][element], res_parallel[key][element],
+                               rtol=1e-9, atol=1e-4, equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_fit_n_jobs_rep_models(dml_fit_n_jobs_rep_fixture):
+    models = dml_fit_n_jobs_rep_fixture['parallel']['models']
+    for learner_models in models.values():
+        for treat_models in learner_models.values():
+            assert len(treat_models) == dml_fit_n_jobs_rep_fixture['n_rep']
+            assert all(fold_models is not None for fold_models in treat_models)
+
+
+@pytest.mark.ci
+def test_dml_fit_n_jobs_rep_cell_clone():
+    np.random.seed(3141)
+    dml_obj = make_dml_model('PLR', dml_data_multi_treat, n_folds=2, n_rep=3)
+    dml_obj.fit(store_models=True)
+
+    # the copy which is sent to a worker neither holds the data frame nor the results of the fit
+    cell_clone = dml_obj._cell_clone(1, 1)
+    assert cell_clone._dml_data.data.shape == (dml_obj._dml_data.n_obs, 0)
+    assert cell_clone._dml_data.n_obs == dml_obj._dml_data.n_obs
+    assert np.array_equal(cell_clone._dml_data.d, dml_data_multi_treat.data['X1'])
+    assert cell_clone._smpls is None
+    for key in ['_psi', '_psi_elements', '_predictions', '_models', '_framework']:
+        assert getattr(cell_clone, key) is None
+    # the original model is not changed
+    assert dml_obj._dml_data.data.shape[1] == dml_data_multi_treat.data.shape[1]
+    assert dml_obj.predictions is not None
+
+
+@pytest.mark.ci
+def test_dml_fit_n_jobs_rep_brent():
+    # with the default Brent search, the first repetition of a parallel fit starts at the same value as the sequential fit
+    np.random.seed(3141)
+    dml_obj = make_dml_model('PQ', dml_data_irm, n_folds=2, n_rep=3)
+    dml_obj.fit()
+    dml_obj_parallel = make_dml_model('PQ', dml_data_irm, n_folds=2, n_rep=3)
+    dml_obj_parallel.set_sample_splitting(dml_obj.smpls)
+    dml_obj_parallel.fit(n_jobs_rep=2)
+    assert np.allclose(dml_obj.all_coef[:, 0], dml_obj_parallel.all_coef[:, 0], rtol=1e-9, atol=1e-4)
+    for learner in dml_obj.params_names:
+        assert np.allclose(dml_obj.predictions[learner][:, 0, :], dml_obj_parallel.predictions[learner][:, 0, :],
+                           rtol=1e-9, atol=1e-4, equal_nan=True)
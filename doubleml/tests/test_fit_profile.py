@@ -0,0 +1,175 @@
+import numpy as np
+import pandas as pd
+import pytest
+from joblib import parallel_config
+
+from sklearn.linear_model import LinearRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data, make_pliv_CHS2015
+from doubleml.utils._profiling import _Profiler
+
+from ._utils import make_dml_model
+
+
+# extends the fixture of the conftest by PLIV (three learners with an instrument)
+@pytest.fixture(scope='module',
+                params=['PLR', 'IRM', 'PLIV'])
+def model(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_fit_profile_fixture(model, n_jobs_rep):
+    np.random.seed(3141)
+    if model == 'PLR':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+        obj_dml_data = dml.DoubleMLData(obj_dml_data.data, 'y', ['d', 'X1'])
+    elif model == 'IRM':
+        obj_dml_data = make_irm_data(n_obs=200, dim_x=5)
+    else:
+        obj_dml_data = make_pliv_CHS2015(n_obs=200, dim_x=5, dim_z=1)
+
+    np.random.seed(42)
+    dml_obj = make_dml_model(model, obj_dml_data, n_folds=3, n_rep=2, draw_sample_splitting=False)
+    dml_obj.draw_sample_splitting()
+    smpls = dml_obj.smpls
+    dml_obj.fit()
+
+    records = list()
+    dml_obj_profiled = make_dml_model(model, obj_dml_data, n_folds=3, n_rep=2, draw_sample_splitting=False)
+    dml_obj_profiled.set_sample_splitting(smpls)
+    dml_obj_profiled.fit(profile=True, profile_callbacks=[records.append], n_jobs_rep=n_jobs_rep)
+    fit_profile = dml_obj_profiled.fit_profile
+    dml_obj_profiled.bootstrap(n_rep_boot=10)
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_profiled': dml_obj_profiled,
+                'fit_profile': fit_profile,
+                'records': records}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_fit_profile_coef(dml_fit_profile_fixture):
+    assert np.allclose(dml_fit_profile_fixture['dml_obj'].all_coef,
+                       dml_fit_profile_fixture['dml_obj_profiled'].all_coef,
+                       rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_fit_profile_fixture['dml_obj'].all_se,
+                       dml_fit_profile_fixture['dml_obj_profiled'].all_se,
+                       rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_dml_fit_profile_records(dml_fit_profile_fixture):
+    dml_obj = dml_fit_profile_fixture['dml_obj_profiled']
+    fit_profile = dml_fit_profile_fixture['fit_profile']
+    n_cells = dml_obj.n_rep * dml_obj._dml_data.n_treat
+
+    assert isinstance(fit_profile, pd.DataFrame)
+    assert list(fit_profile.columns) == ['step', 'learner', 'rep', 'treatment', 'fold',
+                                         'wall_time', 'cpu_time', 'peak_rss_mb']
+    assert (fit_profile['wall_time'] >= 0).all()
+
+    # one fit and predict record per learner, repetition, treatment variable and fold
+    for step in ['fit', 'predict']:
+        step_profile = fit_profile[fit_profile['step'] == step]
+        assert set(step_profile['learner']) == set(dml_obj.params_names)
+        assert len(step_profile) == len(dml_obj.params_names) * n_cells * dml_obj.n_folds
+        for (i_rep, treat_var), cell_profile in step_profile.groupby(['rep', 'treatment']):
+            assert treat_var in dml_obj._dml_data.d_cols
+            assert sorted(cell_profile['fold'].unique()) == list(range(dml_obj.n_folds))
+    for step in ['solve_score', 'se']:
+        assert (fit_profile['step'] == step).sum() == n_cells
+    assert (fit_profile['step'] == 'aggregate').sum() == 1
+    if dml_obj._sensitivity_implemented:
+        assert (fit_profile['step'] == 'sensitivity_elements').sum() == n_cells
+
+    # subsequent steps are appended
+    assert (dml_obj.fit_profile['step'] == 'bootstrap').sum() == 1
+
+    # the callbacks receive every record
+    records = dml_fit_profile_fixture['records']
+    assert [record['step'] for record in records] == list(dml_obj.fit_profile['step'])
+    assert [record['wall_time'] for record in records] == list(dml_obj.fit_profile['wall_time'])
+
+
+@pytest.mark.ci
+def test_dml_fit_profile_peak_rss():
+    profiler = _Profiler()
+    with profiler.measure('small'):
+        _ = np.ones(10)
+    with profiler.measure('large'):
+        # the memory is written, such that it is resident
+        x = np.ones(5 * 10 ** 7)
+        del x
+    peak_rss = {record['step']: record['peak_rss_mb'] for record in profiler.records}
+    # the high-water mark of the process is not reset between the steps
+    assert peak_rss['small'] > 0
+    assert peak_rss['large'] >= peak_rss['small']
+    assert peak_rss['large'] >= 5 * 10 ** 7 * 8 / 1024 ** 2
+
+
+@pytest.mark.ci
+def test_dml_fit_profile_threading_backend():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=3, n_rep=2)
+    with parallel_config(backend='threading'):
+        dml_obj.fit(profile=True, n_jobs_cv=2, n_jobs_rep=2)
+    assert (dml_obj.fit_profile['peak_rss_mb'] > 0).all()
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('model', ['PQ', 'LPQ', 'CVAR'])
+def test_dml_fit_profile_quantile_models(model):
+    np.random.seed(3141)
+    if model == 'LPQ':
+        x = np.random.uniform(size=(300, 5))
+        z = np.random.binomial(1, 0.5, size=300)
+        d = 1.0 * (1.5 * z + np.random.normal(size=300) > 0)
+        y = 2 * d + np.random.normal(size=300)
+        obj_dml_data = dml.DoubleMLData.from_arrays(x, y, d, z)
+    else:
+        obj_dml_data = make_irm_data(n_obs=300, dim_x=5)
+    dml_obj = make_dml_model(model, obj_dml_data, n_folds=3, n_rep=2)
+    dml_obj.fit(profile=True)
+    fit_profile = dml_obj.fit_profile
+
+    # the fold-wise fits and predictions of the nested cross-fitting are recorded for every learner
+    for step in ['fit', 'predict']:
+        for learner in dml_obj.params_names:
+            learner_profile = fit_profile[(fit_profile['step'] == step) & (fit_profile['learner'] == learner)]
+            assert len(learner_profile) == dml_obj.n_rep * dml_obj.n_folds
+            for _, rep_profile in learner_profile.groupby('rep'):
+                assert sorted(rep_profile['fold']) == list(range(dml_obj.n_folds))
+
+    # the preliminary propensity fits are recorded with the outer fold (one row per inner fold)
+    prelim_learner = 'ml_m_z_prelim' if model == 'LPQ' else 'ml_m_prelim'
+    learner_steps = fit_profile[fit_profile['step'].isin(['fit', 'predict'])]
+    assert learner_steps['learner'].notna().all()
+    for step in ['fit', 'predict']:
+        prelim_profile = fit_profile[(fit_profile['step'] == step) & (fit_profile['learner'] == prelim_learner)]
+        assert len(prelim_profile) == dml_obj.n_rep * dml_obj.n_folds * dml_obj.n_folds
+        for _, rep_profile in prelim_profile.groupby('rep'):
+            assert sorted(rep_profile['fold']) == sorted(list(range(dml_obj.n_folds)) * dml_obj.n_folds)
+
+
+@pytest.mark.ci
+def test_dml_fit_profile_exceptions():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=2)
+    dml_obj.fit()
+    assert dml_obj.fit_profile is None
+
+    msg = 'profile must be True or False. Got 1.'
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(profile=1)
+    msg = "profile_callbacks must be None or a list of callables. 1 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(profile=True, profile_callbacks=1)
+    msg = r"profile_callbacks must be None or a list of callables. \[1\] of type <class 'list'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(profile=True, profile_callbacks=[1])
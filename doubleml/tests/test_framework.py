@@ -5,6 +5,7 @@ import pandas as pd
 from doubleml.datasets import make_irm_data
 from doubleml.irm.irm import DoubleMLIRM
 from doubleml.double_ml_framework import DoubleMLFramework, concat
+from doubleml.utils._estimation import _draw_weights
 from ._utils import generate_dml_dict
 
 from sklearn.linear_model import LinearRegression, LogisticRegression
@@ -294,3 +295,76 @@ def test_dml_framework_from_doubleml_ci(dml_framework_from_doubleml_fixture):
     assert isinstance(dml_framework_from_doubleml_fixture['ci_joint_mul_obj'], pd.DataFrame)
     assert isinstance(dml_framework_from_doubleml_fixture['ci_concat'], pd.DataFrame)
     assert isinstance(dml_framework_from_doubleml_fixture['ci_joint_concat'], pd.DataFrame)
+
+
+@pytest.fixture(scope='module',
+                params=['Bayes', 'normal', 'wild'])
+def boot_method(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_dml_framework_bootstrap_chunked(n_rep, n_thetas, boot_method):
+    n_obs = 100
+    n_rep_boot = 99
+    chunk_size = 30
+    psi_a = np.ones(shape=(n_obs, n_thetas, n_rep))
+    psi_b = np.random.normal(size=(n_obs, n_thetas, n_rep))
+    dml_framework_obj = DoubleMLFramework(generate_dml_dict(psi_a, psi_b))
+
+    np.random.seed(3141)
+    dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=n_rep_boot, chunk_size=chunk_size)
+    boot_t_stat = dml_framework_obj.boot_t_stat
+
+    # manual chunked bootstrap
+    np.random.seed(3141)
+    var_scaling = dml_framework_obj.var_scaling_factors.reshape(-1, 1) * dml_framework_obj.all_ses
+    boot_t_stat_manual = np.zeros((n_rep_boot, n_thetas, n_rep))
+    for start in range(0, n_obs, chunk_size):
+        stop = min(start + chunk_size, n_obs)
+        weights = _draw_weights(boot_method, n_rep * n_rep_boot, stop - start)
+        for i_rep in range(n_rep):
+            weights_rep = weights[i_rep * n_rep_boot:(i_rep + 1) * n_rep_boot, :]
+            boot_t_stat_manual[:, :, i_rep] += np.matmul(
+                weights_rep, dml_framework_obj.scaled_psi[start:stop, :, i_rep] / var_scaling[:, i_rep])
+    assert np.allclose(boot_t_stat, boot_t_stat_manual, rtol=1e-9, atol=1e-4)
+
+    # a single chunk with a single repetition coincides with the unchunked bootstrap
+    if n_rep == 1:
+        np.random.seed(3141)
+        dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=n_rep_boot, chunk_size=n_obs)
+        boot_t_stat_single_chunk = dml_framework_obj.boot_t_stat
+        np.random.seed(3141)
+        dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=n_rep_boot)
+        assert np.allclose(boot_t_stat_single_chunk, dml_framework_obj.boot_t_stat, rtol=1e-9, atol=1e-4)
+
+
+@pytest.fixture(scope='module',
+                params=[None, 30])
+def chunk_size(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_dml_framework_bootstrap_random_state(n_rep, n_thetas, boot_method, chunk_size):
+    n_obs = 100
+    psi_a = np.ones(shape=(n_obs, n_thetas, n_rep))
+    psi_b = np.random.normal(size=(n_obs, n_thetas, n_rep))
+    dml_framework_obj = DoubleMLFramework(generate_dml_dict(psi_a, psi_b))
+
+    global_state = np.random.get_state()
+    dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=99, chunk_size=chunk_size, random_state=42)
+    boot_t_stat = dml_framework_obj.boot_t_stat
+    # seeded draws do not consume the global random state
+    assert np.array_equal(global_state[1], np.random.get_state()[1])
+
+    dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=99, chunk_size=chunk_size,
+                                random_state=np.random.SeedSequence(42))
+    assert np.array_equal(boot_t_stat, dml_framework_obj.boot_t_stat)
+
+    dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=99, chunk_size=chunk_size, random_state=42,
+                                n_jobs_boot=2)
+    assert np.array_equal(boot_t_stat, dml_framework_obj.boot_t_stat)
+
+    dml_framework_obj.bootstrap(method=boot_method, n_rep_boot=99, chunk_size=chunk_size, random_state=43)
+    assert not np.allclose(boot_t_stat, dml_framework_obj.boot_t_stat)
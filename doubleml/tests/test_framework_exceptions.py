@@ -275,6 +275,29 @@ def test_operation_exceptions():
         _ = dml_framework_obj_2 + dml_framework_obj_cluster
 
 
+@pytest.mark.ci
+def test_bootstrap_exceptions():
+    msg = "The chunk size of the bootstrap must be of int type \\(or None\\). 1.0 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_framework_obj_1.bootstrap(chunk_size=1.0)
+
+    msg = 'The chunk size of the bootstrap must be positive. 0 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        _ = dml_framework_obj_1.bootstrap(chunk_size=0)
+
+    msg = ("random_state must be None, an int or a numpy.random.SeedSequence. "
+           "1.0 of type <class 'float'> was passed.")
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_framework_obj_1.bootstrap(random_state=1.0)
+    msg = 'random_state must be non-negative. -1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        _ = dml_framework_obj_1.bootstrap(random_state=-1)
+
+    msg = "The number of CPUs used for the bootstrap must be of int type. 2 of type <class 'str'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = dml_framework_obj_1.bootstrap(n_jobs_boot='2')
+
+
 @pytest.mark.ci
 def test_p_adjust_exceptions():
     msg = "The p_adjust method must be of str type. 1 of type <class 'int'> was passed."
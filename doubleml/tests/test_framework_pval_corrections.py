@@ -3,7 +3,7 @@ import pytest
 import numpy as np
 
 from doubleml.double_ml_framework import DoubleMLFramework
-from ._utils import generate_dml_dict
+from ._utils import generate_dml_dict, p_adjust_romano_wolf_manual
 
 
 @pytest.fixture(scope='module',
@@ -67,6 +67,20 @@ def test_dml_framework_pval_shape(dml_framework_tstat_pval_fixture):
     assert np.all(np.isfinite(all_p_vals))
 
 
+@pytest.mark.ci
+def test_dml_framework_p_adjust_romano_wolf(dml_framework_tstat_pval_fixture):
+    dml_framework_obj = dml_framework_tstat_pval_fixture['dml_framework_obj']
+    dml_framework_obj.bootstrap(n_rep_boot=499)
+    df_p_vals, all_p_vals_corrected = dml_framework_obj.p_adjust(method='romano-wolf')
+
+    all_p_vals_manual = np.full_like(all_p_vals_corrected, np.nan)
+    for i_rep in range(dml_framework_obj.n_rep):
+        all_p_vals_manual[:, i_rep] = p_adjust_romano_wolf_manual(dml_framework_obj.all_t_stats[:, i_rep],
+                                                                  dml_framework_obj._boot_t_stat[:, :, i_rep])
+    assert np.array_equal(all_p_vals_corrected, all_p_vals_manual)
+    assert np.array_equal(df_p_vals['pval'].values, np.median(all_p_vals_manual, axis=1))
+
+
 @pytest.fixture(scope='module')
 def dml_framework_pval_cov_fixture(n_rep, sig_level):
     np.random.seed(42)
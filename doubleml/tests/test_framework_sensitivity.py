@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 
 from doubleml.irm.irm import DoubleMLIRM
 from doubleml.double_ml_framework import concat
@@ -104,3 +105,24 @@ def test_dml_framework_sensitivity_summary(dml_framework_sensitivity_fixture):
     ]
     for substring in substrings:
         assert substring in sensitivity_summary
+
+
+@pytest.mark.ci
+def test_dml_framework_sensitivity_grid(dml_framework_sensitivity_fixture):
+    cf_y_vec = np.array([0.0, 0.03, 0.1, 0.2])
+    cf_d_vec = np.array([0.05, 0.0, 0.2, 0.1])
+    rho = 0.7
+    level = 0.9
+
+    object_list = ['dml_framework_obj',
+                   'dml_framework_obj_sub_obj',
+                   'dml_framework_obj_concat']
+    for obj in object_list:
+        framework_obj = dml_framework_sensitivity_fixture[obj]
+        grid_dict = framework_obj._calc_sensitivity_grid(cf_y=cf_y_vec, cf_d=cf_d_vec, rho=rho, level=level)
+        for i_point, (cf_y, cf_d) in enumerate(zip(cf_y_vec, cf_d_vec)):
+            sens_dict = framework_obj._calc_sensitivity_analysis(cf_y=float(cf_y), cf_d=float(cf_d), rho=rho, level=level)
+            for value in ['theta', 'se', 'ci']:
+                for bound in ['lower', 'upper']:
+                    assert np.allclose(grid_dict[value][bound][i_point, :], sens_dict[value][bound],
+                                       rtol=1e-9, atol=1e-10)
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import doubleml as dml
+import doubleml.utils
+
+_HEAVY_MODULES = ['statsmodels', 'plotly', 'rdrobust', 'sklearn.tree']
+
+
+def _imported_modules(code):
+    # import in a fresh interpreter, as the modules are already imported in the test session
+    code = code + '\nimport sys\nprint(",".join(sys.modules))'
+    res = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return res.stdout.strip().split(',')
+
+
+@pytest.mark.ci
+def test_import_doubleml_is_lazy():
+    modules = _imported_modules('import doubleml')
+    for module in _HEAVY_MODULES + ['sklearn', 'pandas', 'doubleml.double_ml', 'doubleml.plm.plr']:
+        assert module not in modules
+
+
+@pytest.mark.ci
+@pytest.mark.parametrize('code', ['from doubleml import DoubleMLPLR',
+                                  'import doubleml; doubleml.DoubleMLIRM',
+                                  'from doubleml.did import DoubleMLDID'])
+def test_import_model_without_heavy_dependencies(code):
+    modules = _imported_modules(code)
+    for module in _HEAVY_MODULES:
+        assert module not in modules
+
+
+@pytest.mark.ci
+def test_lazy_attributes():
+    for name in dml.__all__:
+        assert getattr(dml, name).__name__ == name
+        assert name in dir(dml)
+    for name in doubleml.utils.__all__:
+        assert getattr(doubleml.utils, name).__name__ == name
+    assert dml.DoubleMLPLR is dml.plm.DoubleMLPLR
+    assert dml.DoubleMLBLP is dml.utils.DoubleMLBLP
+
+    msg = "module 'doubleml' has no attribute 'DoubleMLXYZ'"
+    with pytest.raises(AttributeError, match=msg):
+        _ = dml.DoubleMLXYZ
+    msg = "module 'doubleml.utils' has no attribute 'DoubleMLXYZ'"
+    with pytest.raises(AttributeError, match=msg):
+        _ = doubleml.utils.DoubleMLXYZ
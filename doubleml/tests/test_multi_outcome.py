@@ -0,0 +1,146 @@
+import pytest
+import numpy as np
+import doubleml as dml
+from doubleml.datasets import make_irm_data, make_plr_CCDDHNR2018
+
+from sklearn.linear_model import LinearRegression
+
+from ._utils import CountingLinearRegression, CountingLogisticRegression, reset_fit_counters, get_n_fits, \
+    make_dml_model
+
+
+np.random.seed(3141)
+n_obs = 200
+data_plr = make_plr_CCDDHNR2018(n_obs=n_obs, dim_x=5, return_type='DataFrame')
+data_plr['y2'] = 0.5 * data_plr['y'] + np.random.normal(size=n_obs)
+data_plr['y3'] = data_plr['X1'] - data_plr['d'] + np.random.normal(size=n_obs)
+data_irm = make_irm_data(n_obs=n_obs, dim_x=5, return_type='DataFrame')
+data_irm['y2'] = data_irm['y'] + np.random.normal(size=n_obs)
+data_irm['y3'] = data_irm['X1'] + 0.2 * data_irm['d'] + np.random.normal(size=n_obs)
+y_cols = ['y', 'y2', 'y3']
+x_cols = ['X1', 'X2', 'X3', 'X4', 'X5']
+data_multi_y = {'PLR': data_plr, 'IRM': data_irm}
+
+
+def _make_model(model, y_col, n_rep, score):
+    dml_data = dml.DoubleMLData(data_multi_y[model], y_col, 'd', x_cols)
+    # only the fits of ml_m are counted
+    learners = {'ml_m': CountingLinearRegression() if model == 'PLR' else CountingLogisticRegression()}
+    if score == 'IV-type':
+        learners['ml_g'] = LinearRegression()
+    return make_dml_model(model, dml_data, n_folds=3, n_rep=n_rep, score=score, **learners)
+
+
+@pytest.fixture(scope='module',
+                params=[('PLR', 'partialling out'), ('PLR', 'IV-type'), ('IRM', 'ATE'), ('IRM', 'ATTE')])
+def model_score(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def dml_multi_outcome_fixture(model_score, n_jobs_rep):
+    model, score = model_score
+    n_rep = 2
+    np.random.seed(3141)
+    dml_obj = _make_model(model, y_cols, n_rep, score)
+
+    reset_fit_counters()
+    dml_obj.fit(store_models=True, n_jobs_rep=n_jobs_rep)
+    n_fits_m = get_n_fits()
+
+    dml_objs_single = []
+    for y_col in y_cols:
+        dml_obj_single = _make_model(model, y_col, n_rep, score)
+        dml_obj_single.set_sample_splitting(dml_obj.smpls)
+        dml_obj_single.fit()
+        dml_objs_single.append(dml_obj_single)
+
+    return {'dml_obj': dml_obj, 'dml_objs_single': dml_objs_single, 'n_fits_m': n_fits_m, 'n_rep': n_rep,
+            'n_jobs_rep': n_jobs_rep}
+
+
+@pytest.mark.ci
+def test_multi_outcome_coef(dml_multi_outcome_fixture):
+    dml_obj = dml_multi_outcome_fixture['dml_obj']
+    for i_coef, dml_obj_single in enumerate(dml_multi_outcome_fixture['dml_objs_single']):
+        assert np.allclose(dml_obj.coef[i_coef], dml_obj_single.coef[0], rtol=1e-9, atol=1e-4)
+        assert np.allclose(dml_obj.se[i_coef], dml_obj_single.se[0], rtol=1e-9, atol=1e-4)
+        assert np.allclose(dml_obj.all_coef[i_coef, :], dml_obj_single.all_coef[0, :], rtol=1e-9, atol=1e-4)
+        assert np.allclose(dml_obj.psi[:, :, i_coef], dml_obj_single.psi[:, :, 0], rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_multi_outcome_nuisance(dml_multi_outcome_fixture):
+    dml_obj = dml_multi_outcome_fixture['dml_obj']
+    for i_coef, dml_obj_single in enumerate(dml_multi_outcome_fixture['dml_objs_single']):
+        for key in ['predictions', 'nuisance_targets', 'sensitivity_elements']:
+            for element, value in getattr(dml_obj_single, key).items():
+                assert np.allclose(getattr(dml_obj, key)[element][:, :, i_coef], value[:, :, 0],
+                                   rtol=1e-9, atol=1e-4, equal_nan=True)
+        for learner, value in dml_obj_single.nuisance_loss.items():
+            assert np.allclose(dml_obj.nuisance_loss[learner][:, i_coef], value[:, 0],
+                               rtol=1e-9, atol=1e-4, equal_nan=True)
+
+
+@pytest.mark.ci
+def test_multi_outcome_ml_m_fitted_once(dml_multi_outcome_fixture):
+    dml_obj = dml_multi_outcome_fixture['dml_obj']
+    n_rep = dml_multi_outcome_fixture['n_rep']
+    # ml_m is fitted once per fold and repetition, not once per outcome variable
+    # with n_jobs_rep the learners are fitted in worker processes and the fits are not counted here
+    if dml_multi_outcome_fixture['n_jobs_rep'] is None:
+        assert dml_multi_outcome_fixture['n_fits_m'] == dml_obj.n_folds * n_rep
+    for i_rep in range(n_rep):
+        m_models = [dml_obj.models['ml_m'][y_col][i_rep] for y_col in y_cols]
+        assert all(models is m_models[0] for models in m_models)
+
+
+@pytest.mark.ci
+def test_multi_outcome_framework(dml_multi_outcome_fixture):
+    dml_obj = dml_multi_outcome_fixture['dml_obj']
+    assert dml_obj.framework.n_thetas == len(y_cols)
+    assert list(dml_obj.summary.index) == y_cols
+    assert list(dml_obj.confint(joint=False).index) == y_cols
+    dml_obj.bootstrap(n_rep_boot=100)
+    assert list(dml_obj.p_adjust(method='romano-wolf').index) == y_cols
+    assert list(dml_obj.models['ml_m'].keys()) == y_cols
+
+
+@pytest.mark.ci
+def test_multi_outcome_checkpoint(tmp_path):
+    np.random.seed(3141)
+    dml_obj = _make_model('PLR', y_cols, 2, 'partialling out')
+    dml_obj.fit(checkpoint_path=tmp_path)
+    coef = dml_obj.coef.copy()
+    se = dml_obj.se.copy()
+
+    reset_fit_counters()
+    dml_obj.fit(checkpoint_path=tmp_path)
+    assert get_n_fits() == 0
+    assert np.allclose(dml_obj.coef, coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_obj.se, se, rtol=1e-9, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_multi_outcome_exceptions():
+    dml_data_multi_y = dml.DoubleMLData(data_plr, y_cols, 'd', x_cols)
+    msg = 'Multiple outcome variables are not implemented for DoubleMLPLIV.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_data_iv = dml.DoubleMLData(data_plr, y_cols, 'd', ['X2', 'X3'], 'X1')
+        _ = dml.DoubleMLPLIV(dml_data_iv, LinearRegression(), LinearRegression(), LinearRegression())
+    msg = 'Multiple outcome variables are only implemented for a single treatment variable.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_data_multi_treat = dml.DoubleMLData(data_plr, y_cols, ['d', 'X1'], ['X2', 'X3'])
+        _ = dml.DoubleMLPLR(dml_data_multi_treat, LinearRegression(), LinearRegression())
+
+    dml_obj = dml.DoubleMLPLR(dml_data_multi_y, LinearRegression(), LinearRegression())
+    msg = 'External predictions are not implemented for multiple outcome variables.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_obj.fit(external_predictions={'d': {'ml_m': np.zeros((n_obs, 1))}})
+    msg = 'Tuning is not implemented for multiple outcome variables.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_obj.tune({'ml_l': {'fit_intercept': [True, False]}, 'ml_m': {'fit_intercept': [True, False]}})
+    dml_obj.fit()
+    msg = 'Only implemented for single outcome. Number of outcomes is 3.'
+    with pytest.raises(NotImplementedError, match=msg):
+        dml_obj.cate(data_plr[['X1']])
@@ -7,6 +7,7 @@ from sklearn.ensemble import RandomForestRegressor
 
 import doubleml as dml
 from doubleml.datasets import make_pliv_multiway_cluster_CKMS2021
+from doubleml.utils._estimation import _draw_weights, _cluster_psi_sums
 
 from ._utils import _clone
 from ._utils_cluster import var_one_way_cluster, est_one_way_cluster_dml2, \
@@ -349,3 +350,65 @@ def test_dml_plr_cluster_with_index_se(dml_plr_cluster_with_index):
     assert math.isclose(dml_plr_cluster_with_index['se'][0],
                         dml_plr_cluster_with_index['se_ext_smpls'][0],
                         rel_tol=1e-9, abs_tol=1e-4)
+
+
+@pytest.fixture(scope='module',
+                params=['oneway', 'twoway'])
+def cluster_type(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_dml_pliv_cluster_bootstrap(cluster_type):
+    n_rep = 2
+    n_rep_boot = 499
+    if cluster_type == 'oneway':
+        dml_data = obj_dml_oneway_cluster_data
+    else:
+        dml_data = obj_dml_cluster_data
+
+    np.random.seed(3141)
+    dml_pliv_obj = dml.DoubleMLPLIV(dml_data, LinearRegression(), LinearRegression(), LinearRegression(),
+                                    n_folds=2, n_rep=n_rep)
+    dml_pliv_obj.fit()
+    np.random.seed(3141)
+    dml_pliv_obj.bootstrap(method='normal', n_rep_boot=n_rep_boot)
+
+    # reference: loop over the clusters of every cluster variable (the weights are drawn for the sorted cluster labels
+    # of the first and then of the second cluster variable); the bootstrap statistic sum_i (u_g(i) + v_h(i)) psi_i is
+    # studentized with the root of the sum of the squared cluster sums of psi over both cluster variables
+    np.random.seed(3141)
+    scaled_psi = dml_pliv_obj.framework.scaled_psi
+    cluster_vars = dml_data.cluster_vars
+    cluster_labels = [sorted(set(cluster_vars[:, i_var])) for i_var in range(dml_data.n_cluster_vars)]
+    boot_t_stat = np.full((n_rep_boot, 1, n_rep), np.nan)
+    for i_rep in range(n_rep):
+        weights = _draw_weights('normal', n_rep_boot, sum(len(labels) for labels in cluster_labels))
+        boot_sum = np.zeros(n_rep_boot)
+        psi_var = 0.
+        i_weight = 0
+        for i_var, labels in enumerate(cluster_labels):
+            for label in labels:
+                cluster_sum = sum(scaled_psi[i_obs, 0, i_rep] for i_obs in range(dml_data.n_obs)
+                                  if cluster_vars[i_obs, i_var] == label)
+                boot_sum += weights[:, i_weight] * cluster_sum
+                psi_var += cluster_sum ** 2
+                i_weight += 1
+        boot_t_stat[:, 0, i_rep] = boot_sum / np.sqrt(psi_var)
+
+    assert np.allclose(dml_pliv_obj.framework.boot_t_stat, boot_t_stat, rtol=1e-9, atol=1e-4)
+
+    ci_joint = dml_pliv_obj.confint(joint=True)
+    assert np.all(ci_joint.iloc[:, 0] < dml_pliv_obj.coef) & np.all(dml_pliv_obj.coef < ci_joint.iloc[:, 1])
+    df_p_vals, _ = dml_pliv_obj.framework.p_adjust(method='romano-wolf')
+    assert np.all((df_p_vals['pval'] >= 0) & (df_p_vals['pval'] <= 1))
+
+
+@pytest.mark.ci
+def test_cluster_psi_sums():
+    # hand-computed cluster sums for two cluster variables
+    psi = np.arange(1., 7.).reshape(-1, 1, 1)
+    cluster_vars = np.array([[0, 10], [0, 20], [1, 10], [1, 20], [2, 10], [2, 10]])
+    psi_sums = _cluster_psi_sums(psi, cluster_vars)
+    assert psi_sums.shape == (5, 1, 1)
+    assert np.array_equal(psi_sums[:, 0, 0], [1. + 2., 3. + 4., 5. + 6., 1. + 3. + 5. + 6., 2. + 4.])
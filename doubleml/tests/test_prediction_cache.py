@@ -0,0 +1,142 @@
+import os
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LinearRegression
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_irm_data
+
+from ._utils import CountingLinearRegression, CountingLogisticRegression, reset_fit_counters, get_n_fits, \
+    make_dml_model
+
+
+def _cache_files(cache_dir):
+    # the files are only written on a cache miss, such that unchanged files also show the cache hits of fits in
+    # worker processes (where the fits are not counted in this process)
+    cache_files = dict()
+    for file in os.listdir(cache_dir):
+        file_stat = os.stat(os.path.join(cache_dir, file))
+        cache_files[file] = (file_stat.st_ino, file_stat.st_mtime_ns)
+    return cache_files
+
+
+@pytest.fixture(scope='module')
+def dml_prediction_cache_fixture(model, n_jobs_rep, tmp_path_factory):
+    np.random.seed(3141)
+    if model == 'PLR':
+        obj_dml_data = make_plr_CCDDHNR2018(n_obs=300, dim_x=5)
+        other_setting = {'score': 'IV-type'}
+        other_learners = {'ml_g': CountingLinearRegression()}
+    else:
+        obj_dml_data = make_irm_data(n_obs=300, dim_x=5)
+        other_setting = {'trimming_threshold': 0.05}
+        other_learners = {}
+    cache_dir = tmp_path_factory.mktemp('cache')
+    model_settings = {'ml_reg': CountingLinearRegression(), 'ml_clf': CountingLogisticRegression(),
+                      'n_folds': 3, 'n_rep': 2, 'draw_sample_splitting': False}
+
+    np.random.seed(42)
+    dml_obj = make_dml_model(model, obj_dml_data, **model_settings)
+    dml_obj.draw_sample_splitting()
+    smpls = dml_obj.smpls
+    dml_obj.fit()
+
+    reset_fit_counters()
+    dml_obj_cached = make_dml_model(model, obj_dml_data, **model_settings)
+    dml_obj_cached.set_sample_splitting(smpls)
+    dml_obj_cached.fit(cache_dir=cache_dir, n_jobs_rep=n_jobs_rep)
+    n_fits_first = get_n_fits()
+    cache_files_first = _cache_files(cache_dir)
+
+    reset_fit_counters()
+    dml_obj_rerun = make_dml_model(model, obj_dml_data, **model_settings)
+    dml_obj_rerun.set_sample_splitting(smpls)
+    dml_obj_rerun.fit(cache_dir=cache_dir, n_jobs_rep=n_jobs_rep)
+    n_fits_rerun = get_n_fits()
+    cache_files_rerun = _cache_files(cache_dir)
+
+    # a different score / trimming reuses the cached predictions of the shared nuisance models
+    dml_obj_other = make_dml_model(model, obj_dml_data, **model_settings, **other_setting, **other_learners)
+    dml_obj_other.set_sample_splitting(smpls)
+    dml_obj_other.fit()
+
+    dml_obj_other_cached = make_dml_model(model, obj_dml_data, **model_settings, **other_setting, **other_learners)
+    dml_obj_other_cached.set_sample_splitting(smpls)
+    reset_fit_counters()
+    dml_obj_other_cached.fit(cache_dir=str(cache_dir))
+    n_fits_other_cached = get_n_fits()
+    cache_files_other_cached = _cache_files(cache_dir)
+
+    res_dict = {'dml_obj': dml_obj,
+                'dml_obj_cached': dml_obj_cached,
+                'dml_obj_rerun': dml_obj_rerun,
+                'dml_obj_other': dml_obj_other,
+                'dml_obj_other_cached': dml_obj_other_cached,
+                'n_fits_first': n_fits_first,
+                'n_fits_rerun': n_fits_rerun,
+                'n_fits_other_cached': n_fits_other_cached,
+                'n_other_learners': len(other_learners),
+                'cache_files_first': cache_files_first,
+                'cache_files_rerun': cache_files_rerun,
+                'cache_files_other_cached': cache_files_other_cached}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_prediction_cache_coef(dml_prediction_cache_fixture):
+    dml_obj = dml_prediction_cache_fixture['dml_obj']
+    for key in ['dml_obj_cached', 'dml_obj_rerun']:
+        assert np.allclose(dml_obj.all_coef, dml_prediction_cache_fixture[key].all_coef, rtol=1e-9, atol=1e-12)
+        assert np.allclose(dml_obj.all_se, dml_prediction_cache_fixture[key].all_se, rtol=1e-9, atol=1e-12)
+    assert np.allclose(dml_prediction_cache_fixture['dml_obj_other'].all_coef,
+                       dml_prediction_cache_fixture['dml_obj_other_cached'].all_coef,
+                       rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.ci
+def test_dml_prediction_cache_predictions(dml_prediction_cache_fixture):
+    dml_obj = dml_prediction_cache_fixture['dml_obj']
+    dml_obj_rerun = dml_prediction_cache_fixture['dml_obj_rerun']
+    for learner in dml_obj.params_names:
+        assert np.allclose(dml_obj.predictions[learner], dml_obj_rerun.predictions[learner],
+                           rtol=1e-9, atol=1e-12, equal_nan=True)
+        assert np.allclose(dml_obj.nuisance_targets[learner], dml_obj_rerun.nuisance_targets[learner],
+                           rtol=1e-9, atol=1e-12, equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_prediction_cache_hits(dml_prediction_cache_fixture, n_jobs_rep):
+    # predictions and targets are stored per nuisance model and repetition (two repetitions with three folds)
+    n_learners = len(dml_prediction_cache_fixture['dml_obj'].params_names)
+    cache_files_first = dml_prediction_cache_fixture['cache_files_first']
+    assert len(cache_files_first) == n_learners * 2 * 2
+    # no file is written again in the rerun, i.e. all predictions are loaded from the cache
+    assert dml_prediction_cache_fixture['cache_files_rerun'] == cache_files_first
+    if n_jobs_rep is None:
+        # with n_jobs_rep the learners are fitted in worker processes and the fits are not counted here
+        assert dml_prediction_cache_fixture['n_fits_first'] == n_learners * 2 * 3
+        assert dml_prediction_cache_fixture['n_fits_rerun'] == 0
+
+
+@pytest.mark.ci
+def test_dml_prediction_cache_hits_other(dml_prediction_cache_fixture):
+    # only the additional learners of the other score (ml_g of the IV-type score) are fitted and stored
+    n_other_learners = dml_prediction_cache_fixture['n_other_learners']
+    cache_files_first = dml_prediction_cache_fixture['cache_files_first']
+    cache_files_other_cached = dml_prediction_cache_fixture['cache_files_other_cached']
+    assert dml_prediction_cache_fixture['n_fits_other_cached'] == n_other_learners * 2 * 3
+    assert len(cache_files_other_cached) == len(cache_files_first) + n_other_learners * 2 * 2
+    assert {file: cache_files_other_cached[file] for file in cache_files_first} == cache_files_first
+
+
+@pytest.mark.ci
+def test_dml_prediction_cache_exceptions():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=100, dim_x=5)
+    dml_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression())
+
+    msg = "cache_dir must be None, a str or a path-like object. 5 of type <class 'int'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        dml_obj.fit(cache_dir=5)
@@ -160,3 +160,73 @@ def test_dml_sensitivity_external_predictions(test_dml_benchmark_fixture):
                        test_dml_benchmark_fixture["external_benchmark"],
                        rtol=1e-9,
                        atol=1e-4)
+
+
+@pytest.fixture(scope="module")
+def dml_benchmark_multiple_sets_fixture(generate_data_bivariate, n_rep):
+    data = generate_data_bivariate
+    x_cols = data.columns[data.columns.str.startswith('X')].tolist()
+    d_cols = data.columns[data.columns.str.startswith('d')].tolist()
+
+    np.random.seed(3141)
+    obj_dml_data = dml.DoubleMLData(data, 'y', d_cols, x_cols)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, LinearRegression(), LinearRegression(), n_folds=5, n_rep=n_rep)
+    dml_plr_obj.fit()
+    all_coef = dml_plr_obj.all_coef.copy()
+    psi = dml_plr_obj.psi.copy()
+
+    benchmarking_sets = [['X1'], ['X2', 'X3'], ['X4']]
+    benchmark = dml_plr_obj.sensitivity_benchmark(benchmarking_set=benchmarking_sets, n_jobs_benchmark=2)
+    benchmarks_manual = [doubleml_sensitivity_benchmark_manual(dml_obj=dml_plr_obj, benchmarking_set=benchmarking_set)
+                         for benchmarking_set in benchmarking_sets]
+
+    dml_short = dml_plr_obj._lean_clone(obj_dml_data._copy_with_x_cols(['X1', 'X2']))
+
+    res_dict = {'dml_obj': dml_plr_obj,
+                'dml_short': dml_short,
+                'all_coef': all_coef,
+                'psi': psi,
+                'benchmark': benchmark,
+                'benchmarks_manual': benchmarks_manual,
+                'benchmarking_sets': benchmarking_sets,
+                'x_cols': x_cols,
+                'd_cols': d_cols}
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_sensitivity_benchmark_multiple_sets(dml_benchmark_multiple_sets_fixture):
+    benchmark = dml_benchmark_multiple_sets_fixture['benchmark']
+    d_cols = dml_benchmark_multiple_sets_fixture['d_cols']
+    assert benchmark.shape == (3 * len(d_cols), 4)
+    for benchmarking_set, benchmark_manual in zip(dml_benchmark_multiple_sets_fixture['benchmarking_sets'],
+                                                  dml_benchmark_multiple_sets_fixture['benchmarks_manual']):
+        assert benchmark.loc[', '.join(benchmarking_set)].equals(benchmark_manual)
+
+
+@pytest.mark.ci
+def test_dml_sensitivity_benchmark_clone(dml_benchmark_multiple_sets_fixture):
+    dml_obj = dml_benchmark_multiple_sets_fixture['dml_obj']
+    dml_short = dml_benchmark_multiple_sets_fixture['dml_short']
+
+    # the long model is not altered by the benchmarks
+    assert np.array_equal(dml_obj.all_coef, dml_benchmark_multiple_sets_fixture['all_coef'])
+    assert np.array_equal(dml_obj.psi, dml_benchmark_multiple_sets_fixture['psi'])
+    assert dml_obj._dml_data.x_cols == dml_benchmark_multiple_sets_fixture['x_cols']
+
+    # the clone is unfitted and shares the data with the long model
+    assert dml_short._dml_data.x_cols == ['X1', 'X2']
+    assert dml_short._dml_data.data is dml_obj._dml_data.data
+    assert np.shares_memory(dml_short._dml_data.y, dml_obj._dml_data.y)
+    assert dml_short._dml_data.x.shape[1] == 2 + (len(dml_benchmark_multiple_sets_fixture['d_cols']) - 1)
+    assert dml_short.framework is None
+    assert dml_short.predictions is None
+    assert np.all(np.isnan(dml_short.psi))
+    assert dml_short.psi is not dml_obj.psi
+
+    # setting the parameters of the clone does not change the long model
+    d_col = dml_benchmark_multiple_sets_fixture['d_cols'][0]
+    params = dml_obj.params['ml_l'][d_col]
+    dml_short.set_ml_nuisance_params('ml_l', d_col, {'fit_intercept': False})
+    assert dml_obj.params['ml_l'][d_col] is params
+    assert dml_short.params['ml_l'][d_col] is not params
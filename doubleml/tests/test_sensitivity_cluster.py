@@ -117,9 +117,18 @@ def dml_plr_multiway_cluster_sensitivity_rho0_se():
     dml_plr_obj.sensitivity_analysis(cf_y=cf_y, cf_d=cf_d,
                                      rho=0.0, level=level, null_hypothesis=0.0)
 
+    cf_y_vec = np.array([0.0, 0.03, 0.1])
+    cf_d_vec = np.array([0.1, 0.04, 0.0])
+    framework_obj = dml_plr_obj.framework
+    sensitivity_grid = framework_obj._calc_sensitivity_grid(cf_y=cf_y_vec, cf_d=cf_d_vec, rho=0.5, level=level)
+    sensitivity_points = [framework_obj._calc_sensitivity_analysis(cf_y=float(cf_y), cf_d=float(cf_d), rho=0.5, level=level)
+                          for cf_y, cf_d in zip(cf_y_vec, cf_d_vec)]
+
     res_dict = {'coef': dml_plr_obj.coef,
                 'se': dml_plr_obj.se,
-                'sensitivity_params': dml_plr_obj.sensitivity_params}
+                'sensitivity_params': dml_plr_obj.sensitivity_params,
+                'sensitivity_grid': sensitivity_grid,
+                'sensitivity_points': sensitivity_points}
 
     return res_dict
 
@@ -133,3 +142,13 @@ def test_dml_pliv_multiway_cluster_sensitivity_se(dml_plr_multiway_cluster_sensi
     assert math.isclose(dml_plr_multiway_cluster_sensitivity_rho0_se['se'][0],
                         dml_plr_multiway_cluster_sensitivity_rho0_se['sensitivity_params']['se']['upper'][0],
                         rel_tol=1e-9, abs_tol=1e-3)
+
+
+@pytest.mark.ci
+def test_dml_pliv_multiway_cluster_sensitivity_grid(dml_plr_multiway_cluster_sensitivity_rho0_se):
+    sensitivity_grid = dml_plr_multiway_cluster_sensitivity_rho0_se['sensitivity_grid']
+    for i_point, sensitivity_point in enumerate(dml_plr_multiway_cluster_sensitivity_rho0_se['sensitivity_points']):
+        for value in ['theta', 'se', 'ci']:
+            for bound in ['lower', 'upper']:
+                assert np.allclose(sensitivity_grid[value][bound][i_point, :], sensitivity_point[value][bound],
+                                   rtol=1e-9, atol=1e-10)
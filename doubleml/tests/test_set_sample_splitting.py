@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 
 from doubleml import DoubleMLPLR
+from doubleml.utils import DoubleMLResampling
 from doubleml.datasets import make_plr_CCDDHNR2018
 
 from sklearn.linear_model import Lasso
@@ -95,9 +96,9 @@ def test_doubleml_set_sample_splitting_all_list():
     _assert_smpls_equal(smpls, dml_plr.smpls)
 
     smpls = np.array(([0, 1, 2, 3, 4], [5, 6, 7, 8, 9]))
-    # msg = ("all_smpls must be of list or tuple type. [[0 1 2 3 4]"
-    #        r"\n [5 6 7 8 9]] of type <class 'numpy.ndarray'> was passed.")
-    with pytest.raises(TypeError):
+    msg = (r'Invalid fold assignment. The fold ids must be an array of shape \(n_obs,\) or \(n_obs, n_rep\) '
+           r'with n_obs=10. Array of shape \(2, 5\) passed.')
+    with pytest.raises(ValueError, match=msg):
         dml_plr.set_sample_splitting(smpls)
 
     # second sample splitting is not a list
@@ -256,3 +257,46 @@ def test_doubleml_set_sample_splitting_invalid_sets():
     msg = r'Invalid sample split. Test indices must be in \[0, n_obs\).'
     with pytest.raises(ValueError, match=msg):
         dml_plr.set_sample_splitting(smpls)
+
+
+@pytest.mark.ci
+def test_doubleml_set_sample_splitting_fold_ids():
+    np.random.seed(3141)
+    smpls = DoubleMLResampling(n_folds=3, n_rep=2, n_obs=n_obs).split_samples()
+    np.random.seed(3141)
+    fold_ids = DoubleMLResampling(n_folds=3, n_rep=2, n_obs=n_obs).split_fold_ids()
+    assert fold_ids.shape == (n_obs, 2)
+    assert fold_ids.dtype == np.int8
+
+    dml_plr.set_sample_splitting(fold_ids)
+    assert dml_plr.n_folds == 3
+    assert dml_plr.n_rep == 2
+    _assert_smpls_equal(smpls, dml_plr.smpls)
+
+    # fold ids of int64 type are stored compactly as well
+    dml_plr.set_sample_splitting(fold_ids[:, 0].astype(np.int64))
+    assert dml_plr.n_folds == 3
+    assert dml_plr.n_rep == 1
+    assert dml_plr.smpls.fold_ids.dtype == np.int8
+    _assert_smpls_equal(smpls[:1], dml_plr.smpls)
+
+    dml_plr_fold_ids = DoubleMLPLR(dml_data, ml_l, ml_m, draw_sample_splitting=False)
+    dml_plr_fold_ids.set_sample_splitting(fold_ids)
+    dml_plr_fold_ids.fit()
+    dml_plr_smpls = DoubleMLPLR(dml_data, ml_l, ml_m, draw_sample_splitting=False)
+    dml_plr_smpls.set_sample_splitting(smpls)
+    dml_plr_smpls.fit()
+    assert np.allclose(dml_plr_fold_ids.all_coef, dml_plr_smpls.all_coef, rtol=1e-9, atol=1e-4)
+
+    msg = 'Invalid fold assignment. Fold ids must be of type integer.'
+    with pytest.raises(TypeError, match=msg):
+        dml_plr.set_sample_splitting(fold_ids.astype(float))
+    msg = 'Invalid fold assignment. Fold ids must be non-negative.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.set_sample_splitting(fold_ids - 1)
+    msg = 'Invalid fold assignment. At least two folds are required.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.set_sample_splitting(np.zeros(n_obs, dtype=int))
+    msg = r'Invalid fold assignment. Each repetition must contain all fold ids 0, ..., 3.'
+    with pytest.raises(ValueError, match=msg):
+        dml_plr.set_sample_splitting(np.column_stack((fold_ids[:, 0], np.arange(n_obs) % 4)))
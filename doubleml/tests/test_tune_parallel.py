@@ -0,0 +1,178 @@
+import threading
+import time
+import numpy as np
+import pytest
+
+from sklearn.linear_model import Lasso
+from sklearn.ensemble import RandomForestRegressor
+
+import doubleml as dml
+from doubleml.datasets import make_plr_CCDDHNR2018, make_pliv_CHS2015
+from doubleml.utils._tuning import _TuningScheduler
+
+
+@pytest.fixture(scope='module',
+                params=['grid_search', 'randomized_search', 'halving_grid_search', 'halving_random_search'])
+def search_mode(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def tune_on_folds(request):
+    return request.param
+
+
+def _tune_plr(obj_dml_data, search_mode, tune_on_folds, n_jobs_tune):
+    ml_l = RandomForestRegressor(n_estimators=10, random_state=42)
+    ml_m = Lasso()
+    par_grids = {'ml_l': {'max_depth': [2, 3, 5], 'min_samples_leaf': [1, 5, 10]},
+                 'ml_m': {'alpha': np.linspace(0.05, .95, 7)}}
+
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, ml_l, ml_m, n_folds=2, n_rep=2)
+    tune_res = dml_plr_obj.tune(par_grids, tune_on_folds=tune_on_folds, n_folds_tune=3, search_mode=search_mode,
+                                n_iter_randomized_search=4, return_tune_res=True, n_jobs_tune=n_jobs_tune)
+    return dml_plr_obj, tune_res
+
+
+@pytest.fixture(scope='module')
+def dml_tune_parallel_fixture(search_mode, tune_on_folds):
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    obj_dml_data = dml.DoubleMLData(obj_dml_data.data, 'y', ['d', 'X1'])
+
+    res_dict = {'sequential': _tune_plr(obj_dml_data, search_mode, tune_on_folds, None),
+                'scheduled_1': _tune_plr(obj_dml_data, search_mode, tune_on_folds, 1),
+                'scheduled_2': _tune_plr(obj_dml_data, search_mode, tune_on_folds, 2),
+                'scheduled_2_rerun': _tune_plr(obj_dml_data, search_mode, tune_on_folds, 2)}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_params(dml_tune_parallel_fixture):
+    params = dml_tune_parallel_fixture['scheduled_1'][0].params
+    for key in ['scheduled_2', 'scheduled_2_rerun']:
+        assert dml_tune_parallel_fixture[key][0].params == params
+
+    # the tuned parameters are set for both treatment variables
+    for learner in ['ml_l', 'ml_m']:
+        for treat_var in ['d', 'X1']:
+            assert params[learner][treat_var] is not None
+            assert dml_tune_parallel_fixture['sequential'][0].params[learner][treat_var] is not None
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_tune_res(dml_tune_parallel_fixture, tune_on_folds):
+    tune_res_1 = dml_tune_parallel_fixture['scheduled_1'][1]
+    tune_res_2 = dml_tune_parallel_fixture['scheduled_2'][1]
+    tune_res_seq = dml_tune_parallel_fixture['sequential'][1]
+    if tune_on_folds:
+        # same (aliased) structure as for the sequential tuning
+        tune_res_1, tune_res_2, tune_res_seq = tune_res_1[0], tune_res_2[0], tune_res_seq[0]
+    assert len(tune_res_1) == len(tune_res_2) == len(tune_res_seq) == 2
+    for res_1, res_2 in zip(tune_res_1, tune_res_2):
+        assert res_1['params'] == res_2['params']
+        for key in ['l_tune', 'm_tune']:
+            for search_1, search_2 in zip(res_1['tune_res'][key], res_2['tune_res'][key]):
+                assert np.allclose(search_1.cv_results_['mean_test_score'], search_2.cv_results_['mean_test_score'],
+                                   equal_nan=True)
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_pliv_partial_xz(search_mode):
+    np.random.seed(3141)
+    obj_dml_data = make_pliv_CHS2015(n_obs=200, dim_x=5, dim_z=2)
+    par_grid = {'alpha': np.linspace(0.05, .95, 7)}
+
+    np.random.seed(3141)
+    dml_pliv_obj = dml.DoubleMLPLIV._partialXZ(obj_dml_data, Lasso(), Lasso(), Lasso(), n_folds=2)
+    dml_pliv_obj.tune({'ml_l': par_grid, 'ml_m': par_grid, 'ml_r': par_grid}, tune_on_folds=True,
+                      n_folds_tune=3, search_mode=search_mode, n_iter_randomized_search=4, n_jobs_tune=2)
+    for learner in ['ml_l', 'ml_m', 'ml_r']:
+        assert all(params['alpha'] in par_grid['alpha'] for params in dml_pliv_obj.params[learner]['d'][0])
+    dml_pliv_obj.fit()
+    assert np.isfinite(dml_pliv_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_scheduler_n_cells():
+    lock = threading.Lock()
+    n_running = [0]
+    max_running = [0]
+
+    def cell_fct(i_cell):
+        with lock:
+            n_running[0] += 1
+            max_running[0] = max(max_running[0], n_running[0])
+        time.sleep(0.05)
+        with lock:
+            n_running[0] -= 1
+        return i_cell
+
+    scheduler = _TuningScheduler(n_jobs=2)
+    n_cells = 6
+    res = scheduler.run_cells([lambda i_cell=i_cell: cell_fct(i_cell) for i_cell in range(n_cells)],
+                              np.random.SeedSequence(42).spawn(n_cells))
+    assert res == list(range(n_cells))
+    # not more cells than n_jobs run at the same time
+    assert max_running[0] <= 2
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_fit_parallel_afterwards():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    par_grid = {'alpha': np.linspace(0.05, .95, 7)}
+
+    np.random.seed(3141)
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+    dml_plr_obj.tune({'ml_l': par_grid, 'ml_m': par_grid}, n_folds_tune=3, n_jobs_tune=2)
+    # the searches do not run on the reusable executor of loky, which is used by the parallel fit
+    dml_plr_obj.fit(n_jobs_cv=2)
+    assert np.isfinite(dml_plr_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_n_jobs_search():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    par_grids = {'ml_l': {'alpha': np.linspace(0.05, .95, 7)},
+                 'ml_m': {'alpha': np.linspace(0.05, .95, 7)}}
+
+    # the workers which are not needed for the searches of the running cells are passed to the searches
+    dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(), Lasso(), n_folds=2)
+    for tune_on_folds, n_jobs_cv, n_jobs_search in [(False, None, 4), (True, None, 2), (False, 1, 1)]:
+        tune_res = dml_plr_obj.tune(par_grids, tune_on_folds=tune_on_folds, n_folds_tune=3, n_jobs_cv=n_jobs_cv,
+                                    return_tune_res=True, n_jobs_tune=4)
+        if tune_on_folds:
+            tune_res = tune_res[0]
+        for key in ['l_tune', 'm_tune']:
+            for search in tune_res[0]['tune_res'][key]:
+                assert search.n_jobs == n_jobs_search
+    dml_plr_obj.fit()
+    assert np.isfinite(dml_plr_obj.coef).all()
+
+
+@pytest.mark.ci
+def test_dml_tune_parallel_random_state():
+    np.random.seed(3141)
+    obj_dml_data = make_plr_CCDDHNR2018(n_obs=200, dim_x=5)
+    par_grids = {'ml_l': {'alpha': np.linspace(0.05, .95, 7)},
+                 'ml_m': {'alpha': np.linspace(0.05, .95, 7)}}
+
+    res = dict()
+    for n_jobs_tune in [None, 2]:
+        np.random.seed(3141)
+        dml_plr_obj = dml.DoubleMLPLR(obj_dml_data, Lasso(random_state=42), Lasso(random_state=42), n_folds=2)
+        dml_plr_obj.tune(par_grids, tune_on_folds=True, n_folds_tune=3, search_mode='randomized_search',
+                         n_iter_randomized_search=4, n_jobs_tune=n_jobs_tune, random_state=42)
+        # the global random state is not advanced by the seeded tuning (the learners set a random_state)
+        next_draw = np.random.randint(np.iinfo(np.int32).max)
+        dml_plr_obj.fit()
+        res[n_jobs_tune] = (dml_plr_obj.params, next_draw, dml_plr_obj.coef)
+
+    assert res[None][0] == res[2][0]
+    assert res[None][1] == res[2][1]
+    assert np.allclose(res[None][2], res[2][2], rtol=1e-9, atol=1e-4)
@@ -2,13 +2,21 @@
 The :mod:`doubleml.utils` module includes various utilities.
 """
 
-from .dummy_learners import DMLDummyRegressor
-from .dummy_learners import DMLDummyClassifier
-from .resampling import DoubleMLResampling, DoubleMLClusterResampling
-from .blp import DoubleMLBLP
-from .policytree import DoubleMLPolicyTree
+# gain_statistics is imported eagerly, as the lazily imported attribute would be shadowed by the submodule of the same name
 from .gain_statistics import gain_statistics
-from .global_learner import GlobalClassifier, GlobalRegressor
+from ._lazy import _lazy_attributes
+
+__getattr__, __dir__ = _lazy_attributes(globals(), {
+    'DMLDummyRegressor': '.dummy_learners',
+    'DMLDummyClassifier': '.dummy_learners',
+    'DoubleMLResampling': '.resampling',
+    'DoubleMLClusterResampling': '.resampling',
+    'DoubleMLBLP': '.blp',
+    'DoubleMLPolicyTree': '.policytree',
+    'GlobalClassifier': '.global_learner',
+    'GlobalRegressor': '.global_learner',
+    'binned_kde': '.kde',
+})
 
 __all__ = [
     "DMLDummyRegressor",
@@ -19,5 +27,6 @@ __all__ = [
     "DoubleMLPolicyTree",
     "gain_statistics",
     "GlobalClassifier",
-    "GlobalRegressor"
+    "GlobalRegressor",
+    "binned_kde"
 ]
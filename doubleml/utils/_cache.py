@@ -0,0 +1,71 @@
+import os
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+from joblib import hash as joblib_hash
+from sklearn.base import clone
+
+# bump the version if the layout of the cached predictions changes, such that stale entries are not reused
+_CACHE_VERSION = 'doubleml-cv-predict-1'
+
+# the prediction cache is set during DoubleML.fit(cache_dir=...); if it is set, _dml_cv_predict and
+# _dml_cv_predict_many look up the out-of-fold predictions before fitting the learners
+_prediction_cache_context = ContextVar('doubleml_prediction_cache', default=None)
+
+
+class _PredictionCache:
+    """
+    Persistent, content-addressed cache for out-of-fold predictions of the nuisance learners.
+
+    The predictions are keyed by a hash of the (unfitted) learner and its parameters, the covariates, the target, the
+    sample splitting and the prediction method and stored as ``.npy`` files in ``cache_dir``.
+    """
+
+    def __init__(self, cache_dir):
+        self._cache_dir = os.fspath(cache_dir)
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def key(self, estimator, x, y, smpls, est_params, method):
+        smpls = [(np.asarray(train_index), np.asarray(test_index)) for train_index, test_index in smpls]
+        return joblib_hash((_CACHE_VERSION, clone(estimator), est_params, method,
+                            np.asarray(x), np.asarray(y), smpls))
+
+    def _path(self, key, name):
+        return os.path.join(self._cache_dir, f'{key}_{name}.npy')
+
+    def load(self, key):
+        # the predictions are written last, such that an entry is complete if they exist
+        if not os.path.exists(self._path(key, 'preds')):
+            return None
+        # the arrays are loaded into memory (and not returned as memory maps) as the predictions are modified in place
+        # (e.g. trimming) and memory-mapped arrays returned from worker processes would be re-read from the files
+        return {'preds': np.load(self._path(key, 'preds')),
+                'targets': np.load(self._path(key, 'targets')),
+                'models': None}
+
+    def store(self, key, res):
+        for name in ['targets', 'preds']:
+            # write to a temporary file first, such that concurrent fits never read incomplete files
+            tmp_path = os.path.join(self._cache_dir, f'{key}_{name}.{uuid.uuid4().hex}.tmp.npy')
+            np.save(tmp_path, np.asarray(res[name]))
+            os.replace(tmp_path, self._path(key, name))
+
+
+@contextmanager
+def _prediction_cache(cache_dir):
+    if cache_dir is None:
+        yield None
+    else:
+        cache = _PredictionCache(cache_dir)
+        token = _prediction_cache_context.set(cache)
+        try:
+            yield cache
+        finally:
+            _prediction_cache_context.reset(token)
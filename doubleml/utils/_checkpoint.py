@@ -0,0 +1,28 @@
+import os
+import uuid
+
+import joblib
+
+
+def _checkpoint_cell_path(checkpoint_path, i_rep, i_treat):
+    return os.path.join(checkpoint_path, f'cell_rep{i_rep}_treat{i_treat}.joblib')
+
+
+def _save_checkpoint_cell(checkpoint_path, i_rep, i_treat, fingerprint, cell_state):
+    os.makedirs(checkpoint_path, exist_ok=True)
+    cell_path = _checkpoint_cell_path(checkpoint_path, i_rep, i_treat)
+    # write to a temporary file first, such that an interrupted fit never leaves an incomplete cell behind
+    tmp_path = f'{cell_path}.{uuid.uuid4().hex}.tmp'
+    joblib.dump({'fingerprint': fingerprint, 'cell_state': cell_state}, tmp_path)
+    os.replace(tmp_path, cell_path)
+
+
+def _load_checkpoint_cell(checkpoint_path, i_rep, i_treat, fingerprint):
+    cell_path = _checkpoint_cell_path(checkpoint_path, i_rep, i_treat)
+    if not os.path.exists(cell_path):
+        return None
+    checkpoint = joblib.load(cell_path)
+    if checkpoint['fingerprint'] != fingerprint:
+        raise ValueError(f'The checkpoint {cell_path} was created for a different model, data, sample splitting or fit '
+                         'setting. Remove the checkpoint or use a different checkpoint_path.')
+    return checkpoint['cell_state']
@@ -4,6 +4,8 @@ import inspect
 
 from sklearn.utils.multiclass import type_of_target
 
+from .resampling import _RepeatedFoldIdSplits, _fold_ids_dtype
+
 
 def _check_in_zero_one(value, name, include_zero=True, include_one=True):
     if not isinstance(value, float):
@@ -157,6 +159,14 @@ def _check_trimming(trimming_rule, trimming_threshold):
     return
 
 
+def _check_ipw_solver(ipw_solver):
+    valid_ipw_solver = ['brent', 'exact']
+    if ipw_solver not in valid_ipw_solver:
+        raise ValueError('Invalid ipw_solver ' + str(ipw_solver) + '. ' +
+                         'Valid ipw_solver ' + ' or '.join(valid_ipw_solver) + '.')
+    return
+
+
 def _check_zero_one_treatment(obj_dml):
     one_treat = (obj_dml._dml_data.n_treat == 1)
     binary_treat = (type_of_target(obj_dml._dml_data.d) == 'binary')
@@ -239,6 +249,30 @@ def _check_benchmarks(benchmarks):
     return
 
 
+def _check_benchmarking_sets(benchmarking_set, x_cols):
+    # benchmarking_set is either a single benchmarking set (list of covariates) or a list of benchmarking sets
+    if not isinstance(benchmarking_set, list):
+        raise TypeError('benchmarking_set must be a list. '
+                        f'{str(benchmarking_set)} of type {type(benchmarking_set)} was passed.')
+    if len(benchmarking_set) == 0:
+        raise ValueError('benchmarking_set must not be empty.')
+    is_list = [isinstance(element, list) for element in benchmarking_set]
+    if all(is_list):
+        benchmarking_sets = benchmarking_set
+    elif not any(is_list):
+        benchmarking_sets = [benchmarking_set]
+    else:
+        raise TypeError('benchmarking_set must be a list of features or a list of lists of features. '
+                        f'{str(benchmarking_set)} was passed.')
+    for single_set in benchmarking_sets:
+        if len(single_set) == 0:
+            raise ValueError('benchmarking_set must not be empty.')
+        if not set(single_set) <= set(x_cols):
+            raise ValueError(f"benchmarking_set must be a subset of features {str(x_cols)}. "
+                             f'{str(single_set)} was passed.')
+    return benchmarking_sets
+
+
 def _check_weights(weights, score, n_obs, n_rep):
     if weights is not None:
 
@@ -330,7 +364,18 @@ def _check_external_predictions(external_predictions, valid_treatments, valid_le
                                      f'Predictions of shape {str(external_predictions[treatment][learner].shape)} passed.')
 
 
-def _check_bootstrap(method, n_rep_boot):
+def _check_random_state(random_state):
+    if random_state is not None:
+        is_seed = isinstance(random_state, (int, np.integer)) and not isinstance(random_state, bool)
+        if not (is_seed or isinstance(random_state, np.random.SeedSequence)):
+            raise TypeError('random_state must be None, an int or a numpy.random.SeedSequence. '
+                            f'{str(random_state)} of type {str(type(random_state))} was passed.')
+        if is_seed and random_state < 0:
+            raise ValueError('random_state must be non-negative. '
+                             f'{str(random_state)} was passed.')
+
+
+def _check_bootstrap(method, n_rep_boot, chunk_size=None, random_state=None, n_jobs_boot=None):
 
     if (not isinstance(method, str)) | (method not in ['Bayes', 'normal', 'wild']):
         raise ValueError('Method must be "Bayes", "normal" or "wild". '
@@ -342,6 +387,21 @@ def _check_bootstrap(method, n_rep_boot):
     if n_rep_boot < 1:
         raise ValueError('The number of bootstrap replications must be positive. '
                          f'{str(n_rep_boot)} was passed.')
+
+    if chunk_size is not None:
+        if not isinstance(chunk_size, int):
+            raise TypeError('The chunk size of the bootstrap must be of int type (or None). '
+                            f'{str(chunk_size)} of type {str(type(chunk_size))} was passed.')
+        if chunk_size < 1:
+            raise ValueError('The chunk size of the bootstrap must be positive. '
+                             f'{str(chunk_size)} was passed.')
+
+    _check_random_state(random_state)
+
+    if n_jobs_boot is not None:
+        if not isinstance(n_jobs_boot, int):
+            raise TypeError('The number of CPUs used for the bootstrap must be of int type. '
+                            f'{str(n_jobs_boot)} of type {str(type(n_jobs_boot))} was passed.')
     return
 
 
@@ -422,8 +482,39 @@ def _check_cluster_sample_splitting(all_smpls_cluster, dml_data, n_rep, n_folds)
     return smpls_cluster
 
 
+def _check_fold_ids(fold_ids, n_obs):
+    if not issubclass(fold_ids.dtype.type, np.integer):
+        raise TypeError('Invalid fold assignment. Fold ids must be of type integer.')
+    if fold_ids.ndim == 1:
+        fold_ids = fold_ids.reshape(-1, 1)
+    if (fold_ids.ndim != 2) or (fold_ids.shape[0] != n_obs):
+        raise ValueError('Invalid fold assignment. The fold ids must be an array of shape (n_obs,) or (n_obs, n_rep) '
+                         f'with n_obs={n_obs}. Array of shape {str(fold_ids.shape)} passed.')
+    if fold_ids.min() < 0:
+        raise ValueError('Invalid fold assignment. Fold ids must be non-negative.')
+    n_folds = int(fold_ids.max()) + 1
+    if n_folds < 2:
+        raise ValueError('Invalid fold assignment. At least two folds are required.')
+    if n_folds > np.iinfo(np.int16).max:
+        raise ValueError('Invalid fold assignment. At most 32767 folds are supported.')
+    for i_rep in range(fold_ids.shape[1]):
+        if len(np.unique(fold_ids[:, i_rep])) != n_folds:
+            raise ValueError('Invalid fold assignment. '
+                             f'Each repetition must contain all fold ids 0, ..., {n_folds - 1}.')
+    fold_ids = fold_ids.astype(_fold_ids_dtype(n_folds), copy=False)
+    return fold_ids, n_folds
+
+
 def _check_sample_splitting(all_smpls, all_smpls_cluster, dml_data, is_cluster_data):
 
+    if isinstance(all_smpls, _RepeatedFoldIdSplits):
+        all_smpls = all_smpls.fold_ids
+    if isinstance(all_smpls, np.ndarray):
+        if is_cluster_data:
+            raise NotImplementedError('Sample splitting via fold assignment arrays not yet implemented with clustering.')
+        fold_ids, n_folds = _check_fold_ids(all_smpls, dml_data.n_obs)
+        return _RepeatedFoldIdSplits(fold_ids, n_folds), None, fold_ids.shape[1], n_folds
+
     if isinstance(all_smpls, tuple):
         if not len(all_smpls) == 2:
             raise ValueError('Invalid partition provided. '
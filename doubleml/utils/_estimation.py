@@ -5,14 +5,17 @@ from scipy.optimize import minimize_scalar
 from sklearn.model_selection import cross_val_predict
 from sklearn.base import clone
 from sklearn.preprocessing import LabelEncoder
-from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV
+from sklearn.model_selection import KFold, GridSearchCV, RandomizedSearchCV, StratifiedKFold, train_test_split
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV
 from sklearn.metrics import root_mean_squared_error, log_loss
 
-from statsmodels.nonparametric.kde import KDEUnivariate
-
 from joblib import Parallel, delayed
 
 from ._checks import _check_is_partition
+from ._tuning import _tuning_context
+from ._cache import _prediction_cache_context
+from ._profiling import _profiler_context, _profile_step, _fit_profiled
 
 
 def _assure_2d_array(x):
@@ -24,20 +27,20 @@ def _assure_2d_array(x):
 
 
 def _get_cond_smpls(smpls, bin_var):
-    smpls_0 = [(np.intersect1d(np.where(bin_var == 0)[0], train), test) for train, test in smpls]
-    smpls_1 = [(np.intersect1d(np.where(bin_var == 1)[0], train), test) for train, test in smpls]
+    smpls_0 = [(train[bin_var[train] == 0], test) for train, test in smpls]
+    smpls_1 = [(train[bin_var[train] == 1], test) for train, test in smpls]
     return smpls_0, smpls_1
 
 
 def _get_cond_smpls_2d(smpls, bin_var1, bin_var2):
     subset_00 = (bin_var1 == 0) & (bin_var2 == 0)
-    smpls_00 = [(np.intersect1d(np.where(subset_00)[0], train), test) for train, test in smpls]
+    smpls_00 = [(train[subset_00[train]], test) for train, test in smpls]
     subset_01 = (bin_var1 == 0) & (bin_var2 == 1)
-    smpls_01 = [(np.intersect1d(np.where(subset_01)[0], train), test) for train, test in smpls]
+    smpls_01 = [(train[subset_01[train]], test) for train, test in smpls]
     subset_10 = (bin_var1 == 1) & (bin_var2 == 0)
-    smpls_10 = [(np.intersect1d(np.where(subset_10)[0], train), test) for train, test in smpls]
+    smpls_10 = [(train[subset_10[train]], test) for train, test in smpls]
     subset_11 = (bin_var1 == 1) & (bin_var2 == 1)
-    smpls_11 = [(np.intersect1d(np.where(subset_11)[0], train), test) for train, test in smpls]
+    smpls_11 = [(train[subset_11[train]], test) for train, test in smpls]
     return smpls_00, smpls_01, smpls_10, smpls_11
 
 
@@ -47,14 +50,28 @@ def _fit(estimator, x, y, train_index, idx=None):
 
 
 def _dml_cv_predict(estimator, x, y, smpls=None,
-                    n_jobs=None, est_params=None, method='predict', return_train_preds=False, return_models=False):
+                    n_jobs=None, est_params=None, method='predict', return_train_preds=False, return_models=False,
+                    learner_name=None, outer_fold=None):
+    # outer_fold is set for nested cross-fitting (e.g. the preliminary propensity scores of the quantile models), such
+    # that the fit and predict steps of all inner folds are recorded with the fold of the outer sample splitting
     n_obs = x.shape[0]
 
+    # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+    profiler = _profiler_context.get()
     smpls_is_partition = _check_is_partition(smpls, n_obs)
     fold_specific_params = (est_params is not None) & (not isinstance(est_params, dict))
     fold_specific_target = isinstance(y, list)
     manual_cv_predict = (not smpls_is_partition) | return_train_preds | fold_specific_params | fold_specific_target \
-        | return_models
+        | return_models | (profiler is not None)
+
+    # look up the predictions in the prediction cache (only active during DoubleML.fit(cache_dir=...))
+    cache = _prediction_cache_context.get()
+    cache_key = None
+    if (cache is not None) & (not return_train_preds) & (not return_models) & (not fold_specific_target):
+        cache_key = cache.key(estimator, x, y, smpls, est_params, method)
+        res = cache.load(cache_key)
+        if res is not None:
+            return res
 
     res = {'models': None}
     if not manual_cv_predict:
@@ -84,6 +101,7 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             y = le.fit_transform(y)
 
         parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+        fit_fct = _fit if profiler is None else _fit_profiled
 
         if fold_specific_target:
             y_list = list()
@@ -96,17 +114,17 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
             y_list = [y] * len(smpls)
 
         if est_params is None:
-            fitted_models = parallel(delayed(_fit)(
+            fitted_models = parallel(delayed(fit_fct)(
                 clone(estimator), x, y_list[idx], train_index, idx)
                                      for idx, (train_index, test_index) in enumerate(smpls))
         elif isinstance(est_params, dict):
             # warnings.warn("Using the same (hyper-)parameters for all folds")
-            fitted_models = parallel(delayed(_fit)(
+            fitted_models = parallel(delayed(fit_fct)(
                 clone(estimator).set_params(**est_params), x, y_list[idx], train_index, idx)
                                      for idx, (train_index, test_index) in enumerate(smpls))
         else:
             assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
-            fitted_models = parallel(delayed(_fit)(
+            fitted_models = parallel(delayed(fit_fct)(
                 clone(estimator).set_params(**est_params[idx]), x, y_list[idx], train_index, idx)
                                      for idx, (train_index, test_index) in enumerate(smpls))
 
@@ -116,11 +134,15 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
         train_targets = list()
         for idx, (train_index, test_index) in enumerate(smpls):
             assert idx == fitted_models[idx][1]
+            profile_fold = idx if outer_fold is None else outer_fold
+            if profiler is not None:
+                profiler.add('fit', fitted_models[idx][2], learner=learner_name, fold=profile_fold)
             pred_fun = getattr(fitted_models[idx][0], method)
-            if method == 'predict_proba':
-                preds[test_index] = pred_fun(x[test_index, :])[:, 1]
-            else:
-                preds[test_index] = pred_fun(x[test_index, :])
+            with _profile_step(profiler, 'predict', learner=learner_name, fold=profile_fold):
+                if method == 'predict_proba':
+                    preds[test_index] = pred_fun(x[test_index, :])[:, 1]
+                else:
+                    preds[test_index] = pred_fun(x[test_index, :])
 
             if fold_specific_target:
                 # targets not available for fold specific target
@@ -143,38 +165,222 @@ def _dml_cv_predict(estimator, x, y, smpls=None,
                 raise RuntimeError('export of fitted models failed')
             res['models'] = [xx[0] for xx in fitted_models]
 
+    if cache_key is not None:
+        cache.store(cache_key, res)
+
+    return res
+
+
+def _dml_cv_predict_many(nuisance_jobs, n_jobs=None, return_models=False):
+    # nuisance_jobs is a dict (e.g. with keys 'ml_g0', 'ml_g1', 'ml_m') of dicts with keys 'estimator', 'x', 'y',
+    # 'smpls' and optionally 'est_params', 'method' and 'return_train_preds'; all folds of all nuisance functions are
+    # fitted in one pool
+    res = dict()
+    # nuisance functions with cached predictions are not refitted (cache only active during DoubleML.fit(cache_dir=...))
+    cache = _prediction_cache_context.get()
+    cache_keys = dict()
+    if (cache is not None) & (not return_models):
+        for key, job in nuisance_jobs.items():
+            if job.get('return_train_preds', False):
+                continue
+            cache_keys[key] = cache.key(job['estimator'], job['x'], job['y'], job['smpls'],
+                                        job.get('est_params', None), job.get('method', 'predict'))
+            cached_res = cache.load(cache_keys[key])
+            if cached_res is not None:
+                res[key] = cached_res
+        nuisance_jobs = {key: job for key, job in nuisance_jobs.items() if key not in res}
+
+    fit_tasks = list()
+    fit_targets = dict()
+    for key, job in nuisance_jobs.items():
+        assert not isinstance(job['y'], list), 'fold-specific targets are not supported'
+        est_params = job.get('est_params', None)
+        method = job.get('method', 'predict')
+        smpls = job['smpls']
+
+        y = job['y']
+        if method == 'predict_proba':
+            y = np.asarray(y)
+            le = LabelEncoder()
+            y = le.fit_transform(y)
+        fit_targets[key] = y
+
+        if (est_params is not None) & (not isinstance(est_params, dict)):
+            assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        for idx, (train_index, _) in enumerate(smpls):
+            estimator = clone(job['estimator'])
+            if isinstance(est_params, dict):
+                estimator.set_params(**est_params)
+            elif est_params is not None:
+                estimator.set_params(**est_params[idx])
+            fit_tasks.append((estimator, job['x'], y, train_index, (key, idx)))
+
+    # the fit and predict steps are recorded fold-wise if a profiler is set (only during DoubleML.fit(profile=True))
+    profiler = _profiler_context.get()
+    fit_fct = _fit if profiler is None else _fit_profiled
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    fitted_models = parallel(delayed(fit_fct)(estimator, x, y, train_index, idx)
+                             for (estimator, x, y, train_index, idx) in fit_tasks)
+
+    i_task = 0
+    for key, job in nuisance_jobs.items():
+        x = job['x']
+        y = fit_targets[key]
+        method = job.get('method', 'predict')
+        n_obs = x.shape[0]
+
+        return_train_preds = job.get('return_train_preds', False)
+        preds = np.full(n_obs, np.nan)
+        targets = np.full(n_obs, np.nan)
+        models = list()
+        train_preds = list()
+        train_targets = list()
+        for idx, (train_index, test_index) in enumerate(job['smpls']):
+            fitted_model, task_id = fitted_models[i_task][:2]
+            assert task_id == (key, idx)
+            if profiler is not None:
+                profiler.add('fit', fitted_models[i_task][2], learner=key, fold=idx)
+            i_task += 1
+
+            pred_fun = getattr(fitted_model, method)
+            with _profile_step(profiler, 'predict', learner=key, fold=idx):
+                if method == 'predict_proba':
+                    preds[test_index] = pred_fun(x[test_index, :])[:, 1]
+                else:
+                    preds[test_index] = pred_fun(x[test_index, :])
+            targets[test_index] = y[test_index]
+            models.append(fitted_model)
+
+            if return_train_preds:
+                train_preds.append(pred_fun(x[train_index, :]))
+                train_targets.append(y[train_index])
+
+        res[key] = {'preds': preds,
+                    'targets': targets,
+                    'models': models if return_models else None}
+        if return_train_preds:
+            res[key]['train_preds'] = train_preds
+            res[key]['train_targets'] = train_targets
+        if key in cache_keys:
+            cache.store(cache_keys[key], res[key])
+
+    return res
+
+
+def _propensity_nested_fold(estimator, x, d, train_index, test_index, n_folds_prelim, est_params=None, idx=None):
+    # nested cross-fitting of the propensity score on the first half of the training sample (preliminary estimate)
+    # and refit on the whole training sample, as used in the potential quantile models
+    estimator = clone(estimator)
+    if est_params is not None:
+        estimator.set_params(**est_params)
+    train_index_1, _ = train_test_split(train_index, test_size=0.5, random_state=42, stratify=d[train_index])
+    smpls_prelim = [(train, test) for train, test in
+                    StratifiedKFold(n_splits=n_folds_prelim).split(X=train_index_1, y=d[train_index_1])]
+    preds_prelim = _dml_cv_predict(clone(estimator), x[train_index_1, :], d[train_index_1],
+                                   method='predict_proba', smpls=smpls_prelim, learner_name='ml_m_prelim',
+                                   outer_fold=idx)['preds']
+
+    fitted_model = clone(estimator).fit(x[train_index, :], d[train_index])
+    preds = _predict_zero_one_propensity(fitted_model, x[test_index, :])
+    return train_index_1, preds_prelim, preds, fitted_model, idx
+
+
+def _dml_propensity_nested(estimator, x, d, smpls, n_folds_prelim, n_jobs=None, est_params=None):
+    # propensity predictions (including the preliminary fold-wise estimates) which do not depend on the quantile
+    # or treatment level and can be shared across potential quantile models
+    if (est_params is not None) & (not isinstance(est_params, dict)):
+        assert len(est_params) == len(smpls), 'provide one parameter setting per fold'
+        fold_params = est_params
+    else:
+        fold_params = [est_params] * len(smpls)
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    fold_res = parallel(delayed(_propensity_nested_fold)(
+        estimator, x, d, train_index, test_index, n_folds_prelim, fold_params[idx], idx)
+                        for idx, (train_index, test_index) in enumerate(smpls))
+
+    res = {'preds': np.full(x.shape[0], np.nan),
+           'preds_prelim': [None] * len(smpls),
+           'train_inds_prelim': [None] * len(smpls),
+           'models': [None] * len(smpls)}
+    for (train_index_1, preds_prelim, preds, fitted_model, idx), (_, test_index) in zip(fold_res, smpls):
+        res['preds'][test_index] = preds
+        res['train_inds_prelim'][idx] = train_index_1
+        res['preds_prelim'][idx] = preds_prelim
+        res['models'][idx] = fitted_model
     return res
 
 
+def _tune_search(learner, param_grid, scoring_method, cv, n_jobs_cv, search_mode, n_iter_randomized_search,
+                 random_state=None):
+    if search_mode == 'grid_search':
+        search = GridSearchCV(learner, param_grid,
+                              scoring=scoring_method,
+                              cv=cv, n_jobs=n_jobs_cv)
+    elif search_mode == 'randomized_search':
+        search = RandomizedSearchCV(learner, param_grid,
+                                    scoring=scoring_method,
+                                    cv=cv, n_jobs=n_jobs_cv,
+                                    n_iter=n_iter_randomized_search,
+                                    random_state=random_state)
+    elif search_mode == 'halving_grid_search':
+        search = HalvingGridSearchCV(learner, param_grid,
+                                     scoring=scoring_method,
+                                     cv=cv, n_jobs=n_jobs_cv,
+                                     random_state=random_state)
+    else:
+        assert search_mode == 'halving_random_search'
+        search = HalvingRandomSearchCV(learner, param_grid,
+                                       scoring=scoring_method,
+                                       cv=cv, n_jobs=n_jobs_cv,
+                                       n_candidates=n_iter_randomized_search,
+                                       random_state=random_state)
+    return search
+
+
 def _dml_tune(y, x, train_inds,
               learner, param_grid, scoring_method,
               n_folds_tune, n_jobs_cv, search_mode, n_iter_randomized_search):
-    tune_res = list()
-    for train_index in train_inds:
-        tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
-        if search_mode == 'grid_search':
-            g_grid_search = GridSearchCV(learner, param_grid,
-                                         scoring=scoring_method,
-                                         cv=tune_resampling, n_jobs=n_jobs_cv)
-        else:
-            assert search_mode == 'randomized_search'
-            g_grid_search = RandomizedSearchCV(learner, param_grid,
-                                               scoring=scoring_method,
-                                               cv=tune_resampling, n_jobs=n_jobs_cv,
-                                               n_iter=n_iter_randomized_search)
-        tune_res.append(g_grid_search.fit(x[train_index, :], y[train_index]))
+    tuning_context = _tuning_context.get()
+    if tuning_context is None:
+        tune_res = list()
+        for train_index in train_inds:
+            if search_mode in ['halving_grid_search', 'halving_random_search']:
+                # the successive halving searches require the inner splits to be identical across the iterations
+                seed = np.random.randint(np.iinfo(np.int32).max)
+                tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True, random_state=seed)
+            else:
+                seed = None
+                tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True)
+            g_grid_search = _tune_search(learner, param_grid, scoring_method, tune_resampling, n_jobs_cv,
+                                         search_mode, n_iter_randomized_search, random_state=seed)
+            tune_res.append(g_grid_search.fit(x[train_index, :], y[train_index]))
+    else:
+        # the searches of all folds are submitted to the scheduler at once; the inner splits and the candidate sampling
+        # are seeded from the random generator of the tuning cell, such that the results do not depend on the scheduling
+        scheduler, rng = tuning_context
+        searches = list()
+        for _ in train_inds:
+            seed = int(rng.integers(np.iinfo(np.int32).max))
+            tune_resampling = KFold(n_splits=n_folds_tune, shuffle=True, random_state=seed)
+            searches.append(_tune_search(learner, param_grid, scoring_method, tune_resampling, n_jobs_cv,
+                                         search_mode, n_iter_randomized_search, random_state=seed))
+        tune_res = scheduler.fit_searches(searches,
+                                          [x[train_index, :] for train_index in train_inds],
+                                          [y[train_index] for train_index in train_inds])
 
     return tune_res
 
 
-def _draw_weights(method, n_rep_boot, n_obs):
+def _draw_weights(method, n_rep_boot, n_obs, random_state=None):
+    # random_state is None (global numpy random state) or a numpy.random.Generator
+    rng = np.random if random_state is None else random_state
     if method == 'Bayes':
-        weights = np.random.exponential(scale=1.0, size=(n_rep_boot, n_obs)) - 1.
+        weights = rng.exponential(scale=1.0, size=(n_rep_boot, n_obs)) - 1.
     elif method == 'normal':
-        weights = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        weights = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
     elif method == 'wild':
-        xx = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
-        yy = np.random.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        xx = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
+        yy = rng.normal(loc=0.0, scale=1.0, size=(n_rep_boot, n_obs))
         weights = xx / np.sqrt(2) + (np.power(yy, 2) - 1) / 2
     else:
         raise ValueError('invalid boot method')
@@ -182,6 +388,97 @@ def _draw_weights(method, n_rep_boot, n_obs):
     return weights
 
 
+def _boot_seeded_rep(method, n_rep_boot, scaled_psi, seed):
+    scaled_psi = np.ascontiguousarray(scaled_psi)
+    weights = _draw_weights(method, n_rep_boot, scaled_psi.shape[0], np.random.default_rng(seed))
+    return np.matmul(weights, scaled_psi)
+
+
+def _boot_seeded_chunk(method, n_rep_boot, scaled_psi_rep, seeds):
+    # scaled_psi_rep has shape (n_rep, chunk_size, n_thetas) and seeds contains one seed per repetition
+    scaled_psi_rep = np.ascontiguousarray(scaled_psi_rep)
+    weights = np.stack([_draw_weights(method, n_rep_boot, scaled_psi_rep.shape[1], np.random.default_rng(seed))
+                        for seed in seeds])
+    return np.matmul(weights, scaled_psi_rep)
+
+
+def _multiplier_bootstrap(method, n_rep_boot, scaled_psi, chunk_size=None, random_state=None, n_jobs=None):
+    # scaled_psi has shape (n_obs, n_thetas, n_rep); the bootstrap distribution has shape (n_rep_boot, n_thetas, n_rep)
+    n_obs, n_thetas, n_rep = scaled_psi.shape
+    scaled_psi_rep = np.moveaxis(scaled_psi, 2, 0)
+    if (random_state is None) and (n_jobs is None):
+        if chunk_size is None:
+            boot_t_stat = np.full((n_rep_boot, n_thetas, n_rep), np.nan)
+            for i_rep in range(n_rep):
+                weights = _draw_weights(method, n_rep_boot, n_obs)
+                boot_t_stat[:, :, i_rep] = np.matmul(weights, scaled_psi[:, :, i_rep])
+        else:
+            # draw the weights for all repetitions in chunks of observations and accumulate weights @ scaled_psi, such
+            # that the weights never need more than n_rep * n_rep_boot * chunk_size entries
+            boot_t_stat_rep = np.zeros((n_rep, n_rep_boot, n_thetas))
+            for start in range(0, n_obs, chunk_size):
+                stop = min(start + chunk_size, n_obs)
+                weights = _draw_weights(method, n_rep * n_rep_boot, stop - start).reshape(n_rep, n_rep_boot, stop - start)
+                boot_t_stat_rep += np.matmul(weights, scaled_psi_rep[:, start:stop, :])
+            boot_t_stat = np.moveaxis(boot_t_stat_rep, 0, 2)
+        return boot_t_stat
+
+    # every repetition (and every chunk of observations) gets its own child seed, such that the draws do not depend on
+    # the order of execution and a parallel run matches the serial one
+    if random_state is None:
+        random_state = np.random.randint(np.iinfo(np.int32).max)
+    if isinstance(random_state, np.random.SeedSequence):
+        seed_seq = random_state
+    else:
+        seed_seq = np.random.SeedSequence(random_state)
+    rep_seeds = seed_seq.spawn(n_rep)
+    parallel = Parallel(n_jobs=n_jobs, verbose=0, pre_dispatch='2*n_jobs')
+    if chunk_size is None:
+        boot_t_stat_rep = parallel(delayed(_boot_seeded_rep)(method, n_rep_boot, scaled_psi[:, :, i_rep], rep_seeds[i_rep])
+                                   for i_rep in range(n_rep))
+        boot_t_stat = np.stack(boot_t_stat_rep, axis=2)
+    else:
+        chunks = [(start, min(start + chunk_size, n_obs)) for start in range(0, n_obs, chunk_size)]
+        chunk_seeds = [rep_seed.spawn(len(chunks)) for rep_seed in rep_seeds]
+        boot_t_stat_chunks = parallel(delayed(_boot_seeded_chunk)(method, n_rep_boot, scaled_psi_rep[:, start:stop, :],
+                                                                  [chunk_seeds[i_rep][i_chunk] for i_rep in range(n_rep)])
+                                      for i_chunk, (start, stop) in enumerate(chunks))
+        boot_t_stat_rep = np.zeros((n_rep, n_rep_boot, n_thetas))
+        for boot_t_stat_chunk in boot_t_stat_chunks:
+            boot_t_stat_rep += boot_t_stat_chunk
+        boot_t_stat = np.moveaxis(boot_t_stat_rep, 0, 2)
+
+    return boot_t_stat
+
+
+def _group_sums(values, codes, n_groups):
+    # sums of values (along the first axis) within the groups given by the integer codes 0, ..., n_groups - 1
+    if values.ndim == 1:
+        return np.bincount(codes, weights=values, minlength=n_groups)
+    values_2d = values.reshape(values.shape[0], -1)
+    group_sums = np.column_stack([np.bincount(codes, weights=values_2d[:, i_col], minlength=n_groups)
+                                  for i_col in range(values_2d.shape[1])])
+    return group_sums.reshape((n_groups,) + values.shape[1:])
+
+
+def _cluster_psi_sums(psi, cluster_vars):
+    # sums psi (first axis n_obs) within the clusters of every cluster variable and stacks the cluster sums of all
+    # cluster variables; one multiplier weight per stacked sum corresponds to the observation weights u_g(i) + v_h(i)
+    psi_sums = []
+    for i_var in range(cluster_vars.shape[1]):
+        clusters, cluster_codes = np.unique(cluster_vars[:, i_var], return_inverse=True)
+        psi_sums.append(_group_sums(psi, cluster_codes, len(clusters)))
+    return np.concatenate(psi_sums, axis=0)
+
+
+def _cluster_score_weights(smpls, scaling_factor, n_obs):
+    # observation weights such that np.dot(weights, psi) equals the weighted sum of the fold-wise sums of psi
+    weights = np.zeros(n_obs)
+    for i_fold, (_, test_index) in enumerate(smpls):
+        weights[test_index] = scaling_factor[i_fold]
+    return weights
+
+
 def _trimm(preds, trimming_rule, trimming_threshold):
     if trimming_rule == 'truncate':
         preds[preds < trimming_threshold] = trimming_threshold
@@ -237,6 +534,7 @@ def _get_bracket_guess(score, coef_start, coef_bounds):
 
 
 def _default_kde(u, weights):
+    from statsmodels.nonparametric.kde import KDEUnivariate
     dens = KDEUnivariate(u)
     dens.fit(kernel='gau', bw='silverman', weights=weights, fft=False)
 
@@ -254,6 +552,45 @@ def _solve_ipw_score(ipw_score, bracket_guess):
     return ipw_est
 
 
+def _solve_ipw_quantile(y, weights, quantile, ipw_solver, coef_start, coef_bounds):
+    # preliminary ipw quantile, i.e. the root of the ipw score mean(weights * (y <= theta) - quantile), either via a
+    # Brent search of the absolute score (starting from a bracket around coef_start) or exactly via a single sort
+    if ipw_solver == 'exact':
+        return _solve_ipw_quantiles(y, weights, quantile)[0]
+
+    def ipw_score(theta):
+        return np.mean(weights * (y <= theta) - quantile)
+
+    _, bracket_guess = _get_bracket_guess(ipw_score, coef_start, coef_bounds)
+    return _solve_ipw_score(ipw_score=ipw_score, bracket_guess=bracket_guess)
+
+
+def _solve_ipw_quantiles(y, weights, quantiles):
+    # the ipw score mean(weights * (y <= theta)) - quantile is a weighted empirical cdf, i.e. a step function which is
+    # constant between the sorted outcomes; a single sort and cumulative sum give the exact minimizer of the absolute
+    # score for all quantiles at once (the smallest outcome of the optimal step is returned)
+    quantiles = np.atleast_1d(quantiles)
+    order = np.argsort(y, kind='stable')
+    y_sorted = y[order]
+    score_steps = np.cumsum(weights[order]) / len(y)
+
+    # for ties only the last cumulative sum is attained by the score
+    is_step_end = np.append(y_sorted[1:] != y_sorted[:-1], True)
+    y_sorted = y_sorted[is_step_end]
+    score_steps = score_steps[is_step_end]
+
+    if np.all(np.diff(score_steps) >= 0):
+        # non-negative weights: the closest step is the first one with a value >= quantile or its predecessor
+        idx_upper = np.minimum(np.searchsorted(score_steps, quantiles, side='left'), len(score_steps) - 1)
+        idx_lower = np.searchsorted(score_steps, score_steps[np.maximum(idx_upper - 1, 0)], side='left')
+        use_lower = np.abs(score_steps[idx_lower] - quantiles) <= np.abs(score_steps[idx_upper] - quantiles)
+        idx = np.where(use_lower, idx_lower, idx_upper)
+    else:
+        idx = np.array([np.argmin(np.abs(score_steps - quantile)) for quantile in quantiles])
+
+    return y_sorted[idx]
+
+
 def _aggregate_coefs_and_ses(all_coefs, all_ses, var_scaling_factors):
     if var_scaling_factors.shape == (all_coefs.shape[0],):
         scaling_factors = np.repeat(var_scaling_factors[:, np.newaxis], all_coefs.shape[1], axis=1)
@@ -271,15 +608,25 @@ def _aggregate_coefs_and_ses(all_coefs, all_ses, var_scaling_factors):
     return coefs, ses
 
 
+def _sum_over_obs(values):
+    # sums over the first axis (observations); the observations are moved to the last (contiguous) axis, such that
+    # numpy applies the same pairwise summation as for one-dimensional arrays and the results coincide with the sums
+    # of the single columns values[:, i, ...]
+    if values.ndim == 1:
+        return np.sum(values)
+    return np.sum(np.ascontiguousarray(np.moveaxis(values, 0, -1)), axis=-1)
+
+
 def _var_est(psi, psi_deriv, smpls, is_cluster_data,
              cluster_vars=None, smpls_cluster=None, n_folds_per_cluster=None):
 
+    # psi and psi_deriv should be of shape (n_obs, ...); all reductions are over the first axis, such that the variances
+    # for several scores (e.g. all parameters and repetitions) are estimated at once
     if not is_cluster_data:
-        # psi and psi_deriv should be of shape (n_obs, ...)
         var_scaling_factor = psi.shape[0]
 
-        J = np.mean(psi_deriv)
-        gamma_hat = np.mean(np.square(psi))
+        J = np.divide(_sum_over_obs(psi_deriv), psi.shape[0])
+        gamma_hat = np.divide(_sum_over_obs(np.square(psi)), psi.shape[0])
 
     else:
         assert cluster_vars is not None
@@ -287,10 +634,12 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
         assert n_folds_per_cluster is not None
         n_folds = len(smpls)
 
+        # the sum of np.outer(psi_c, psi_c) over the observations of a cluster c equals the squared cluster sum of psi,
+        # such that all clusters are handled at once via group sums on the cluster codes
+        first_clusters, first_cluster_codes = np.unique(cluster_vars[:, 0], return_inverse=True)
         # one cluster
         if cluster_vars.shape[1] == 1:
-            first_cluster_var = cluster_vars[:, 0]
-            clusters = np.unique(first_cluster_var)
+            first_cluster_sums = _group_sums(psi, first_cluster_codes, len(first_clusters))
             gamma_hat = 0
             j_hat = 0
             for i_fold in range(n_folds):
@@ -298,19 +647,16 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
                 test_cluster_inds = smpls_cluster[i_fold][1]
                 I_k = test_cluster_inds[0]
                 const = 1 / len(I_k)
-                for cluster_value in I_k:
-                    ind_cluster = (first_cluster_var == cluster_value)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
-                j_hat += np.sum(psi_deriv[test_inds]) / len(I_k)
+                gamma_hat += const * _sum_over_obs(np.square(first_cluster_sums[np.searchsorted(first_clusters, I_k)]))
+                j_hat += _sum_over_obs(psi_deriv[test_inds]) / len(I_k)
 
-            var_scaling_factor = len(clusters)
+            var_scaling_factor = len(first_clusters)
             J = np.divide(j_hat, n_folds_per_cluster)
             gamma_hat = np.divide(gamma_hat, n_folds_per_cluster)
 
         else:
             assert cluster_vars.shape[1] == 2
-            first_cluster_var = cluster_vars[:, 0]
-            second_cluster_var = cluster_vars[:, 1]
+            second_clusters, second_cluster_codes = np.unique(cluster_vars[:, 1], return_inverse=True)
             gamma_hat = 0
             j_hat = 0
             for i_fold in range(n_folds):
@@ -319,17 +665,16 @@ def _var_est(psi, psi_deriv, smpls, is_cluster_data,
                 I_k = test_cluster_inds[0]
                 J_l = test_cluster_inds[1]
                 const = np.divide(min(len(I_k), len(J_l)), (np.square(len(I_k) * len(J_l))))
-                for cluster_value in I_k:
-                    ind_cluster = (first_cluster_var == cluster_value) & np.in1d(second_cluster_var, J_l)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
-                for cluster_value in J_l:
-                    ind_cluster = (second_cluster_var == cluster_value) & np.in1d(first_cluster_var, I_k)
-                    gamma_hat += const * np.sum(np.outer(psi[ind_cluster], psi[ind_cluster]))
-                j_hat += np.sum(psi_deriv[test_inds]) / (len(I_k) * len(J_l))
-
-            n_first_clusters = len(np.unique(first_cluster_var))
-            n_second_clusters = len(np.unique(second_cluster_var))
-            var_scaling_factor = min(n_first_clusters, n_second_clusters)
+                # sums over the clusters in I_k (J_l) restricted to observations with second (first) cluster in J_l (I_k)
+                in_J_l = np.isin(second_cluster_codes, np.searchsorted(second_clusters, J_l))
+                in_I_k = np.isin(first_cluster_codes, np.searchsorted(first_clusters, I_k))
+                first_cluster_sums = _group_sums(psi[in_J_l], first_cluster_codes[in_J_l], len(first_clusters))
+                second_cluster_sums = _group_sums(psi[in_I_k], second_cluster_codes[in_I_k], len(second_clusters))
+                gamma_hat += const * _sum_over_obs(np.square(first_cluster_sums[np.searchsorted(first_clusters, I_k)]))
+                gamma_hat += const * _sum_over_obs(np.square(second_cluster_sums[np.searchsorted(second_clusters, J_l)]))
+                j_hat += _sum_over_obs(psi_deriv[test_inds]) / (len(I_k) * len(J_l))
+
+            var_scaling_factor = min(len(first_clusters), len(second_clusters))
             J = np.divide(j_hat, np.square(n_folds_per_cluster))
             gamma_hat = np.divide(gamma_hat, np.square(n_folds_per_cluster))
 
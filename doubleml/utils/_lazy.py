@@ -0,0 +1,28 @@
+import importlib
+
+
+def _lazy_attributes(module_globals, lazy_imports):
+    """
+    Module level ``__getattr__`` and ``__dir__`` (PEP 562) which import the attributes of a package on first access.
+
+    ``lazy_imports`` maps the attribute names to the (relative) names of the modules defining them. If the attribute is
+    the module itself (e.g. ``'utils': '.utils'``), the module is returned.
+    """
+    package = module_globals['__name__']
+
+    def __getattr__(name):
+        if name not in lazy_imports:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        module = importlib.import_module(lazy_imports[name], package)
+        if lazy_imports[name] == f'.{name}':
+            value = module
+        else:
+            value = getattr(module, name)
+        # cache the attribute, such that __getattr__ is only called on first access
+        module_globals[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(module_globals) | set(lazy_imports))
+
+    return __getattr__, __dir__
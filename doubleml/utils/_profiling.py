@@ -0,0 +1,123 @@
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # the resource module is not available on windows
+    resource = None
+
+# the profiler is set during DoubleML.fit(profile=True); if it is set, _dml_cv_predict and _dml_cv_predict_many record
+# the fit and predict steps of every fold
+_profiler_context = ContextVar('doubleml_profiler', default=None)
+
+_PROFILE_COLUMNS = ['step', 'learner', 'rep', 'treatment', 'fold', 'wall_time', 'cpu_time', 'peak_rss_mb']
+
+
+def _peak_rss_mb():
+    # peak resident set size of the current process (high-water mark since the start of the process) in MB, which also
+    # covers the memory allocated by compiled code; ru_maxrss is given in kilobytes on linux and in bytes on macOS
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == 'darwin':
+            return peak_rss / 1024 ** 2
+        return peak_rss / 1024
+    try:
+        import psutil
+    except ImportError:
+        return np.nan
+    return psutil.Process().memory_info().peak_wset / 1024 ** 2
+
+
+@contextmanager
+def _measure(measures):
+    # fills the dict measures with the wall time, cpu time (of the current process) and the peak resident set size of the
+    # current process at the end of the step; the measures do not add any tracing overhead to the step
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    try:
+        yield measures
+    finally:
+        measures['wall_time'] = time.perf_counter() - wall_start
+        measures['cpu_time'] = time.process_time() - cpu_start
+        measures['peak_rss_mb'] = _peak_rss_mb()
+
+
+def _fit_profiled(estimator, x, y, train_index, idx=None):
+    # same as _estimation._fit but additionally returns the measures of the fit (taken in the process fitting the model)
+    measures = dict()
+    with _measure(measures):
+        estimator.fit(x[train_index, :], y[train_index])
+    return estimator, idx, measures
+
+
+class _Profiler:
+    """
+    Collects the wall time, cpu time and peak resident set size of the steps of :meth:`doubleml.DoubleML.fit`.
+
+    Every record is a dict with the keys ``'step'``, ``'learner'``, ``'rep'``, ``'treatment'``, ``'fold'``,
+    ``'wall_time'``, ``'cpu_time'`` and ``'peak_rss_mb'`` and is passed to every callback once it is recorded.
+    """
+
+    def __init__(self, callbacks=None):
+        self._callbacks = list() if callbacks is None else list(callbacks)
+        self._records = list()
+        self._rep = None
+        self._treatment = None
+
+    @property
+    def records(self):
+        return self._records
+
+    def set_cell(self, rep, treatment):
+        self._rep = rep
+        self._treatment = treatment
+
+    def add(self, step, measures, learner=None, fold=None):
+        record = {'step': step,
+                  'learner': learner,
+                  'rep': self._rep,
+                  'treatment': self._treatment,
+                  'fold': fold,
+                  'wall_time': measures['wall_time'],
+                  'cpu_time': measures['cpu_time'],
+                  'peak_rss_mb': measures['peak_rss_mb']}
+        self.extend([record])
+
+    def extend(self, records):
+        for record in records:
+            self._records.append(record)
+            for callback in self._callbacks:
+                callback(record)
+
+    @contextmanager
+    def measure(self, step, learner=None, fold=None):
+        measures = dict()
+        with _measure(measures):
+            yield
+        self.add(step, measures, learner=learner, fold=fold)
+
+    def to_frame(self):
+        return pd.DataFrame(self._records, columns=_PROFILE_COLUMNS)
+
+
+def _profile_step(profiler, step, learner=None, fold=None):
+    if profiler is None:
+        return nullcontext()
+    return profiler.measure(step, learner=learner, fold=fold)
+
+
+@contextmanager
+def _profiling(profiler):
+    if profiler is None:
+        yield None
+    else:
+        token = _profiler_context.set(profiler)
+        try:
+            yield profiler
+        finally:
+            _profiler_context.reset(token)
@@ -0,0 +1,76 @@
+from contextvars import ContextVar
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from joblib import effective_n_jobs
+from joblib.externals.loky import ProcessPoolExecutor
+
+# the tuning context is a tuple (scheduler, rng) and set for every tuning cell (treatment variable x repetition); if it is
+# set, _dml_tune submits the searches of all folds to the scheduler instead of fitting them one after another
+_tuning_context = ContextVar('doubleml_tuning_context', default=None)
+
+
+def _fit_search(search, x, y):
+    return search.fit(x, y)
+
+
+class _TuningScheduler:
+    """
+    Scheduler for the hyperparameter searches of :meth:`doubleml.DoubleML.tune`.
+
+    The tuning cells (treatment variable x repetition) run in up to ``n_jobs`` threads and every cell submits the
+    searches for all folds of a learner to one shared pool of ``n_jobs`` worker processes, which is created for the
+    call of :meth:`doubleml.DoubleML.tune` and shut down afterwards. The learners of a cell are tuned one after another
+    (the tuning of a learner may depend on the tuned parameters of another one) and every search (all candidates and
+    inner folds) is submitted as one job. If fewer searches than ``n_jobs`` run at the same time (e.g. a single cell
+    without ``tune_on_folds``), the remaining workers are passed to the ``n_jobs`` of the searches, which then fit
+    their candidates and inner folds in parallel; an ``n_jobs`` set via ``n_jobs_cv`` is kept. With ``n_jobs=1`` the
+    cells and searches are run one after another in the calling thread.
+    """
+
+    def __init__(self, n_jobs=None):
+        self._n_jobs = effective_n_jobs(n_jobs)
+        self._n_running_cells = 1
+        self._executor = None
+
+    @property
+    def n_jobs(self):
+        return self._n_jobs
+
+    def fit_searches(self, searches, x_list, y_list):
+        if self._executor is None:
+            return [_fit_search(search, x, y) for search, x, y in zip(searches, x_list, y_list)]
+        # every running cell submits the same number of searches (one per fold), such that the workers are split evenly
+        n_jobs_search = max(1, self._n_jobs // (self._n_running_cells * len(searches)))
+        for search in searches:
+            if search.n_jobs is None:
+                search.set_params(n_jobs=n_jobs_search)
+        futures = [self._executor.submit(_fit_search, search, x, y) for search, x, y in zip(searches, x_list, y_list)]
+        return [future.result() for future in futures]
+
+    def _run_cell(self, cell_fct, seed):
+        token = _tuning_context.set((self, np.random.default_rng(seed)))
+        try:
+            return cell_fct()
+        finally:
+            _tuning_context.reset(token)
+
+    def run_cells(self, cell_fcts, seeds):
+        if self._n_jobs == 1:
+            return [self._run_cell(cell_fct, seed) for cell_fct, seed in zip(cell_fcts, seeds)]
+
+        # a private pool, as loky's process-global executor is reused (and resized or shut down) by joblib's Parallel
+        self._executor = ProcessPoolExecutor(max_workers=self._n_jobs)
+        self._n_running_cells = min(len(cell_fcts), self._n_jobs)
+        try:
+            # the cells only submit the searches and wait for their results, such that n_jobs cells keep the pool busy
+            with ThreadPoolExecutor(max_workers=self._n_running_cells) as cell_executor:
+                cell_futures = [cell_executor.submit(self._run_cell, cell_fct, seed)
+                                for cell_fct, seed in zip(cell_fcts, seeds)]
+                res = [future.result() for future in cell_futures]
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._n_running_cells = 1
+        return res
@@ -0,0 +1,70 @@
+import numpy as np
+
+
+def binned_kde(u, weights, points=0.0, gridsize=1024):
+    """
+    Weighted gaussian kernel density estimation based on linear binning.
+
+    Can be passed as ``kde`` to :class:`doubleml.DoubleMLPQ`, :class:`doubleml.DoubleMLLPQ` and
+    :class:`doubleml.DoubleMLQTE`. The observations are linearly binned onto an equidistant grid, such that the density
+    is evaluated in :math:`O(n)` with the kernel only being evaluated at the ``gridsize`` grid points. As for the default
+    :py:class:`statsmodels.nonparametric.kde.KDEUnivariate`, a gaussian kernel and silverman's rule of thumb for the
+    bandwidth are used.
+
+    Parameters
+    ----------
+    u : :class:`numpy.ndarray`
+        Array of shape ``(n,)`` or ``(n, 1)`` with the observations.
+
+    weights : :class:`numpy.ndarray`
+        Array of shape ``(n,)`` with the weights of the observations.
+
+    points : float or array_like
+        The point(s) at which the density is evaluated. Evaluating several points (e.g. the densities at the estimated
+        quantiles of a grid of quantiles) only requires a single binning pass.
+        Default is ``0.0``.
+
+    gridsize : int
+        Number of grid points for the linear binning.
+        Default is ``1024``.
+
+    Returns
+    --------
+    dens : :class:`numpy.ndarray`
+        Array of shape ``(n_points,)`` with the estimated densities.
+    """
+    u = np.asarray(u, dtype=float).reshape(-1)
+    weights = np.asarray(weights, dtype=float).reshape(-1)
+    points = np.asarray(points, dtype=float).reshape(-1)
+
+    if u.shape != weights.shape:
+        raise ValueError('u and weights must contain the same number of observations. '
+                         f'Got {u.shape[0]} and {weights.shape[0]}.')
+    if not isinstance(gridsize, int):
+        raise TypeError('gridsize must be an integer. '
+                        f'{str(gridsize)} of type {str(type(gridsize))} was passed.')
+    if gridsize < 2:
+        raise ValueError(f'gridsize must be at least 2. {str(gridsize)} was passed.')
+
+    from statsmodels.nonparametric.bandwidths import bw_silverman
+    bw = bw_silverman(u)
+
+    # linear binning of the weights onto the grid
+    grid_min = u.min()
+    delta = (u.max() - grid_min) / (gridsize - 1)
+    if delta > 0:
+        pos = (u - grid_min) / delta
+        idx = np.minimum(pos.astype(np.intp), gridsize - 2)
+        frac = pos - idx
+    else:
+        idx = np.zeros(u.shape[0], dtype=np.intp)
+        frac = np.zeros(u.shape[0])
+    grid = grid_min + delta * np.arange(gridsize)
+    grid_weights = np.bincount(idx, weights=weights * (1.0 - frac), minlength=gridsize) + \
+        np.bincount(idx + 1, weights=weights * frac, minlength=gridsize)
+
+    z = (points.reshape(-1, 1) - grid.reshape(1, -1)) / bw
+    kernel_values = np.exp(-0.5 * np.square(z)) / np.sqrt(2 * np.pi)
+    dens = np.dot(kernel_values, grid_weights) / (np.sum(weights) * bw)
+
+    return dens
@@ -1,8 +1,55 @@
 import numpy as np
 
+from collections.abc import Sequence
+
 from sklearn.model_selection import KFold, RepeatedKFold, RepeatedStratifiedKFold
 
 
+def _fold_ids_dtype(n_folds):
+    if n_folds <= np.iinfo(np.int8).max:
+        return np.int8
+    return np.int16
+
+
+class _FoldIdSplits(Sequence):
+    # the (train, test) index pairs of one repetition, derived lazily from the fold assignment of the observations
+    def __init__(self, fold_ids, n_folds):
+        self._fold_ids = fold_ids
+        self._n_folds = n_folds
+
+    def __len__(self):
+        return self._n_folds
+
+    def __getitem__(self, i_fold):
+        if isinstance(i_fold, slice):
+            return [self[i] for i in range(*i_fold.indices(self._n_folds))]
+        if i_fold < 0:
+            i_fold += self._n_folds
+        if not 0 <= i_fold < self._n_folds:
+            raise IndexError('fold index out of range')
+        ind_test = self._fold_ids == i_fold
+        return np.flatnonzero(~ind_test), np.flatnonzero(ind_test)
+
+
+class _RepeatedFoldIdSplits(Sequence):
+    # compact representation of repeated sample splits via a (n_obs, n_rep) fold assignment matrix
+    def __init__(self, fold_ids, n_folds):
+        self._fold_ids = fold_ids
+        self._n_folds = n_folds
+
+    @property
+    def fold_ids(self):
+        return self._fold_ids
+
+    def __len__(self):
+        return self._fold_ids.shape[1]
+
+    def __getitem__(self, i_rep):
+        if isinstance(i_rep, slice):
+            return [self[i] for i in range(*i_rep.indices(len(self)))]
+        return _FoldIdSplits(self._fold_ids[:, i_rep], self._n_folds)
+
+
 class DoubleMLResampling:
     def __init__(self,
                  n_folds,
@@ -29,6 +76,16 @@ class DoubleMLResampling:
                  for i_repeat in range(self.n_rep)]
         return smpls
 
+    def split_fold_ids(self):
+        """
+        Draws the same sample splits as :meth:`split_samples` but returns them as a compact ``(n_obs, n_rep)`` integer
+        array with the test fold of every observation, which can be passed to ``set_sample_splitting``.
+        """
+        fold_ids = np.empty((self.n_obs, self.n_rep), dtype=_fold_ids_dtype(self.n_folds))
+        for i_split, (_, test) in enumerate(self.resampling.split(X=np.zeros(self.n_obs), y=self.stratify)):
+            fold_ids[test, i_split // self.n_folds] = i_split % self.n_folds
+        return fold_ids
+
 
 class DoubleMLClusterResampling:
     def __init__(self,
@@ -49,38 +106,59 @@ class DoubleMLClusterResampling:
         self.resampling = KFold(n_splits=n_folds, shuffle=True)
 
     def split_samples(self):
+        # factorize the cluster variables once; the folds of the observations are then derived by a lookup of the
+        # cluster codes in the fold assignment of the clusters
+        all_clusters = []
+        all_cluster_codes = []
+        for i_var in range(self.n_cluster_vars):
+            clusters, cluster_codes = np.unique(self.cluster_vars[:, i_var], return_inverse=True)
+            all_clusters.append(clusters)
+            all_cluster_codes.append(cluster_codes.reshape(-1))
+        # build the cartesian product
+        cart = np.array(np.meshgrid(*[np.arange(self.n_folds)
+                                      for i in range(self.n_cluster_vars)])).T.reshape(-1, self.n_cluster_vars)
+        # every combination of folds is identified by a code, such that the cell of an observation is a single integer
+        code_weights = self.n_folds ** np.arange(self.n_cluster_vars)
+        cart_codes = cart @ code_weights
+        n_cells = cart.shape[0]
+
         all_smpls = []
         all_smpls_cluster = []
         for _ in range(self.n_rep):
             smpls_cluster_vars = []
+            obs_folds = np.empty((self.n_obs, self.n_cluster_vars), dtype=np.intp)
             for i_var in range(self.n_cluster_vars):
-                this_cluster_var = self.cluster_vars[:, i_var]
-                clusters = np.unique(this_cluster_var)
+                clusters = all_clusters[i_var]
                 n_clusters = len(clusters)
-                smpls_cluster_vars.append([(clusters[train], clusters[test])
-                                           for train, test in self.resampling.split(np.zeros(n_clusters))])
+                cluster_folds = np.empty(n_clusters, dtype=np.intp)
+                this_smpls_cluster = []
+                for i_fold, (train, test) in enumerate(self.resampling.split(np.zeros(n_clusters))):
+                    cluster_folds[test] = i_fold
+                    this_smpls_cluster.append((clusters[train], clusters[test]))
+                smpls_cluster_vars.append(this_smpls_cluster)
+                obs_folds[:, i_var] = cluster_folds[all_cluster_codes[i_var]]
+
+            # the test sets are the groups of observations with the same cell code, which are obtained with a single
+            # (stable) sort, such that the indices of every test set are in ascending order
+            obs_codes = obs_folds @ code_weights
+            obs_order = np.argsort(obs_codes, kind='stable')
+            cell_offsets = np.concatenate(([0], np.cumsum(np.bincount(obs_codes, minlength=n_cells))))
+            # the training sets contain the observations which are for every cluster variable not in the fold of the
+            # cell; the masks are looked up per cluster variable and fold
+            not_in_fold = [[obs_folds[:, i_var] != i_fold for i_fold in range(self.n_folds)]
+                           for i_var in range(self.n_cluster_vars)]
 
             smpls = []
             smpls_cluster = []
-            # build the cartesian product
-            cart = np.array(np.meshgrid(*[np.arange(self.n_folds)
-                                          for i in range(self.n_cluster_vars)])).T.reshape(-1, self.n_cluster_vars)
-            for i_smpl in range(cart.shape[0]):
-                ind_train = np.full(self.n_obs, True)
-                ind_test = np.full(self.n_obs, True)
-                this_cluster_smpl_train = []
-                this_cluster_smpl_test = []
-                for i_var in range(self.n_cluster_vars):
-                    i_fold = cart[i_smpl, i_var]
-                    train_clusters = smpls_cluster_vars[i_var][i_fold][0]
-                    test_clusters = smpls_cluster_vars[i_var][i_fold][1]
-                    this_cluster_smpl_train.append(train_clusters)
-                    this_cluster_smpl_test.append(test_clusters)
-                    ind_train = ind_train & np.in1d(self.cluster_vars[:, i_var], train_clusters)
-                    ind_test = ind_test & np.in1d(self.cluster_vars[:, i_var], test_clusters)
-                train_set = np.arange(self.n_obs)[ind_train]
-                test_set = np.arange(self.n_obs)[ind_test]
-                smpls.append((train_set, test_set))
+            for i_smpl in range(n_cells):
+                ind_train = np.logical_and.reduce([not_in_fold[i_var][cart[i_smpl, i_var]]
+                                                   for i_var in range(self.n_cluster_vars)])
+                ind_test = obs_order[cell_offsets[cart_codes[i_smpl]]:cell_offsets[cart_codes[i_smpl] + 1]]
+                this_cluster_smpl_train = [smpls_cluster_vars[i_var][cart[i_smpl, i_var]][0]
+                                           for i_var in range(self.n_cluster_vars)]
+                this_cluster_smpl_test = [smpls_cluster_vars[i_var][cart[i_smpl, i_var]][1]
+                                          for i_var in range(self.n_cluster_vars)]
+                smpls.append((np.flatnonzero(ind_train), ind_test))
                 smpls_cluster.append((this_cluster_smpl_train, this_cluster_smpl_test))
             all_smpls.append(smpls)
             all_smpls_cluster.append(smpls_cluster)
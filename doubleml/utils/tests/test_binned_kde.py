@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+
+import doubleml as dml
+from doubleml.utils import binned_kde
+from doubleml.utils._estimation import _default_kde
+from doubleml.datasets import make_irm_data
+
+from sklearn.linear_model import LogisticRegression
+
+
+@pytest.fixture(scope='module',
+                params=[100, 1000])
+def n_obs(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def signed_weights(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def binned_kde_fixture(n_obs, signed_weights):
+    np.random.seed(3141)
+    u = np.random.normal(size=(n_obs, 1))
+    weights = np.random.binomial(1, 0.5, size=n_obs) / np.random.uniform(0.2, 0.8, size=n_obs)
+    if signed_weights:
+        weights = weights * np.random.choice([-1.0, 1.0], size=n_obs, p=[0.2, 0.8])
+    points = np.array([-0.5, 0.0, 0.25])
+
+    res_dict = {'dens_zero': binned_kde(u, weights),
+                'dens_zero_default': _default_kde(u, weights),
+                'dens_points': binned_kde(u, weights, points=points),
+                'dens_points_default': np.concatenate([_default_kde(u - point, weights) for point in points])}
+
+    return res_dict
+
+
+@pytest.mark.ci
+def test_binned_kde(binned_kde_fixture):
+    assert binned_kde_fixture['dens_zero'].shape == (1,)
+    assert np.allclose(binned_kde_fixture['dens_zero'], binned_kde_fixture['dens_zero_default'],
+                       rtol=1e-3, atol=1e-4)
+    assert binned_kde_fixture['dens_points'].shape == (3,)
+    assert np.allclose(binned_kde_fixture['dens_points'], binned_kde_fixture['dens_points_default'],
+                       rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_binned_kde_pq():
+    np.random.seed(3141)
+    obj_dml_data = make_irm_data(n_obs=500, dim_x=5)
+    kwargs = {'treatment': 1, 'quantile': 0.5, 'n_folds': 2}
+
+    np.random.seed(42)
+    dml_pq_obj = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), **kwargs)
+    dml_pq_obj.fit()
+
+    np.random.seed(42)
+    dml_pq_obj_binned = dml.DoubleMLPQ(obj_dml_data, LogisticRegression(), LogisticRegression(), kde=binned_kde, **kwargs)
+    dml_pq_obj_binned.fit()
+
+    assert np.allclose(dml_pq_obj.coef, dml_pq_obj_binned.coef, rtol=1e-9, atol=1e-4)
+    assert np.allclose(dml_pq_obj.se, dml_pq_obj_binned.se, rtol=1e-3, atol=1e-4)
+
+
+@pytest.mark.ci
+def test_binned_kde_exceptions():
+    u = np.zeros(10)
+    weights = np.ones(10)
+
+    msg = 'u and weights must contain the same number of observations. Got 10 and 9.'
+    with pytest.raises(ValueError, match=msg):
+        _ = binned_kde(u, weights[:9])
+    msg = "gridsize must be an integer. 100.0 of type <class 'float'> was passed."
+    with pytest.raises(TypeError, match=msg):
+        _ = binned_kde(u, weights, gridsize=100.0)
+    msg = 'gridsize must be at least 2. 1 was passed.'
+    with pytest.raises(ValueError, match=msg):
+        _ = binned_kde(u, weights, gridsize=1)
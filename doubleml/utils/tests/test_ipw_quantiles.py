@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+
+from doubleml.utils._estimation import _solve_ipw_quantiles, _solve_ipw_quantile
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def signed_weights(request):
+    return request.param
+
+
+@pytest.fixture(scope='module',
+                params=[True, False])
+def with_ties(request):
+    return request.param
+
+
+@pytest.fixture(scope='module')
+def ipw_quantiles_fixture(signed_weights, with_ties):
+    np.random.seed(3141)
+    n_obs = 300
+    y = np.random.normal(size=n_obs)
+    if with_ties:
+        y = np.round(y, 1)
+    weights = np.random.uniform(0.5, 3.0, size=n_obs) * np.random.binomial(1, 0.5, size=n_obs)
+    if signed_weights:
+        weights = weights * np.random.choice([-1.0, 1.0], size=n_obs, p=[0.2, 0.8])
+    quantiles = np.array([0.05, 0.1, 0.25, 0.5, 0.75, 0.9])
+
+    ipw_est = _solve_ipw_quantiles(y, weights, quantiles)
+
+    # evaluate the ipw score for all candidates
+    candidates = np.unique(y)
+    ipw_est_manual = np.full_like(quantiles, np.nan)
+    for i_quant, quantile in enumerate(quantiles):
+        ipw_scores = np.array([np.mean(weights * (y <= theta)) - quantile for theta in candidates])
+        ipw_est_manual[i_quant] = candidates[np.argmin(np.abs(ipw_scores))]
+
+    ipw_est_single = np.array([_solve_ipw_quantiles(y, weights, quantile)[0] for quantile in quantiles])
+
+    return {'ipw_est': ipw_est,
+            'ipw_est_manual': ipw_est_manual,
+            'ipw_est_single': ipw_est_single}
+
+
+@pytest.mark.ci
+def test_ipw_quantiles(ipw_quantiles_fixture):
+    assert np.array_equal(ipw_quantiles_fixture['ipw_est'], ipw_quantiles_fixture['ipw_est_manual'])
+    assert np.array_equal(ipw_quantiles_fixture['ipw_est'], ipw_quantiles_fixture['ipw_est_single'])
+
+
+@pytest.mark.ci
+def test_ipw_quantiles_brent_reference():
+    # the exact solution is never worse than the default Brent search of the absolute score
+    np.random.seed(3141)
+    n_obs = 500
+    quantiles = np.array([0.25, 0.5, 0.75])
+    for _ in range(10):
+        y = np.random.normal(size=n_obs)
+        d = np.random.binomial(1, 0.5, size=n_obs)
+        weights = d / np.random.uniform(0.2, 0.8, size=n_obs)
+        ipw_est = _solve_ipw_quantiles(y, weights, quantiles)
+        for i_quant, quantile in enumerate(quantiles):
+            def ipw_score(theta):
+                return np.mean(weights * (y <= theta)) - quantile
+
+            coef_start = np.quantile(y[d == 1], quantile)
+            ipw_est_brent = _solve_ipw_quantile(y, weights, quantile, 'brent', coef_start, (y.min(), y.max()))
+            ipw_est_exact = _solve_ipw_quantile(y, weights, quantile, 'exact', coef_start, (y.min(), y.max()))
+            assert ipw_est_exact == ipw_est[i_quant]
+            assert np.abs(ipw_score(ipw_est[i_quant])) <= np.abs(ipw_score(ipw_est_brent)) + 1e-12
@@ -2,6 +2,7 @@ import pytest
 import numpy as np
 
 from doubleml.utils._estimation import _var_est, _aggregate_coefs_and_ses
+from doubleml.utils.resampling import DoubleMLClusterResampling
 
 
 @pytest.fixture(scope='module',
@@ -101,3 +102,43 @@ def test_aggregate_se(test_var_est_and_aggr_fixture):
         test_var_est_and_aggr_fixture['se_2'],
         test_var_est_and_aggr_fixture['expected_se']
     )
+
+
+@pytest.fixture(scope='module',
+                params=[0, 1, 2])
+def n_cluster_vars(request):
+    return request.param
+
+
+@pytest.mark.ci
+def test_var_est_vectorized(n_cluster_vars):
+    np.random.seed(3141)
+    n_obs = 200
+    n_folds = 3
+    psi = np.random.normal(size=(n_obs, 4, 2))
+    psi_deriv = np.random.uniform(0.5, 1.5, size=(n_obs, 4, 2))
+
+    if n_cluster_vars == 0:
+        var_est_args = {'smpls': None,
+                        'is_cluster_data': False}
+    else:
+        cluster_vars = np.random.randint(0, 10, size=(n_obs, n_cluster_vars))
+        resampling = DoubleMLClusterResampling(n_folds=n_folds, n_rep=1, n_obs=n_obs,
+                                               n_cluster_vars=n_cluster_vars, cluster_vars=cluster_vars)
+        smpls, smpls_cluster = resampling.split_samples()
+        var_est_args = {'smpls': smpls[0],
+                        'is_cluster_data': True,
+                        'cluster_vars': cluster_vars,
+                        'smpls_cluster': smpls_cluster[0],
+                        'n_folds_per_cluster': n_folds}
+
+    var_estimates, var_scaling_factor = _var_est(psi=psi, psi_deriv=psi_deriv, **var_est_args)
+    assert var_estimates.shape == (4, 2)
+    for i_coef in range(4):
+        for i_rep in range(2):
+            var_estimate, var_scaling_factor_single = _var_est(psi=psi[:, i_coef, i_rep],
+                                                               psi_deriv=psi_deriv[:, i_coef, i_rep],
+                                                               **var_est_args)
+            # the vectorized estimation has to coincide exactly with the estimation for single scores
+            assert var_estimates[i_coef, i_rep] == var_estimate
+            assert var_scaling_factor == var_scaling_factor_single
@@ -20,9 +20,9 @@ setup(
     long_description_content_type='text/markdown',
     url='https://docs.doubleml.org',
     project_urls=PROJECT_URLS,
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=[
-        'joblib',
+        'joblib>=1.4',
         'numpy',
         'pandas',
         'scipy',